@@ -8,6 +8,8 @@ from src.models.user import User
 from src.models.profile import Profile
 from src.models.action import UserAction
 from src.models.match import Match
+from src.models.broadcast import BroadcastJob
+from src.models.outbox import OutboxEvent
 
 from src.core.config import settings
 
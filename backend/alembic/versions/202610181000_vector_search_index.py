@@ -0,0 +1,34 @@
+"""Vector search index
+
+Revision ID: 41fc481fd578
+Revises: 61ce5491813d
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '41fc481fd578'
+down_revision: Union[str, Sequence[str], None] = '61ce5491813d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EMBEDDING_INDEX_NAME = 'idx_profiles_embedding'
+EMBEDDING_INDEX_OPTIONS = {
+    'postgresql_using': 'hnsw',
+    'postgresql_ops': {'embedding': 'vector_cosine_ops'},
+    'postgresql_with': {'m': 16, 'ef_construction': 64},
+}
+
+
+def upgrade() -> None:
+    op.execute(f"DROP INDEX IF EXISTS {EMBEDDING_INDEX_NAME}")
+
+    with op.batch_alter_table('profiles', schema=None) as batch_op:
+        batch_op.create_index(EMBEDDING_INDEX_NAME, ['embedding'], unique=False, **EMBEDDING_INDEX_OPTIONS)
+
+def downgrade() -> None:
+    with op.batch_alter_table('profiles', schema=None) as batch_op:
+        batch_op.drop_index(EMBEDDING_INDEX_NAME)
@@ -0,0 +1,62 @@
+"""Broadcast jobs
+
+Revision ID: d31993365603
+Revises: 41fc481fd578
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = 'd31993365603'
+down_revision: Union[str, Sequence[str], None] = '41fc481fd578'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        DO $$ BEGIN
+            CREATE TYPE broadcast_status_enum AS ENUM ('pending', 'running', 'completed', 'failed');
+        EXCEPTION
+            WHEN duplicate_object THEN null;
+        END $$;
+    """)
+
+    op.create_table('broadcast_jobs',
+        sa.Column('admin_id', sa.Integer(), nullable=True),
+        sa.Column('admin_chat_id', sa.String(length=50), nullable=False),
+        sa.Column('message_text', sa.Text(), nullable=False),
+        sa.Column('status', postgresql.ENUM('pending', 'running', 'completed', 'failed', name='broadcast_status_enum', create_type=False), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('last_user_id', sa.Integer(), nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False),
+        sa.Column('sent', sa.Integer(), nullable=False),
+        sa.Column('failed', sa.Integer(), nullable=False),
+        sa.Column('blocked', sa.Integer(), nullable=False),
+        sa.Column('retried', sa.Integer(), nullable=False),
+        sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['admin_id'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('broadcast_jobs', schema=None) as batch_op:
+        batch_op.create_index('idx_broadcast_jobs_status', ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_broadcast_jobs_id'), ['id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('broadcast_jobs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_broadcast_jobs_id'))
+        batch_op.drop_index('idx_broadcast_jobs_status')
+    op.drop_table('broadcast_jobs')
+
+    op.execute("DROP TYPE IF EXISTS broadcast_status_enum")
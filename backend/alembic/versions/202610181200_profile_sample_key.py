@@ -0,0 +1,27 @@
+"""Profile sample key
+
+Revision ID: 7c4e2a9b1f30
+Revises: d31993365603
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '7c4e2a9b1f30'
+down_revision: Union[str, Sequence[str], None] = 'd31993365603'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('profiles', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('sample_key', sa.Float(), server_default=sa.text('random()'), nullable=False))
+        batch_op.create_index('idx_profiles_sample_key', ['sample_key'], unique=False, postgresql_where=sa.text('is_active'))
+
+def downgrade() -> None:
+    with op.batch_alter_table('profiles', schema=None) as batch_op:
+        batch_op.drop_index('idx_profiles_sample_key', postgresql_where=sa.text('is_active'))
+        batch_op.drop_column('sample_key')
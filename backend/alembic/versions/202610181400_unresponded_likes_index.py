@@ -0,0 +1,30 @@
+"""Unresponded likes index
+
+Revision ID: 9a1e5c7d3b42
+Revises: 3f8d6b2c4a17
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '9a1e5c7d3b42'
+down_revision: Union[str, Sequence[str], None] = '3f8d6b2c4a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('user_actions', schema=None) as batch_op:
+        batch_op.create_index(
+            'idx_actions_unresponded_likes',
+            ['to_user_id', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_where=sa.text("action_type = 'like' AND NOT is_responded")
+        )
+
+def downgrade() -> None:
+    with op.batch_alter_table('user_actions', schema=None) as batch_op:
+        batch_op.drop_index('idx_actions_unresponded_likes', postgresql_where=sa.text("action_type = 'like' AND NOT is_responded"))
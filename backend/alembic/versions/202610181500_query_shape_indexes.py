@@ -0,0 +1,82 @@
+"""Query shape indexes
+
+Revision ID: 5b7f2d9e8c61
+Revises: 9a1e5c7d3b42
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '5b7f2d9e8c61'
+down_revision: Union[str, Sequence[str], None] = '9a1e5c7d3b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EMBEDDING_INDEX_NAME = 'idx_profiles_embedding'
+EMBEDDING_INDEX_OPTIONS = {
+    'postgresql_using': 'hnsw',
+    'postgresql_ops': {'embedding': 'vector_cosine_ops'},
+    'postgresql_with': {'m': 16, 'ef_construction': 64},
+}
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index('idx_users_telegram_id', ['telegram_id'], unique=True, postgresql_include=['id', 'is_banned'])
+        batch_op.drop_index('ix_users_telegram_id')
+        batch_op.drop_index('ix_users_id')
+
+    with op.batch_alter_table('user_actions', schema=None) as batch_op:
+        batch_op.create_index('idx_actions_pair', ['from_user_id', 'to_user_id'], unique=False)
+        batch_op.drop_index('idx_actions_from_user')
+        batch_op.drop_index('idx_actions_type')
+        batch_op.drop_index('idx_actions_incoming')
+        batch_op.drop_index('ix_user_actions_id')
+
+    with op.batch_alter_table('profiles', schema=None) as batch_op:
+        batch_op.drop_index(EMBEDDING_INDEX_NAME)
+        batch_op.create_index(EMBEDDING_INDEX_NAME, ['embedding'], unique=False, postgresql_where=sa.text('is_active'), **EMBEDDING_INDEX_OPTIONS)
+        batch_op.drop_index('idx_profiles_active')
+        batch_op.drop_index('idx_profiles_gender')
+        batch_op.drop_index('ix_profiles_id')
+
+    with op.batch_alter_table('matches', schema=None) as batch_op:
+        batch_op.drop_index('ix_matches_id')
+
+    with op.batch_alter_table('broadcast_jobs', schema=None) as batch_op:
+        batch_op.drop_index('ix_broadcast_jobs_id')
+
+    with op.batch_alter_table('outbox_events', schema=None) as batch_op:
+        batch_op.drop_index('ix_outbox_events_id')
+
+def downgrade() -> None:
+    with op.batch_alter_table('outbox_events', schema=None) as batch_op:
+        batch_op.create_index('ix_outbox_events_id', ['id'], unique=False)
+
+    with op.batch_alter_table('broadcast_jobs', schema=None) as batch_op:
+        batch_op.create_index('ix_broadcast_jobs_id', ['id'], unique=False)
+
+    with op.batch_alter_table('matches', schema=None) as batch_op:
+        batch_op.create_index('ix_matches_id', ['id'], unique=False)
+
+    with op.batch_alter_table('profiles', schema=None) as batch_op:
+        batch_op.create_index('ix_profiles_id', ['id'], unique=False)
+        batch_op.create_index('idx_profiles_gender', ['gender'], unique=False)
+        batch_op.create_index('idx_profiles_active', ['is_active'], unique=False)
+        batch_op.drop_index(EMBEDDING_INDEX_NAME)
+        batch_op.create_index(EMBEDDING_INDEX_NAME, ['embedding'], unique=False, **EMBEDDING_INDEX_OPTIONS)
+
+    with op.batch_alter_table('user_actions', schema=None) as batch_op:
+        batch_op.create_index('ix_user_actions_id', ['id'], unique=False)
+        batch_op.create_index('idx_actions_incoming', ['to_user_id', 'is_responded', 'action_type'], unique=False)
+        batch_op.create_index('idx_actions_type', ['action_type'], unique=False)
+        batch_op.create_index('idx_actions_from_user', ['from_user_id'], unique=False)
+        batch_op.drop_index('idx_actions_pair')
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index('ix_users_id', ['id'], unique=False)
+        batch_op.create_index('ix_users_telegram_id', ['telegram_id'], unique=True)
+        batch_op.drop_index('idx_users_telegram_id')
@@ -0,0 +1,26 @@
+"""Broadcast job backoff
+
+Revision ID: e4a7c2d9f813
+Revises: 5b7f2d9e8c61
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'e4a7c2d9f813'
+down_revision: Union[str, Sequence[str], None] = '5b7f2d9e8c61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('broadcast_jobs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('available_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('broadcast_jobs', schema=None) as batch_op:
+        batch_op.drop_column('available_at')
@@ -0,0 +1,41 @@
+"""Require pgvector 0.8
+
+Revision ID: 7c3e9a1f5d24
+Revises: e4a7c2d9f813
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '7c3e9a1f5d24'
+down_revision: Union[str, Sequence[str], None] = 'e4a7c2d9f813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MIN_VERSION = (0, 8, 0)
+
+
+def _installed_version() -> tuple[int, ...]:
+    version = op.get_bind().execute(
+        sa.text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+    ).scalar()
+    return tuple(int(part) for part in version.split('.'))
+
+
+def upgrade() -> None:
+    if _installed_version() < MIN_VERSION:
+        op.execute("ALTER EXTENSION vector UPDATE")
+
+    installed = _installed_version()
+    if installed < MIN_VERSION:
+        raise RuntimeError(
+            f"pgvector {'.'.join(map(str, MIN_VERSION))} or newer is required for hnsw.iterative_scan, "
+            f"found {'.'.join(map(str, installed))}"
+        )
+
+
+def downgrade() -> None:
+    pass
@@ -37,4 +37,8 @@ cat > $dirname/config.json << 'EOF'
   "use_cache": true,
   "vocab_size": 250037
 }
-EOF
\ No newline at end of file
+EOF
+
+if [ "$QUANTIZE" = "1" ]; then
+  python -m src.scripts.quantize_model --cache-dir $dirname
+fi
@@ -1,7 +1,12 @@
-from fastapi import APIRouter, BackgroundTasks, status
+from typing import Optional
+from fastapi import APIRouter, Query, status
 from fastapi.responses import StreamingResponse
 
 from src.core.deps import AdminDep, AdminServiceDep
+from src.schemas.broadcast import BroadcastJobResponse
+from src.schemas.embedding import EmbeddingMetricsResponse
+from src.services.embedding import embedding_service
+from src.services.export import EXPORT_FORMATS, ExportFormat
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
@@ -9,16 +14,27 @@ router = APIRouter(prefix="/admin", tags=["Admin"])
 async def export_profiles(
     admin: AdminDep,
     admin_service: AdminServiceDep,
+    export_format: ExportFormat = Query("csv", alias="format"),
+    include_embedding: bool = False,
+    is_active: Optional[bool] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    after_id: int = Query(0, ge=0),
 ):
-    csv_content = await admin_service.export_profiles_to_csv(
-        admin
+    chunks = await admin_service.export_profiles(
+        admin,
+        export_format=export_format,
+        include_embedding=include_embedding,
+        limit=limit,
+        after_id=after_id,
+        is_active=is_active
     )
+    media_type, extension, _ = EXPORT_FORMATS[export_format]
 
     return StreamingResponse(
-        iter([csv_content.encode('utf-8-sig')]),
-        media_type="text/csv",
+        chunks,
+        media_type=media_type,
         headers={
-            "Content-Disposition": "attachment; filename=profiles.csv",
+            "Content-Disposition": f"attachment; filename=profiles.{extension}",
             "Cache-Control": "no-cache",
         }
     )
@@ -26,22 +42,43 @@ async def export_profiles(
 
 @router.post(
     "/broadcasts",
-    status_code=status.HTTP_204_NO_CONTENT
+    response_model=BroadcastJobResponse,
+    status_code=status.HTTP_202_ACCEPTED
 )
 async def start_broadcast(
     admin: AdminDep,
     admin_service: AdminServiceDep,
     message_text: str,
-    background_tasks: BackgroundTasks,
 ):
-    background_tasks.add_task(
-        admin_service.run_broadcast_task,
+    return await admin_service.create_broadcast(
         admin,
         admin.telegram_id,
         message_text
     )
 
 
+@router.get(
+    "/broadcasts/{job_id}",
+    response_model=BroadcastJobResponse
+)
+async def get_broadcast(
+    admin: AdminDep,
+    job_id: int,
+    admin_service: AdminServiceDep,
+):
+    return await admin_service.get_broadcast(admin, job_id)
+
+
+@router.get(
+    "/metrics/embedding",
+    response_model=EmbeddingMetricsResponse
+)
+async def get_embedding_metrics(
+    admin: AdminDep,
+):
+    return embedding_service.metrics()
+
+
 @router.post(
     "/ban/user/{user_id}",
     status_code=status.HTTP_204_NO_CONTENT
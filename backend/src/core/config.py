@@ -1,3 +1,5 @@
+from typing import Literal
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -8,7 +10,56 @@ class Settings(BaseSettings):
     TELEGRAM_BOT_TOKEN: str
     ADMIN_TELEGRAM_ID: str
 
+    TELEGRAM_API_URL: str = "https://api.telegram.org"
+    TELEGRAM_HTTP2: bool = True
+    TELEGRAM_MAX_CONNECTIONS: int = 100
+    TELEGRAM_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    TELEGRAM_KEEPALIVE_EXPIRY: float = 30.0
+
+    BROADCAST_CONCURRENCY: int = 20
+    BROADCAST_RATE_PER_SECOND: float = 28.0
+    BROADCAST_PER_CHAT_INTERVAL: float = 1.0
+    BROADCAST_MAX_RETRIES: int = 3
+    BROADCAST_PROGRESS_EVERY: int = 1000
+    BROADCAST_BATCH_SIZE: int = 500
+    BROADCAST_POLL_INTERVAL: float = 2.0
+    BROADCAST_HEARTBEAT_SECONDS: float = 15.0
+    BROADCAST_STALE_AFTER_SECONDS: float = 120.0
+    BROADCAST_MAX_ATTEMPTS: int = 5
+    BROADCAST_RETRY_BACKOFF_SECONDS: float = 30.0
+    BROADCAST_RETRY_BACKOFF_MAX_SECONDS: float = 900.0
+
+    EXPORT_BATCH_SIZE: int = 1000
+
     REDIS_URL: str
+    AUTH_CACHE_TTL: int = 30
+
+    FEED_LOW_WATERMARK: int = 5
+    FEED_MIN_TOP_UP: int = 10
+    FEED_STREAM_MAXLEN: int = 100000
+    FEED_CONSUMER_GROUP: str = "feed-builders"
+    FEED_READ_COUNT: int = 100
+    FEED_BLOCK_MS: int = 5000
+    FEED_CONCURRENCY: int = 8
+    FEED_ACTIVE_WINDOW_SECONDS: int = 900
+    FEED_SWEEP_INTERVAL: float = 30.0
+    FEED_SWEEP_LIMIT: int = 500
+
+    SWIPE_PREFETCH_MIN: int = 15
+    SWIPE_PREFETCH_MAX: int = 50
+    SWIPE_PREFETCH_HORIZON: float = 60.0
+    SWIPE_RATE_ALPHA: float = 0.3
+    SWIPE_SESSION_GAP_SECONDS: int = 300
+    SWIPE_EXPLORATION_RATIO: float = 0.2
+
+    OUTBOX_BATCH_SIZE: int = 200
+    OUTBOX_POLL_INTERVAL: float = 0.5
+    OUTBOX_LEASE_SECONDS: int = 60
+    OUTBOX_MAX_ATTEMPTS: int = 5
+    NOTIFICATION_CONCURRENCY: int = 10
+    NOTIFICATION_RATE_PER_SECOND: float = 25.0
+    NOTIFICATION_LIKE_DIGEST_WINDOW: int = 300
+    NOTIFICATION_DIGEST_BATCH_SIZE: int = 200
 
     CREATE_SEED_DATA: bool = False
 
@@ -17,7 +68,28 @@ class Settings(BaseSettings):
     LOG_FILE_PATH: str = "./logs/app.log"
     LOG_ROTATE_MB: int = 10
     LOG_BACKUP_COUNT: int = 5
+
+    VECTOR_HNSW_EF_SEARCH: int = 40
+    VECTOR_ITERATIVE_SCAN: Literal["off", "relaxed_order", "strict_order"] = "relaxed_order"
+    VECTOR_IVFFLAT_PROBES: int = 10
+
+    EMBEDDING_EXECUTOR: Literal["thread", "process"] = "thread"
+    EMBEDDING_WORKERS: int = 1
+    EMBEDDING_INTRA_OP_THREADS: int = 0
+    EMBEDDING_INTER_OP_THREADS: int = 0
+    EMBEDDING_MAX_BATCH_SIZE: int = 16
+    EMBEDDING_BATCH_WAIT_MS: float = 5.0
+    EMBEDDING_MODEL_VERSION: str = "paraphrase-multilingual-MiniLM-L12-v2"
+    EMBEDDING_QUANTIZED: bool = False
+    EMBEDDING_WARMUP: bool = True
+    EMBEDDING_CACHE_OPTIMIZED_MODEL: bool = True
     
+    @model_validator(mode="after")
+    def check_feed_hysteresis(self):
+        if self.SWIPE_PREFETCH_MIN < self.FEED_LOW_WATERMARK + self.FEED_MIN_TOP_UP:
+            raise ValueError("SWIPE_PREFETCH_MIN must be at least FEED_LOW_WATERMARK + FEED_MIN_TOP_UP")
+        return self
+
     @property
     def POSTGRES_DSN(self):
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@db:5432/{self.POSTGRES_DB}"
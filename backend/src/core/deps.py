@@ -1,9 +1,9 @@
 import secrets
+from dataclasses import dataclass
 from fastapi import Depends, Request
-from typing import Annotated
+from typing import Annotated, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import exists, select
 
 from src.core.exceptions.user import UserIsBanned, UserIsUnauthorized
 from src.core.exceptions.admin import InvalidPermissions
@@ -14,6 +14,7 @@ from src.models.profile import Profile
 from src.db.session import get_db
 from src.services.user import UserService
 from src.services.profile import ProfileService
+from src.services.cache import cache
 from src.core.config import settings
 
 async def get_user_service(
@@ -41,21 +42,56 @@ ProfileServiceDep = Annotated[ProfileService, Depends(get_profile_service)]
 ActionServiceDep = Annotated[ActionService, Depends(get_action_service)]
 AdminServiceDep = Annotated[AdminService, Depends(get_admin_service)]
 
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    id: int
+    telegram_id: str
+    is_banned: bool
+    has_active_profile: bool
+
+async def _load_auth(db: AsyncSession, telegram_id: str) -> Optional[AuthenticatedUser]:
+    cached = await cache.get_auth(telegram_id)
+    if cached is not None:
+        return AuthenticatedUser(
+            id=cached['user_id'],
+            telegram_id=telegram_id,
+            is_banned=cached['is_banned'],
+            has_active_profile=cached['has_active_profile']
+        )
+    
+    has_active_profile = (
+        exists()
+        .where(Profile.user_id == User.id)
+        .where(Profile.is_active == True)
+    )
+    result = await db.execute(
+        select(User.id, User.is_banned, has_active_profile.label("has_active_profile"))
+        .where(User.telegram_id == telegram_id)
+    )
+    row = result.one_or_none()
+
+    if not row:
+        return None
+    
+    await cache.set_auth(telegram_id, row.id, row.is_banned, row.has_active_profile)
+    
+    return AuthenticatedUser(
+        id=row.id,
+        telegram_id=telegram_id,
+        is_banned=row.is_banned,
+        has_active_profile=row.has_active_profile
+    )
+
 async def get_current_user(
     request: Request,
     db: Annotated[AsyncSession, Depends(get_db)]
-) -> User:
+) -> AuthenticatedUser:
     telegram_id = request.headers.get("X-Telegram-ID")
     
     if not telegram_id:
         raise UserIsUnauthorized()
     
-    result = await db.execute(
-        select(User)
-        .where(User.telegram_id == telegram_id)
-        .options(selectinload(User.profile))
-    )
-    user = result.scalar_one_or_none()
+    user = await _load_auth(db, telegram_id)
 
     if not user:
         raise UserIsUnauthorized()
@@ -65,25 +101,17 @@ async def get_current_user(
     
     return user
 
-CurrentUserDep = Annotated[User, Depends(get_current_user)]
+CurrentUserDep = Annotated[AuthenticatedUser, Depends(get_current_user)]
 
 async def get_user_with_active_profile(
-    db: Annotated[AsyncSession, Depends(get_db)],
     user: CurrentUserDep,
 ):
-    result = await db.execute(
-        select(Profile)
-        .where(Profile.user_id == user.id)
-        .where(Profile.is_active == True)
-    )
-    active_profile = result.scalar_one_or_none()
-
-    if not active_profile:
+    if not user.has_active_profile:
         raise UserIsUnauthorized()
     
     return user
 
-UserWithActiveProfileDep = Annotated[User, Depends(get_user_with_active_profile)]
+UserWithActiveProfileDep = Annotated[AuthenticatedUser, Depends(get_user_with_active_profile)]
 
 async def get_admin_user(
     user: CurrentUserDep,
@@ -93,4 +121,4 @@ async def get_admin_user(
     
     raise InvalidPermissions()
 
-AdminDep = Annotated[User, Depends(get_admin_user)]
\ No newline at end of file
+AdminDep = Annotated[AuthenticatedUser, Depends(get_admin_user)]
\ No newline at end of file
@@ -1,5 +1,13 @@
-from src.core.exceptions.base import ForbiddenException
+from src.core.exceptions.base import ForbiddenException, NotFoundException, ValidationException
 
 class InvalidPermissions(ForbiddenException):
     def __init__(self):
         super().__init__("Not enought rights")
+
+class BroadcastJobNotFound(NotFoundException):
+    def __init__(self, job_id: int):
+        super().__init__(f"Broadcast job with id {job_id} not found", "BROADCAST_JOB_NOT_FOUND")
+
+class UnsupportedExportOption(ValidationException):
+    def __init__(self, message: str):
+        super().__init__(message, "UNSUPPORTED_EXPORT_OPTION")
@@ -2,12 +2,18 @@ from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from src.scripts.seed_data import seed_on_startup
 from src.services.cache import cache
+from src.services.embedding import embedding_service
+from src.services.telegram import telegram_service
 from src.core.config import settings
 from src.core.logger import stop_logging, init_logging
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     init_logging()
+    await telegram_service.start()
+
+    if settings.EMBEDDING_WARMUP:
+        await embedding_service.warm_up()
 
     if settings.CREATE_SEED_DATA:
         await seed_on_startup()
@@ -15,4 +21,6 @@ async def lifespan(app: FastAPI):
     yield
 
     await cache.close()
+    await telegram_service.close()
+    embedding_service.close()
     stop_logging()
\ No newline at end of file
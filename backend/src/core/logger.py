@@ -249,4 +249,8 @@ def get_repo_logger() -> logging.Logger:
     return get_logger("repository")
 
 def get_cache_logger() -> logging.Logger:
-    return get_logger("cache")
\ No newline at end of file
+    return get_logger("cache")
+
+
+def get_worker_logger() -> logging.Logger:
+    return get_logger("worker")
@@ -0,0 +1,5 @@
+from pathlib import Path
+
+MODEL_CACHE_DIR = Path('/app/model_cache')
+MODEL_FILE = "model.onnx"
+QUANTIZED_MODEL_FILE = "model_int8.onnx"
@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Awaitable, Callable
 
 from src.core.config import settings
 
@@ -20,13 +21,25 @@ async_session_maker = async_sessionmaker(
     autoflush=False
 )
 
+AFTER_COMMIT_KEY = "after_commit"
+
+def after_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]):
+    session.info.setdefault(AFTER_COMMIT_KEY, []).append(callback)
+
+async def run_after_commit(session: AsyncSession):
+    for callback in session.info.pop(AFTER_COMMIT_KEY, []):
+        await callback()
+
 async def get_db() -> AsyncSession:
     async with async_session_maker() as session:
         try:
             yield session
             await session.commit()
         except Exception:
+            session.info.pop(AFTER_COMMIT_KEY, None)
             await session.rollback()
             raise
+        else:
+            await run_after_commit(session)
         finally:
             await session.close()
\ No newline at end of file
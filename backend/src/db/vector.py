@@ -0,0 +1,63 @@
+from sqlalchemy import Index, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+
+EMBEDDING_INDEX_NAME = "idx_profiles_embedding"
+
+VECTOR_OPCLASSES = {
+    "cosine": "vector_cosine_ops",
+    "l2": "vector_l2_ops",
+    "inner_product": "vector_ip_ops",
+}
+
+VECTOR_DISTANCE_METHODS = {
+    "cosine": "cosine_distance",
+    "l2": "l2_distance",
+    "inner_product": "max_inner_product",
+}
+
+EMBEDDING_INDEX_TYPE = "hnsw"
+EMBEDDING_DISTANCE = "cosine"
+EMBEDDING_INDEX_PARAMS = {"m": 16, "ef_construction": 64}
+
+
+def embedding_index_options() -> dict:
+    return {
+        "postgresql_using": EMBEDDING_INDEX_TYPE,
+        "postgresql_ops": {"embedding": VECTOR_OPCLASSES[EMBEDDING_DISTANCE]},
+        "postgresql_with": dict(EMBEDDING_INDEX_PARAMS),
+    }
+
+
+def embedding_index() -> Index:
+    return Index(
+        EMBEDDING_INDEX_NAME,
+        "embedding",
+        postgresql_where=text("is_active"),
+        **embedding_index_options()
+    )
+
+
+def embedding_distance(column, embedding: list[float]):
+    return getattr(column, VECTOR_DISTANCE_METHODS[EMBEDDING_DISTANCE])(embedding)
+
+
+def search_settings(limit: int = 0) -> dict[str, str]:
+    if EMBEDDING_INDEX_TYPE == "hnsw":
+        return {
+            "hnsw.ef_search": str(max(settings.VECTOR_HNSW_EF_SEARCH, limit)),
+            "hnsw.iterative_scan": settings.VECTOR_ITERATIVE_SCAN,
+        }
+    return {
+        "ivfflat.probes": str(settings.VECTOR_IVFFLAT_PROBES),
+        "ivfflat.iterative_scan": "off" if settings.VECTOR_ITERATIVE_SCAN == "off" else "relaxed_order",
+    }
+
+
+async def apply_search_settings(session: AsyncSession, limit: int = 0) -> None:
+    params = [
+        func.set_config(name, value, True)
+        for name, value in search_settings(limit).items()
+    ]
+    await session.execute(select(*params))
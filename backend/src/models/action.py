@@ -4,7 +4,8 @@ from sqlalchemy import (
     CheckConstraint,
     Index,
     Integer,
-    Boolean
+    Boolean,
+    text
 )
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import ENUM
@@ -38,10 +39,14 @@ class UserAction(BaseModel):
 
     __table_args__ = (
         CheckConstraint("from_user_id != to_user_id", name="chk_actions_not_self"),
-        Index("idx_actions_from_user", "from_user_id"),
+        Index("idx_actions_pair", "from_user_id", "to_user_id"),
         Index("idx_actions_to_user", "to_user_id"),
-        Index("idx_actions_type", "action_type"),
-        Index("idx_actions_incoming", "to_user_id", "is_responded", "action_type"),
+        Index(
+            "idx_actions_unresponded_likes",
+            "to_user_id",
+            text("created_at DESC"),
+            postgresql_where=text("action_type = 'like' AND NOT is_responded")
+        ),
     )
 
     def __repr__(self):
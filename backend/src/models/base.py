@@ -23,6 +23,5 @@ class BaseModel(Base, TimestampMixin):
     id: Mapped[int] = mapped_column(
         Integer, 
         primary_key=True, 
-        autoincrement=True, 
-        index=True
+        autoincrement=True
     )
\ No newline at end of file
@@ -0,0 +1,69 @@
+from datetime import datetime
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func
+)
+from sqlalchemy.orm import relationship, Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import ENUM
+import enum
+
+from src.models.base import BaseModel
+
+
+class BroadcastStatusEnum(str, enum.Enum):
+    pending = "pending"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+
+
+class BroadcastJob(BaseModel):
+    __tablename__ = "broadcast_jobs"
+    
+    admin_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    admin_chat_id: Mapped[str] = mapped_column(String(50), nullable=False)
+    message_text: Mapped[str] = mapped_column(Text, nullable=False)
+    
+    status: Mapped[BroadcastStatusEnum] = mapped_column(
+        ENUM(BroadcastStatusEnum, name="broadcast_status_enum", create_type=True),
+        default=BroadcastStatusEnum.pending,
+        nullable=False
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    available_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    
+    last_user_id: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    sent: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    failed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    blocked: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    retried: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    
+    admin = relationship("User", foreign_keys=[admin_id])
+    
+    __table_args__ = (
+        Index("idx_broadcast_jobs_status", "status"),
+    )
+    
+    @property
+    def stats(self) -> dict:
+        return {
+            "total": self.total,
+            "sent": self.sent,
+            "failed": self.failed,
+            "blocked": self.blocked,
+            "retried": self.retried,
+        }
+    
+    def __repr__(self):
+        return f"<BroadcastJob(id={self.id}, status={self.status})>"
@@ -0,0 +1,44 @@
+from datetime import datetime
+from sqlalchemy import (
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    func
+)
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import JSONB
+import enum
+
+from src.models.base import BaseModel
+
+
+class OutboxKindEnum(str, enum.Enum):
+    seen = "seen"
+    like = "like"
+    like_digest = "like_digest"
+    match = "match"
+    report = "report"
+
+
+class OutboxEvent(BaseModel):
+    __tablename__ = "outbox_events"
+    
+    kind: Mapped[str] = mapped_column(String(32), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        server_default=func.now(),
+        nullable=False
+    )
+    
+    __table_args__ = (
+        Index("idx_outbox_events_available_at", "available_at"),
+    )
+    
+    def __repr__(self):
+        return f"<OutboxEvent(id={self.id}, kind={self.kind}, attempts={self.attempts})>"
@@ -1,9 +1,12 @@
 from sqlalchemy import (
     String,
     Boolean,
+    Float,
     ForeignKey,
     Index,
-    Integer
+    Integer,
+    func,
+    text
 )
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import JSONB, ENUM
@@ -11,6 +14,7 @@ from pgvector.sqlalchemy import Vector
 import enum
 
 from src.models.base import BaseModel
+from src.db.vector import embedding_index
 
 
 class GenderEnum(str, enum.Enum):
@@ -28,14 +32,15 @@ class Profile(BaseModel):
     gender: Mapped[GenderEnum | None] = mapped_column(ENUM(GenderEnum, name="gender_enum", create_type=True), nullable=True)
     age: Mapped[int | None] = mapped_column(Integer, nullable=True)
     media: Mapped[list[dict] | None] = mapped_column(JSONB, nullable=True, default=list)
-    embedding: Mapped[list | None] = mapped_column(Vector(384), nullable=True)
+    embedding: Mapped[list | None] = mapped_column(Vector(384), nullable=True, deferred=True, deferred_raiseload=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    sample_key: Mapped[float] = mapped_column(Float, server_default=func.random(), nullable=False)
     
     user = relationship("User", back_populates="profile")
     
     __table_args__ = (
-        Index("idx_profiles_gender", "gender"),
-        Index("idx_profiles_active", "is_active"),
+        Index("idx_profiles_sample_key", "sample_key", postgresql_where=text("is_active")),
+        embedding_index(),
     )
     
     def __repr__(self):
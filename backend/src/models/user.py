@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, String
+from sqlalchemy import Boolean, Index, String
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from src.models.base import BaseModel
@@ -7,7 +7,7 @@ from src.models.base import BaseModel
 class User(BaseModel):
     __tablename__ = "users"
 
-    telegram_id: Mapped[str] = mapped_column(String(50), unique=True, index=True, nullable=False)
+    telegram_id: Mapped[str] = mapped_column(String(50), nullable=False)
     username: Mapped[str | None] = mapped_column(String(100), nullable=True)
     first_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
     
@@ -19,5 +19,9 @@ class User(BaseModel):
     
     is_banned: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
+    __table_args__ = (
+        Index("idx_users_telegram_id", "telegram_id", unique=True, postgresql_include=["id", "is_banned"]),
+    )
+
     def __repr__(self):
         return f"<User(id={self.id}, telegram_id={self.telegram_id})>"
\ No newline at end of file
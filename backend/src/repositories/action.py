@@ -1,7 +1,8 @@
 from src.repositories.base import BaseRepository
 from src.models.action import UserAction, ActionTypeEnum
+from src.models.profile import Profile
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import func, select, update, and_
+from sqlalchemy import select, update, and_, literal
 from src.core.logger import get_repo_logger
 
 class ActionRepository(BaseRepository[UserAction]):
@@ -68,7 +69,7 @@ class ActionRepository(BaseRepository[UserAction]):
             )
             raise
 
-    async def get_next_incoming_like(self, user_id: int) -> UserAction | None:
+    async def get_next_incoming_like(self, user_id: int) -> tuple[UserAction, Profile] | None:
         self.logger.debug(
             f"Getting next incoming like",
             extra={
@@ -78,35 +79,23 @@ class ActionRepository(BaseRepository[UserAction]):
         )
         
         try:
-            subquery = (
-                select(
-                    UserAction.from_user_id,
-                    func.max(UserAction.created_at).label('last_like_time')
-                )
-                .where(
-                    and_(
-                        UserAction.to_user_id == user_id,
-                        UserAction.action_type == ActionTypeEnum.like,
-                        UserAction.is_responded == False
-                    )
-                )
-                .group_by(UserAction.from_user_id)
-                .subquery()
-            )
-            
             query = (
-                select(UserAction)
+                select(UserAction, Profile)
                 .join(
-                    subquery,
+                    Profile,
                     and_(
-                        UserAction.from_user_id == subquery.c.from_user_id,
-                        UserAction.created_at == subquery.c.last_like_time
+                        Profile.user_id == UserAction.from_user_id,
+                        Profile.is_active == True
                     )
                 )
                 .where(
                     and_(
                         UserAction.to_user_id == user_id,
-                        UserAction.action_type == ActionTypeEnum.like,
+                        UserAction.action_type == literal(
+                            ActionTypeEnum.like,
+                            UserAction.action_type.type,
+                            literal_execute=True
+                        ),
                         UserAction.is_responded == False
                     )
                 )
@@ -115,28 +104,29 @@ class ActionRepository(BaseRepository[UserAction]):
             )
             
             result = await self.session.execute(query)
-            action = result.scalar_one_or_none()
+            row = result.first()
             
-            if action:
+            if row:
                 self.logger.debug(
                     f"Found incoming like",
                     extra={
                         "user_id": user_id,
-                        "from_user_id": action.from_user_id,
-                        "action_id": action.id,
-                        "operation": "get_next_incoming_like"
-                    }
-                )
-            else:
-                self.logger.debug(
-                    f"No incoming likes found",
-                    extra={
-                        "user_id": user_id,
+                        "from_user_id": row.UserAction.from_user_id,
+                        "action_id": row.UserAction.id,
+                        "profile_id": row.Profile.id,
                         "operation": "get_next_incoming_like"
                     }
                 )
+                return row.UserAction, row.Profile
             
-            return action
+            self.logger.debug(
+                f"No incoming likes found",
+                extra={
+                    "user_id": user_id,
+                    "operation": "get_next_incoming_like"
+                }
+            )
+            return None
             
         except Exception as e:
             self.logger.error(
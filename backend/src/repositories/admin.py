@@ -1,14 +1,28 @@
-import io
-import csv
-from typing import Optional
+from typing import AsyncIterator, Optional
 
-from sqlalchemy import select
+from sqlalchemy import Row, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.user import User
 from src.models.profile import Profile
 from src.core.logger import get_repo_logger
 
+EXPORT_COLUMNS = (
+    Profile.id.label("profile_id"),
+    Profile.user_id,
+    User.telegram_id,
+    User.username,
+    User.first_name,
+    Profile.name,
+    Profile.gender,
+    Profile.age,
+    Profile.description,
+    func.coalesce(func.jsonb_array_length(Profile.media), 0).label("media_count"),
+    Profile.is_active,
+    Profile.created_at,
+    Profile.updated_at,
+)
+
 class AdminRepository:
     def __init__(self, session: AsyncSession):
         self.__session = session
@@ -18,195 +32,90 @@ class AdminRepository:
             extra={"operation": "init"}
         )
 
-    async def export_profiles_to_csv(
+    async def iter_profile_rows(
         self,
-        limit: int = 1000,
-        offset: int = 0,
+        batch_size: int = 1000,
+        limit: Optional[int] = None,
+        after_id: int = 0,
         is_active: Optional[bool] = None,
-    ) -> str:
+        include_embedding: bool = False,
+    ) -> AsyncIterator[list[Row]]:
         self.logger.info(
-            f"Starting profiles export to CSV",
+            "Starting profiles export",
             extra={
-                "operation": "export_profiles_to_csv",
+                "operation": "iter_profile_rows",
                 "export_params": {
+                    "batch_size": batch_size,
                     "limit": limit,
-                    "offset": offset,
-                    "is_active": is_active
+                    "after_id": after_id,
+                    "is_active": is_active,
+                    "include_embedding": include_embedding
                 }
             }
         )
         
+        columns = EXPORT_COLUMNS + (Profile.embedding,) if include_embedding else EXPORT_COLUMNS
+        query = (
+            select(*columns)
+            .join(User, Profile.user_id == User.id)
+            .order_by(Profile.id)
+        )
+        
+        if is_active is not None:
+            query = query.where(Profile.is_active == is_active)
+        
+        rows_read = 0
+        
         try:
-            import time
-            start_time = time.time()
-            
-            query = (
-                select(Profile, User)
-                .join(User, Profile.user_id == User.id)
-                .order_by(Profile.created_at.desc())
-                .limit(limit)
-                .offset(offset)
-            )
-            
-            if is_active is not None:
-                query = query.where(Profile.is_active == is_active)
-                self.logger.debug(
-                    f"Applied is_active filter: {is_active}",
-                    extra={
-                        "operation": "export_profiles_to_csv",
-                        "filter_applied": "is_active",
-                        "filter_value": is_active
-                    }
+            while limit is None or rows_read < limit:
+                size = batch_size if limit is None else min(batch_size, limit - rows_read)
+                
+                result = await self.__session.execute(
+                    query.where(Profile.id > after_id).limit(size)
                 )
-            
-            self.logger.debug(
-                "Executing database query for profiles export",
-                extra={
-                    "operation": "export_profiles_to_csv",
-                    "query": str(query)
-                }
-            )
-            
-            result = await self.__session.execute(query)
-            rows = result.all()
-            
-            query_time = time.time() - start_time
-            profiles_count = len(rows)
-            
-            self.logger.debug(
-                f"Query executed in {query_time:.3f}s, retrieved {profiles_count} profiles",
-                extra={
-                    "operation": "export_profiles_to_csv",
-                    "query_time_seconds": round(query_time, 3),
-                    "profiles_retrieved": profiles_count,
-                    "limit": limit,
-                    "offset": offset
-                }
-            )
-            
-            if profiles_count == 0:
-                self.logger.warning(
-                    "No profiles found for export with current parameters",
+                rows = result.all()
+                await self.__session.commit()
+                
+                if not rows:
+                    break
+                
+                rows_read += len(rows)
+                after_id = rows[-1].profile_id
+                
+                self.logger.debug(
+                    f"Fetched {len(rows)} profiles for export",
                     extra={
-                        "operation": "export_profiles_to_csv",
-                        "limit": limit,
-                        "offset": offset,
-                        "is_active": is_active
+                        "operation": "iter_profile_rows",
+                        "batch_rows": len(rows),
+                        "rows_read": rows_read,
+                        "last_profile_id": after_id
                     }
                 )
-                output = io.StringIO()
-                writer = csv.writer(output, quoting=csv.QUOTE_ALL)
-                writer.writerow([
-                    'profile_id',
-                    'user_id',
-                    'telegram_id',
-                    'username',
-                    'first_name',
-                    'name',
-                    'gender',
-                    'age',
-                    'description',
-                    'media_count',
-                    'is_active',
-                    'created_at',
-                    'updated_at',
-                ])
-                return output.getvalue()
-            
-            output = io.StringIO()
-            writer = csv.writer(output, quoting=csv.QUOTE_ALL)
-            
-            headers = [
-                'profile_id',
-                'user_id',
-                'telegram_id',
-                'username',
-                'first_name',
-                'name',
-                'gender',
-                'age',
-                'description',
-                'media_count',
-                'is_active',
-                'created_at',
-                'updated_at',
-            ]
-            writer.writerow(headers)
-            
-            rows_written = 0
-            for profile, user in rows:
-                try:                    
-                    writer.writerow([
-                        profile.id,
-                        profile.user_id,
-                        user.telegram_id,
-                        user.username or '',
-                        user.first_name or '',
-                        profile.name or '',
-                        profile.gender.value if profile.gender else '',
-                        profile.age or '',
-                        profile.description or '',
-                        len(profile.media) if profile.media else 0,
-                        profile.is_active,
-                        profile.created_at.isoformat() if profile.created_at else '',
-                        profile.updated_at.isoformat() if profile.updated_at else '',
-                    ])
-                    rows_written += 1
-                    
-                    if rows_written % 100 == 0:
-                        self.logger.debug(
-                            f"Processed {rows_written} profiles for CSV export",
-                            extra={
-                                "operation": "export_profiles_to_csv",
-                                "rows_processed": rows_written,
-                                "total_rows": profiles_count,
-                                "progress_percent": round(rows_written / profiles_count * 100, 1)
-                            }
-                        )
-                        
-                except Exception as e:
-                    self.logger.error(
-                        f"Error processing profile {profile.id} for CSV export",
-                        extra={
-                            "operation": "export_profiles_to_csv",
-                            "profile_id": profile.id,
-                            "user_id": profile.user_id,
-                            "error_type": type(e).__name__,
-                            "error": str(e)
-                        },
-                        exc_info=True
-                    )
-                    continue
-            
-            total_time = time.time() - start_time
+                
+                yield rows
+                
+                if len(rows) < size:
+                    break
             
             self.logger.info(
-                f"Successfully exported {rows_written} profiles to CSV",
+                f"Read {rows_read} profiles for export",
                 extra={
-                    "operation": "export_profiles_to_csv",
-                    "total_rows": rows_written,
-                    "limit": limit,
-                    "offset": offset,
-                    "is_active": is_active,
-                    "total_time_seconds": round(total_time, 3),
-                    "rows_per_second": round(rows_written / total_time, 1) if total_time > 0 else 0,
-                    "csv_size_bytes": len(output.getvalue())
+                    "operation": "iter_profile_rows",
+                    "total_rows": rows_read,
+                    "is_active": is_active
                 }
             )
             
-            return output.getvalue()
-            
         except Exception as e:
             self.logger.error(
-                f"Failed to export profiles to CSV",
+                "Failed to read profiles for export",
                 extra={
-                    "operation": "export_profiles_to_csv",
-                    "limit": limit,
-                    "offset": offset,
-                    "is_active": is_active,
+                    "operation": "iter_profile_rows",
+                    "rows_read": rows_read,
+                    "last_profile_id": after_id,
                     "error_type": type(e).__name__,
                     "error": str(e)
                 },
                 exc_info=True
             )
-            raise
\ No newline at end of file
+            raise
@@ -0,0 +1,181 @@
+from datetime import timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, func, or_, select, update
+from src.repositories.base import BaseRepository
+from src.models.broadcast import BroadcastJob, BroadcastStatusEnum
+from src.core.logger import get_repo_logger
+
+class BroadcastJobRepository(BaseRepository[BroadcastJob]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(BroadcastJob, session)
+        self.logger = get_repo_logger()
+        self.logger.debug(
+            "BroadcastJobRepository initialized",
+            extra={"operation": "init"}
+        )
+
+    async def claim_next(self, stale_after: timedelta) -> BroadcastJob | None:
+        self.logger.debug(
+            "Claiming next broadcast job",
+            extra={
+                "operation": "claim_next",
+                "stale_after_seconds": stale_after.total_seconds()
+            }
+        )
+        
+        try:
+            query = (
+                select(BroadcastJob)
+                .where(
+                    or_(
+                        and_(
+                            BroadcastJob.status == BroadcastStatusEnum.pending,
+                            BroadcastJob.available_at <= func.now()
+                        ),
+                        and_(
+                            BroadcastJob.status == BroadcastStatusEnum.running,
+                            BroadcastJob.heartbeat_at < func.now() - stale_after
+                        )
+                    )
+                )
+                .order_by(BroadcastJob.id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            
+            job = (await self.session.execute(query)).scalar_one_or_none()
+            if job is None:
+                return None
+            
+            resumed = job.status == BroadcastStatusEnum.running
+            job.status = BroadcastStatusEnum.running
+            job.heartbeat_at = func.now()
+            job.started_at = func.coalesce(BroadcastJob.started_at, func.now())
+            await self.session.flush()
+            await self.session.refresh(job, attribute_names=["heartbeat_at", "started_at", "updated_at"])
+            
+            self.logger.info(
+                "Broadcast job claimed",
+                extra={
+                    "operation": "claim_next",
+                    "job_id": job.id,
+                    "resumed": resumed,
+                    "attempts": job.attempts,
+                    "last_user_id": job.last_user_id
+                }
+            )
+            
+            return job
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to claim broadcast job",
+                extra={
+                    "operation": "claim_next",
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
+    async def checkpoint(self, job: BroadcastJob, last_user_id: int, stats: dict) -> BroadcastJob:
+        self.logger.debug(
+            "Checkpointing broadcast job",
+            extra={
+                "operation": "checkpoint",
+                "job_id": job.id,
+                "last_user_id": last_user_id,
+                "stats": stats
+            }
+        )
+        
+        try:
+            job.last_user_id = last_user_id
+            job.total = stats["total"]
+            job.sent = stats["sent"]
+            job.failed = stats["failed"]
+            job.blocked = stats["blocked"]
+            job.retried = stats["retried"]
+            job.heartbeat_at = func.now()
+            await self.session.flush()
+            await self.session.refresh(job, attribute_names=["heartbeat_at", "updated_at"])
+            return job
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to checkpoint broadcast job",
+                extra={
+                    "operation": "checkpoint",
+                    "job_id": job.id,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
+    async def touch(self, job_id: int) -> None:
+        try:
+            await self.session.execute(
+                update(BroadcastJob)
+                .where(
+                    BroadcastJob.id == job_id,
+                    BroadcastJob.status == BroadcastStatusEnum.running
+                )
+                .values(heartbeat_at=func.now())
+            )
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to update broadcast job heartbeat",
+                extra={
+                    "operation": "touch",
+                    "job_id": job_id,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
+    async def finish(
+        self,
+        job: BroadcastJob,
+        status: BroadcastStatusEnum,
+        error: str | None = None,
+        retry_after: timedelta | None = None
+    ) -> BroadcastJob:
+        self.logger.debug(
+            "Finishing broadcast job",
+            extra={
+                "operation": "finish",
+                "job_id": job.id,
+                "status": status.value,
+                "retry_after_seconds": retry_after.total_seconds() if retry_after else None
+            }
+        )
+        
+        try:
+            job.status = status
+            job.error = error
+            job.heartbeat_at = None
+            if status in (BroadcastStatusEnum.completed, BroadcastStatusEnum.failed):
+                job.finished_at = func.now()
+            job.available_at = func.now() + retry_after if retry_after else func.now()
+            await self.session.flush()
+            await self.session.refresh(job, attribute_names=["finished_at", "available_at", "updated_at"])
+            return job
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to finish broadcast job",
+                extra={
+                    "operation": "finish",
+                    "job_id": job.id,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
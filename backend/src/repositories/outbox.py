@@ -0,0 +1,138 @@
+from datetime import timedelta
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, func, select, update
+from src.repositories.base import BaseRepository
+from src.models.outbox import OutboxEvent, OutboxKindEnum
+from src.core.logger import get_repo_logger
+
+class OutboxRepository(BaseRepository[OutboxEvent]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(OutboxEvent, session)
+        self.logger = get_repo_logger()
+        self.logger.debug(
+            "OutboxRepository initialized",
+            extra={"operation": "init"}
+        )
+
+    def add(self, kind: OutboxKindEnum, **payload) -> OutboxEvent:
+        self.logger.debug(
+            "Adding outbox event",
+            extra={
+                "operation": "add",
+                "kind": kind.value,
+                **payload
+            }
+        )
+
+        event = OutboxEvent(kind=kind.value, payload=payload, attempts=0)
+        self.session.add(event)
+        return event
+
+    async def claim_batch(self, limit: int, lease: timedelta) -> List[OutboxEvent]:
+        self.logger.debug(
+            "Claiming outbox events",
+            extra={
+                "operation": "claim_batch",
+                "limit": limit,
+                "lease_seconds": lease.total_seconds()
+            }
+        )
+
+        try:
+            due = (
+                select(OutboxEvent.id)
+                .where(OutboxEvent.available_at <= func.now())
+                .order_by(OutboxEvent.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+            query = (
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_(due))
+                .values(
+                    available_at=func.now() + lease,
+                    attempts=OutboxEvent.attempts + 1
+                )
+                .returning(OutboxEvent)
+                .execution_options(synchronize_session=False)
+            )
+
+            events = list((await self.session.execute(query)).scalars().all())
+            events.sort(key=lambda event: event.id)
+
+            if events:
+                self.logger.debug(
+                    f"Claimed {len(events)} outbox events",
+                    extra={
+                        "operation": "claim_batch",
+                        "count": len(events),
+                        "first_id": events[0].id,
+                        "last_id": events[-1].id
+                    }
+                )
+
+            return events
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to claim outbox events",
+                extra={
+                    "operation": "claim_batch",
+                    "limit": limit,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
+    async def complete(self, event_ids: List[int]) -> None:
+        if not event_ids:
+            return
+
+        try:
+            await self.session.execute(
+                delete(OutboxEvent)
+                .where(OutboxEvent.id.in_(event_ids))
+                .execution_options(synchronize_session=False)
+            )
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to complete outbox events",
+                extra={
+                    "operation": "complete",
+                    "count": len(event_ids),
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
+    async def reschedule(self, event_id: int, delay: float, error: str | None = None) -> None:
+        try:
+            await self.session.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id == event_id)
+                .values(
+                    available_at=func.now() + timedelta(seconds=delay),
+                    error=error
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to reschedule outbox event",
+                extra={
+                    "operation": "reschedule",
+                    "event_id": event_id,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
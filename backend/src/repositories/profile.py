@@ -1,10 +1,23 @@
 from src.repositories.base import BaseRepository
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.profile import Profile
-from sqlalchemy import select, func
-from typing import List
+from src.models.action import UserAction
+from src.db.vector import apply_search_settings, embedding_distance
+from sqlalchemy import Integer, all_, exists, literal, select, union_all
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import aliased
+from typing import List, Sequence
+import math
+import random
 from src.core.logger import get_repo_logger
 
+def exploration_quota(limit: int, ratio: float) -> int:
+    share = limit * ratio
+    quota = math.floor(share)
+    if random.random() < share - quota:
+        quota += 1
+    return min(limit, quota)
+
 class ProfileRepository(BaseRepository[Profile]):
     def __init__(self, session: AsyncSession):
         super().__init__(Profile, session)
@@ -63,11 +76,114 @@ class ProfileRepository(BaseRepository[Profile]):
             )
             raise
 
+    async def get_by_user_ids(self, user_ids: List[int]) -> List[Profile]:
+        self.logger.debug(
+            "Getting profiles by user_ids",
+            extra={
+                "operation": "get_by_user_ids",
+                "count": len(user_ids)
+            }
+        )
+        
+        if not user_ids:
+            return []
+        
+        try:
+            result = await self.session.execute(
+                select(Profile).where(Profile.user_id.in_(user_ids))
+            )
+            return list(result.scalars().all())
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to get profiles by user_ids",
+                extra={
+                    "operation": "get_by_user_ids",
+                    "count": len(user_ids),
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
+    async def get_embedding_by_user_id(self, user_id: int) -> List[float] | None:
+        self.logger.debug(
+            "Getting profile embedding by user_id",
+            extra={
+                "operation": "get_embedding_by_user_id",
+                "user_id": user_id
+            }
+        )
+        
+        try:
+            result = await self.session.execute(
+                select(Profile.embedding).where(Profile.user_id == user_id)
+            )
+            embedding = result.scalar_one_or_none()
+            
+            if embedding is None:
+                return None
+            
+            return embedding.tolist() if hasattr(embedding, 'tolist') else list(embedding)
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to get profile embedding by user_id",
+                extra={
+                    "operation": "get_embedding_by_user_id",
+                    "user_id": user_id,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
+    def _exclude_seen(
+        self,
+        query,
+        user_id: int | None,
+        seen_user_ids: List[int],
+        exclude_profile_ids: Sequence[int] = (),
+    ):
+        query = query.where(
+            Profile.user_id != all_(literal(seen_user_ids, ARRAY(Integer)))
+        )
+
+        if exclude_profile_ids:
+            query = query.where(
+                Profile.id != all_(literal(list(exclude_profile_ids), ARRAY(Integer)))
+            )
+
+        if user_id is None:
+            return query
+
+        return query.where(
+            Profile.user_id != user_id,
+            ~exists().where(
+                UserAction.from_user_id == user_id,
+                UserAction.to_user_id == Profile.user_id
+            ),
+        )
+
+    def _nearest(self, query, user_embedding: List[float], limit: int):
+        distance = embedding_distance(Profile.embedding, user_embedding)
+        return (
+            query
+            .add_columns(distance.label("score"))
+            .order_by(distance)
+            .limit(limit)
+            .subquery("nearest")
+        )
+
     async def get_similar_profiles(
         self, 
         user_embedding: List[float], 
         seen_user_ids: List[int], 
         limit: int = 10,
+        user_id: int | None = None,
+        exclude_profile_ids: Sequence[int] = (),
     ) -> List[Profile]:
         self.logger.debug(
             "Getting similar profiles",
@@ -80,18 +196,24 @@ class ProfileRepository(BaseRepository[Profile]):
         )
         
         try:
-            query = (
-                select(Profile)
-                .where(Profile.user_id.notin_(seen_user_ids))
-                .where(Profile.is_active == True)
+            nearest = self._nearest(
+                self._exclude_seen(
+                    select(Profile.id).where(Profile.is_active == True),
+                    user_id,
+                    seen_user_ids,
+                    exclude_profile_ids
+                ),
+                user_embedding,
+                limit
             )
             
             query = (
-                query
-                .order_by(Profile.embedding.op('<->')(user_embedding))
-                .limit(limit)
+                select(Profile)
+                .join(nearest, nearest.c.id == Profile.id)
+                .order_by(nearest.c.score)
             )
             
+            await apply_search_settings(self.session, limit)
             result = await self.session.execute(query)
             profiles = list(result.scalars().all())
             
@@ -125,6 +247,8 @@ class ProfileRepository(BaseRepository[Profile]):
         self, 
         seen_user_ids: List[int], 
         limit: int = 10,
+        user_id: int | None = None,
+        exclude_profile_ids: Sequence[int] = (),
     ) -> List[Profile]:
         self.logger.debug(
             "Getting random profiles",
@@ -136,20 +260,13 @@ class ProfileRepository(BaseRepository[Profile]):
         )
         
         try:
-            query = (
-                select(Profile)
-                .where(Profile.user_id.notin_(seen_user_ids))
-                .where(Profile.is_active == True)
+            profiles = await self.get_candidates(
+                user_embedding=None,
+                seen_user_ids=seen_user_ids,
+                limit=limit,
+                user_id=user_id,
+                exclude_profile_ids=exclude_profile_ids
             )
-                    
-            query = (
-                query
-                .order_by(func.random())
-                .limit(limit)
-            )
-            
-            result = await self.session.execute(query)
-            profiles = list(result.scalars().all())
             
             self.logger.debug(
                 f"Found {len(profiles)} random profiles",
@@ -175,4 +292,138 @@ class ProfileRepository(BaseRepository[Profile]):
                 },
                 exc_info=True
             )
-            raise
\ No newline at end of file
+            raise
+
+    def _mix_candidates(self, rows, limit: int, explore_quota: int) -> List[Profile]:
+        similar = [profile for profile, source in rows if source == 0]
+        sampled = [profile for profile, source in rows if source == 1]
+
+        chosen_similar = similar[:limit - explore_quota]
+        taken = {profile.id for profile in chosen_similar}
+        chosen_sampled = []
+        for profile in sampled:
+            if len(chosen_sampled) >= explore_quota:
+                break
+            if profile.id not in taken:
+                taken.add(profile.id)
+                chosen_sampled.append(profile)
+
+        backfill = [profile for profile in similar if profile.id not in taken]
+        chosen_similar += backfill[:limit - len(chosen_similar) - len(chosen_sampled)]
+
+        if not chosen_sampled:
+            return chosen_similar
+
+        total = len(chosen_similar) + len(chosen_sampled)
+        step = total / len(chosen_sampled)
+        sampled_positions = {int(i * step + step / 2) for i in range(len(chosen_sampled))}
+
+        similar_iter = iter(chosen_similar)
+        sampled_iter = iter(chosen_sampled)
+        return [
+            next(sampled_iter) if position in sampled_positions else next(similar_iter)
+            for position in range(total)
+        ]
+
+    async def get_candidates(
+        self,
+        user_embedding: List[float] | None,
+        seen_user_ids: List[int],
+        limit: int = 10,
+        user_id: int | None = None,
+        exclude_profile_ids: Sequence[int] = (),
+        exploration_ratio: float = 0.2,
+    ) -> List[Profile]:
+        self.logger.debug(
+            "Getting candidate profiles",
+            extra={
+                "operation": "get_candidates",
+                "seen_users_count": len(seen_user_ids),
+                "limit": limit,
+                "has_embedding": user_embedding is not None,
+                "exploration_ratio": exploration_ratio
+            }
+        )
+        
+        try:
+            if user_embedding is None:
+                explore_quota = limit
+            else:
+                explore_quota = exploration_quota(limit, exploration_ratio)
+
+            columns = [column for column in Profile.__table__.c if column.key != "embedding"]
+
+            def base():
+                return self._exclude_seen(
+                    select(*columns).where(Profile.is_active == True),
+                    user_id,
+                    seen_user_ids,
+                    exclude_profile_ids
+                )
+
+            branches = []
+            if user_embedding is not None:
+                nearest = self._nearest(base(), user_embedding, limit)
+                branches.append(
+                    select(
+                        *(nearest.c[column.key] for column in columns),
+                        literal(0).label("source"),
+                        nearest.c.score
+                    )
+                )
+
+            if explore_quota:
+                pivot = random.random()
+                branches.append(
+                    base()
+                    .where(Profile.sample_key >= pivot)
+                    .add_columns(literal(1).label("source"), (Profile.sample_key - pivot).label("score"))
+                    .order_by(Profile.sample_key)
+                    .limit(explore_quota * 2)
+                )
+                branches.append(
+                    base()
+                    .where(Profile.sample_key < pivot)
+                    .add_columns(literal(1).label("source"), (Profile.sample_key - pivot + 1).label("score"))
+                    .order_by(Profile.sample_key)
+                    .limit(explore_quota * 2)
+                )
+
+            candidates = union_all(*branches).subquery()
+            candidate = aliased(Profile, candidates)
+            query = (
+                select(candidate, candidates.c.source)
+                .order_by(candidates.c.source, candidates.c.score)
+            )
+            
+            if user_embedding is not None:
+                await apply_search_settings(self.session, limit)
+            result = await self.session.execute(query)
+            profiles = self._mix_candidates(result.all(), limit, explore_quota)
+            
+            self.logger.debug(
+                f"Found {len(profiles)} candidate profiles",
+                extra={
+                    "operation": "get_candidates",
+                    "found_count": len(profiles),
+                    "limit": limit,
+                    "explore_quota": explore_quota,
+                    "seen_users_count": len(seen_user_ids)
+                }
+            )
+            
+            return profiles
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to get candidate profiles",
+                extra={
+                    "operation": "get_candidates",
+                    "seen_users_count": len(seen_user_ids),
+                    "limit": limit,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
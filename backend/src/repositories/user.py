@@ -1,3 +1,4 @@
+from typing import AsyncIterator
 from src.repositories.base import BaseRepository
 from src.models.user import User
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -62,6 +63,37 @@ class UserRepository(BaseRepository[User]):
             )
             raise
 
+    async def get_by_ids(self, user_ids: list[int]) -> list[User]:
+        self.logger.debug(
+            "Getting users by ids",
+            extra={
+                "operation": "get_by_ids",
+                "count": len(user_ids)
+            }
+        )
+        
+        if not user_ids:
+            return []
+        
+        try:
+            result = await self.session.execute(
+                select(User).where(User.id.in_(user_ids))
+            )
+            return list(result.scalars().all())
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to get users by ids",
+                extra={
+                    "operation": "get_by_ids",
+                    "count": len(user_ids),
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
     async def create_if_not_exists(self, telegram_id: str, username: str = None, first_name: str = None) -> User:
         self.logger.debug(
             "Creating user if not exists",
@@ -121,23 +153,22 @@ class UserRepository(BaseRepository[User]):
             )
             raise
     
-    async def get_active_telegram_ids(self, limit: int = 1000, offset: int = 0) -> list[str]:
+    async def get_active_telegram_ids(self, limit: int = 1000, after_id: int = 0) -> list[tuple[int, str]]:
         self.logger.debug(
             "Getting active telegram_ids",
             extra={
                 "operation": "get_active_telegram_ids",
                 "limit": limit,
-                "offset": offset
+                "after_id": after_id
             }
         )
         
         try:
             query = (
-                select(User.telegram_id)
-                .where(User.is_banned == False)
+                select(User.id, User.telegram_id)
+                .where(User.is_banned == False, User.id > after_id)
                 .order_by(User.id)
                 .limit(limit)
-                .offset(offset)
             )
             
             result = await self.session.execute(query)
@@ -149,7 +180,7 @@ class UserRepository(BaseRepository[User]):
                     "operation": "get_active_telegram_ids",
                     "count": len(telegram_ids),
                     "limit": limit,
-                    "offset": offset
+                    "after_id": after_id
                 }
             )
             
@@ -161,10 +192,26 @@ class UserRepository(BaseRepository[User]):
                 extra={
                     "operation": "get_active_telegram_ids",
                     "limit": limit,
-                    "offset": offset,
+                    "after_id": after_id,
                     "error_type": type(e).__name__,
                     "error": str(e)
                 },
                 exc_info=True
             )
-            raise
\ No newline at end of file
+            raise
+
+    async def iter_active_telegram_ids(
+        self,
+        batch_size: int = 1000,
+        after_id: int = 0
+    ) -> AsyncIterator[list[tuple[int, str]]]:
+        while True:
+            rows = await self.get_active_telegram_ids(limit=batch_size, after_id=after_id)
+            if not rows:
+                return
+
+            yield rows
+
+            if len(rows) < batch_size:
+                return
+            after_id = rows[-1][0]
@@ -0,0 +1,26 @@
+from pydantic import BaseModel, ConfigDict
+from datetime import datetime
+from typing import Optional
+
+
+class BroadcastJobResponse(BaseModel):
+    id: int
+    status: str
+    message_text: str
+    last_user_id: int
+    total: int
+    sent: int
+    failed: int
+    blocked: int
+    retried: int
+    attempts: int
+    error: Optional[str]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    heartbeat_at: Optional[datetime]
+    
+    model_config = ConfigDict(
+        from_attributes=True,
+        use_enum_values=True
+    )
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class EmbeddingMetricsResponse(BaseModel):
+    queue_depth: int
+    queued: int
+    batches_in_flight: int
+    batches: int
+    avg_batch_size: float
+    max_batch_size: int
@@ -0,0 +1,77 @@
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, List
+
+import numpy as np
+
+from src.scripts.seed_data import TEST_PROFILES
+from src.services.embedding import MAX_SEQUENCE_LENGTH, EmbeddingModel, embedding_service
+
+
+def _corpus(size: int) -> List[str]:
+    descriptions = [p["profile"]["description"] for p in TEST_PROFILES]
+    return [f"{descriptions[i % len(descriptions)]} #{i}" for i in range(size)]
+
+
+async def _drive(
+    embed: Callable[[str], Awaitable[list[float]]],
+    texts: List[str],
+    concurrency: int,
+) -> tuple[float, List[float]]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(text: str):
+        async with semaphore:
+            started = time.perf_counter()
+            await embed(text)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(text) for text in texts))
+    return time.perf_counter() - started, latencies
+
+
+def _report(name: str, elapsed: float, latencies: List[float]):
+    print(
+        f"{name:<12} throughput={len(latencies) / elapsed:8.1f} emb/s "
+        f"p50={np.percentile(latencies, 50):7.2f}ms "
+        f"p99={np.percentile(latencies, 99):7.2f}ms"
+    )
+
+
+async def run(requests: int, concurrency: int):
+    texts = _corpus(requests)
+
+    baseline_model = EmbeddingModel(pad_to=MAX_SEQUENCE_LENGTH)
+    baseline_executor = ThreadPoolExecutor(max_workers=1)
+
+    async def single(text: str) -> list[float]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(baseline_executor, baseline_model.encode, text)
+
+    await _drive(single, texts[:10], 1)
+    await _drive(embedding_service.generate_embedding, texts[:10], concurrency)
+
+    _report("single", *await _drive(single, texts, concurrency))
+    _report("microbatch", *await _drive(embedding_service.generate_embedding, texts, concurrency))
+
+    baseline_executor.shutdown()
+    embedding_service.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare single-item fixed-padding embeddings with the micro-batched service"
+    )
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import argparse
+import asyncio
+import resource
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.config import settings
+from src.repositories.admin import AdminRepository
+from src.services.export import encode_csv
+
+
+def _rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def run(dsn: str, batch_size: int, limit: int | None) -> None:
+    engine = create_async_engine(dsn, echo=False)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    try:
+        async with session_maker() as session:
+            repo = AdminRepository(session)
+            baseline = _rss_mb()
+            started = time.perf_counter()
+            size = 0
+            chunks = 0
+
+            async for chunk in encode_csv(repo.iter_profile_rows(batch_size=batch_size, limit=limit)):
+                size += len(chunk)
+                chunks += 1
+
+            elapsed = time.perf_counter() - started
+            print(
+                f"exported {size / 1024 / 1024:.1f}MB in {chunks} chunks, {elapsed:.2f}s, "
+                f"peak rss +{_rss_mb() - baseline:.1f}MB over baseline {baseline:.1f}MB"
+            )
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure time and peak memory of the streaming CSV profile export (seed data with bench_vector_search --keep)"
+    )
+    parser.add_argument("--dsn", default=settings.POSTGRES_DSN)
+    parser.add_argument("--batch-size", type=int, default=settings.EXPORT_BATCH_SIZE)
+    parser.add_argument("--limit", type=int)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.dsn, args.batch_size, args.limit))
+
+
+if __name__ == "__main__":
+    main()
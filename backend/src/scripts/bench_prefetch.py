@@ -0,0 +1,112 @@
+import argparse
+from typing import List, Tuple
+
+import numpy as np
+
+from src.core.config import settings
+from src.services.profile import prefetch_size
+
+FIXED_BATCH = 10
+
+
+class SwipeRate:
+    def __init__(self):
+        self.rate = 0.0
+        self.last = None
+
+    def observe(self, now: float):
+        if self.last is not None:
+            gap = max(now - self.last, 0.1)
+            if gap < settings.SWIPE_SESSION_GAP_SECONDS:
+                self.rate += settings.SWIPE_RATE_ALPHA * (1 / gap - self.rate)
+            else:
+                self.rate /= 2
+        self.last = now
+
+
+def _swipe_times(rng: np.random.Generator, mean_interval: float, sessions: int, swipes_per_session: int) -> List[float]:
+    times = []
+    now = 0.0
+    for _ in range(sessions):
+        now += settings.SWIPE_SESSION_GAP_SECONDS * 4
+        for interval in rng.exponential(mean_interval, swipes_per_session):
+            now += interval
+            times.append(now)
+    return times
+
+
+def simulate_fixed(times: List[float]) -> float:
+    queued = 0
+    refills = 0
+
+    for _ in times:
+        if queued:
+            queued -= 1
+            continue
+
+        refills += 1
+        queued = FIXED_BATCH - 1
+
+    return refills / len(times)
+
+
+def simulate_feed(times: List[float], min_top_up: int) -> Tuple[float, float]:
+    rate = SwipeRate()
+    queued = 0
+    request_refills = 0
+    top_ups = 0
+
+    for now in times:
+        rate.observe(now)
+        if queued:
+            queued -= 1
+        else:
+            request_refills += 1
+            queued = prefetch_size(rate.rate)
+            continue
+
+        if queued < settings.FEED_LOW_WATERMARK:
+            target = prefetch_size(rate.rate)
+            if target - queued >= min_top_up:
+                top_ups += 1
+                queued = target
+
+    return request_refills / len(times), top_ups / len(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Simulate DB queries per swipe for the fixed batch and the feed builder with adaptive prefetch"
+    )
+    parser.add_argument(
+        "--swipers",
+        default="fast=1,median=5,slow=30",
+        help="Comma-separated name=mean seconds between swipes"
+    )
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--swipes-per-session", type=int, default=60)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    print(
+        f"prefetch bounds={settings.SWIPE_PREFETCH_MIN}..{settings.SWIPE_PREFETCH_MAX} "
+        f"horizon={settings.SWIPE_PREFETCH_HORIZON}s alpha={settings.SWIPE_RATE_ALPHA} "
+        f"watermark={settings.FEED_LOW_WATERMARK} min top-up={settings.FEED_MIN_TOP_UP}"
+    )
+
+    for swiper in args.swipers.split(","):
+        name, mean_interval = swiper.split("=")
+        times = _swipe_times(rng, float(mean_interval), args.sessions, args.swipes_per_session)
+        fixed = simulate_fixed(times)
+        request, top_up = simulate_feed(times, settings.FEED_MIN_TOP_UP)
+        _, unbatched = simulate_feed(times, 1)
+        print(
+            f"{name:>8} ({float(mean_interval):>5.1f}s): "
+            f"fixed={fixed:.3f} "
+            f"feed={request + top_up:.3f} (request={request:.3f} top-up={top_up:.3f}) "
+            f"feed without min top-up={request + unbatched:.3f} db queries/swipe"
+        )
+
+
+if __name__ == "__main__":
+    main()
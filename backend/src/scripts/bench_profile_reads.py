@@ -0,0 +1,85 @@
+import argparse
+import asyncio
+import time
+from typing import List
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import undefer
+
+from src.core.config import settings
+from src.models.profile import Profile
+from src.scripts.bench_vector_search import cleanup, seed_profiles
+
+
+async def measure(session: AsyncSession, rows: int, iterations: int, with_embedding: bool) -> List[float]:
+    query = select(Profile).where(Profile.is_active == True).order_by(Profile.id).limit(rows)
+    if with_embedding:
+        query = query.options(undefer(Profile.embedding))
+
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        result = await session.execute(query)
+        result.scalars().all()
+        timings.append((time.perf_counter() - started) * 1000)
+        session.expunge_all()
+
+    return timings
+
+
+async def embedding_bytes(session: AsyncSession, rows: int) -> int:
+    subquery = (
+        select(Profile.embedding)
+        .where(Profile.is_active == True)
+        .order_by(Profile.id)
+        .limit(rows)
+        .subquery()
+    )
+    return await session.scalar(select(func.sum(func.pg_column_size(subquery.c.embedding))))
+
+
+async def run(size: int, rows: int, iterations: int, dsn: str, keep: bool) -> None:
+    engine = create_async_engine(dsn, echo=False)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    rng = np.random.default_rng(42)
+
+    try:
+        async with session_maker() as session:
+            print(f"Seeding {size} profiles...")
+            await seed_profiles(session, size, rng)
+
+            print(f"embedding payload per read: {(await embedding_bytes(session, rows) or 0) / 1024:.1f} KiB for {rows} rows")
+
+            for name, with_embedding in (("with embedding", True), ("deferred", False)):
+                await measure(session, rows, min(iterations, 10), with_embedding)
+                timings = await measure(session, rows, iterations, with_embedding)
+                print(
+                    f"{name:<16} "
+                    f"p50={np.percentile(timings, 50):.2f}ms "
+                    f"p99={np.percentile(timings, 99):.2f}ms"
+                )
+
+            if not keep:
+                await cleanup(session)
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare profile read latency with the embedding column loaded and deferred"
+    )
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--rows", type=int, default=10, help="Profiles fetched per read, as in a swipe queue refill")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--dsn", default=settings.POSTGRES_DSN)
+    parser.add_argument("--keep", action="store_true", help="Keep seeded benchmark profiles")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.size, args.rows, args.iterations, args.dsn, args.keep))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+from src.core.model_files import MODEL_CACHE_DIR
+
+IMPORT_APP = """
+import time
+started = time.perf_counter()
+import src.main
+print((time.perf_counter() - started) * 1000)
+"""
+
+WARM_UP = """
+import asyncio
+import time
+from src.services.embedding import embedding_service
+started = time.perf_counter()
+asyncio.run(embedding_service.warm_up())
+print((time.perf_counter() - started) * 1000)
+embedding_service.close()
+"""
+
+
+def _optimized_models(cache_dir: Path) -> List[Path]:
+    return list(cache_dir.glob("*.optimized*.onnx"))
+
+
+def _clear_optimized(cache_dir: Path) -> None:
+    for path in _optimized_models(cache_dir):
+        path.unlink()
+
+
+def _run(code: str) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def _report(name: str, timings: List[float]) -> None:
+    print(
+        f"{name:>22}: "
+        f"p50={np.percentile(timings, 50):.1f}ms "
+        f"min={min(timings):.1f}ms "
+        f"max={max(timings):.1f}ms"
+    )
+
+
+def run(runs: int, cache_dir: Path) -> None:
+    _report("import app", [_run(IMPORT_APP) for _ in range(runs)])
+
+    cold = []
+    for _ in range(runs):
+        _clear_optimized(cache_dir)
+        cold.append(_run(WARM_UP))
+    _report("warm-up (no opt cache)", cold)
+
+    if not _optimized_models(cache_dir):
+        print("optimized model was not written, check EMBEDDING_CACHE_OPTIMIZED_MODEL and directory permissions")
+        return
+
+    _report("warm-up (opt cache)", [_run(WARM_UP) for _ in range(runs)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark application import and embedding model warm-up time")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.runs, MODEL_CACHE_DIR)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List
+
+import httpx
+import numpy as np
+import uvicorn
+from fastapi import FastAPI
+
+from src.services.telegram import TelegramNotificationService
+
+BOT_TOKEN = "bench-token"
+
+
+def _fake_telegram_api(delay_ms: float) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/bot{token}/sendMessage")
+    async def send_message(token: str):
+        if delay_ms:
+            await asyncio.sleep(delay_ms / 1000)
+        return {"ok": True, "result": {"message_id": 1}}
+
+    return app
+
+
+async def _drive(send: Callable[[int], Awaitable[bool]], messages: int, concurrency: int) -> List[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(chat_id: int):
+        async with semaphore:
+            started = time.perf_counter()
+            await send(chat_id)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*(one(i) for i in range(messages)))
+    return latencies
+
+
+def _report(name: str, latencies: List[float]) -> None:
+    print(
+        f"{name:<16} "
+        f"p50={np.percentile(latencies, 50):7.2f}ms "
+        f"p99={np.percentile(latencies, 99):7.2f}ms "
+        f"mean={np.mean(latencies):7.2f}ms"
+    )
+
+
+async def run(messages: int, concurrency: int, delay_ms: float, port: int):
+    config = uvicorn.Config(
+        _fake_telegram_api(delay_ms),
+        host="127.0.0.1",
+        port=port,
+        log_level="warning",
+    )
+    server = uvicorn.Server(config)
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    api_url = f"http://127.0.0.1:{port}"
+    url = f"{api_url}/bot{BOT_TOKEN}/sendMessage"
+
+    async def per_message_client(chat_id: int) -> bool:
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            response = await client.post(url, json={"chat_id": str(chat_id), "text": "bench"})
+            return response.status_code == 200
+
+    service = TelegramNotificationService(BOT_TOKEN, api_url=api_url)
+
+    async def pooled_client(chat_id: int) -> bool:
+        return await service.send_message(chat_id, "bench")
+
+    try:
+        await _drive(per_message_client, 20, concurrency)
+        _report("client per call", await _drive(per_message_client, messages, concurrency))
+
+        await _drive(pooled_client, 20, concurrency)
+        _report("pooled client", await _drive(pooled_client, messages, concurrency))
+    finally:
+        await service.close()
+        server.should_exit = True
+        await server_task
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare per-message latency of a fresh httpx client per call with the pooled Telegram client"
+    )
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--delay-ms", type=float, default=0.0, help="Simulated Telegram API processing time")
+    parser.add_argument("--port", type=int, default=8089)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.messages, args.concurrency, args.delay_ms, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+import argparse
+import asyncio
+import time
+from typing import List
+
+import numpy as np
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.config import settings
+from src.db.vector import EMBEDDING_DISTANCE, EMBEDDING_INDEX_NAME, EMBEDDING_INDEX_TYPE
+from src.models.user import User
+from src.models.profile import Profile
+from src.repositories.profile import ProfileRepository
+
+BENCH_PREFIX = "bench_"
+INSERT_BATCH = 5000
+DIMENSIONS = 384
+
+
+def _random_embeddings(rng: np.random.Generator, count: int) -> np.ndarray:
+    vectors = rng.standard_normal((count, DIMENSIONS)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+async def _seeded_count(session: AsyncSession) -> int:
+    return await session.scalar(
+        select(func.count()).select_from(User).where(User.telegram_id.startswith(BENCH_PREFIX))
+    )
+
+
+async def seed_profiles(session: AsyncSession, target: int, rng: np.random.Generator) -> None:
+    existing = await _seeded_count(session)
+
+    for start in range(existing, target, INSERT_BATCH):
+        size = min(INSERT_BATCH, target - start)
+        user_ids = (
+            await session.execute(
+                insert(User).returning(User.id),
+                [
+                    {"telegram_id": f"{BENCH_PREFIX}{start + i}", "is_banned": False}
+                    for i in range(size)
+                ],
+            )
+        ).scalars().all()
+
+        embeddings = _random_embeddings(rng, size)
+        await session.execute(
+            insert(Profile),
+            [
+                {
+                    "user_id": user_id,
+                    "name": f"Bench {start + i}",
+                    "description": "benchmark profile",
+                    "media": [],
+                    "embedding": embeddings[i].tolist(),
+                    "is_active": True,
+                }
+                for i, user_id in enumerate(user_ids)
+            ],
+        )
+        await session.commit()
+        print(f"  seeded {start + size}/{target}")
+
+    await session.execute(text(f"REINDEX INDEX {EMBEDDING_INDEX_NAME}"))
+    await session.execute(text("ANALYZE profiles"))
+    await session.commit()
+
+
+async def measure_refills(session: AsyncSession, queries: int, rng: np.random.Generator) -> List[float]:
+    repo = ProfileRepository(session)
+    timings = []
+
+    for embedding in _random_embeddings(rng, queries):
+        started = time.perf_counter()
+        await repo.get_similar_profiles(
+            user_embedding=embedding.tolist(),
+            seen_user_ids=[],
+            limit=10,
+        )
+        timings.append((time.perf_counter() - started) * 1000)
+        await session.rollback()
+
+    return timings
+
+
+async def cleanup(session: AsyncSession) -> None:
+    await session.execute(delete(User).where(User.telegram_id.startswith(BENCH_PREFIX)))
+    await session.commit()
+
+
+async def run(sizes: List[int], queries: int, dsn: str, keep: bool) -> None:
+    engine = create_async_engine(dsn, echo=False)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    rng = np.random.default_rng(42)
+
+    print(
+        f"index={EMBEDDING_INDEX_TYPE} distance={EMBEDDING_DISTANCE} "
+        f"ef_search={settings.VECTOR_HNSW_EF_SEARCH} probes={settings.VECTOR_IVFFLAT_PROBES}"
+    )
+
+    try:
+        async with session_maker() as session:
+            for size in sorted(sizes):
+                print(f"Seeding {size} profiles...")
+                await seed_profiles(session, size, rng)
+
+                await measure_refills(session, min(queries, 20), rng)
+                timings = await measure_refills(session, queries, rng)
+
+                print(
+                    f"{size:>9} profiles: "
+                    f"p50={np.percentile(timings, 50):.2f}ms "
+                    f"p99={np.percentile(timings, 99):.2f}ms "
+                    f"max={max(timings):.2f}ms"
+                )
+
+            if not keep:
+                await cleanup(session)
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark swipe queue refill latency of the similarity query")
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dsn", default=settings.POSTGRES_DSN)
+    parser.add_argument("--keep", action="store_true", help="Keep seeded benchmark profiles")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    asyncio.run(run(sizes, args.queries, args.dsn, args.keep))
+
+
+if __name__ == "__main__":
+    main()
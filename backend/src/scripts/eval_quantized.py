@@ -0,0 +1,126 @@
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from typing import List
+
+import numpy as np
+
+from src.scripts.seed_data import TEST_PROFILES
+
+VARIANTS = {"fp32": False, "int8": True}
+
+
+def _corpus(size: int, seed: int) -> List[str]:
+    descriptions = [p["profile"]["description"] for p in TEST_PROFILES]
+    if size <= len(descriptions):
+        return descriptions[:size]
+
+    sentences = [
+        sentence.strip()
+        for description in descriptions
+        for sentence in description.replace("\n", ". ").split(". ")
+        if sentence.strip()
+    ]
+    rng = np.random.default_rng(seed)
+    corpus = list(descriptions)
+
+    while len(corpus) < size:
+        picked = rng.choice(len(sentences), size=rng.integers(2, 5), replace=False)
+        corpus.append(". ".join(sentences[i] for i in picked))
+
+    return corpus
+
+
+def _rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def encode_variant(variant: str, size: int, seed: int) -> dict:
+    from src.services.embedding import EmbeddingModel
+
+    texts = _corpus(size, seed)
+    baseline_rss = _rss_mb()
+
+    model = EmbeddingModel(quantized=VARIANTS[variant])
+    model.encode(texts[0])
+
+    embeddings = []
+    latencies = []
+    for text in texts:
+        started = time.perf_counter()
+        embeddings.append(model.encode(text))
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "embeddings": embeddings,
+        "latencies": latencies,
+        "rss_mb": _rss_mb(),
+        "model_rss_mb": _rss_mb() - baseline_rss,
+    }
+
+
+def _run_variant(variant: str, size: int, seed: int) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-m", "src.scripts.eval_quantized", "--worker", variant, "--size", str(size), "--seed", str(seed)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def _neighbors(queries: np.ndarray, corpus: np.ndarray, k: int) -> np.ndarray:
+    scores = queries @ corpus.T
+    np.fill_diagonal(scores, -np.inf)
+    return np.argsort(-scores, axis=1)[:, :k]
+
+
+def recall_at_k(reference: np.ndarray, candidate: np.ndarray) -> float:
+    hits = [len(set(ref) & set(cand)) / len(ref) for ref, cand in zip(reference, candidate)]
+    return float(np.mean(hits))
+
+
+def run(size: int, k: int, seed: int) -> None:
+    results = {variant: _run_variant(variant, size, seed) for variant in VARIANTS}
+
+    print(f"corpus={size} k={k} (seed profiles expanded with sentence recombinations)")
+    for variant, result in results.items():
+        latencies = result["latencies"]
+        print(
+            f"{variant:<5} "
+            f"p50={np.percentile(latencies, 50):6.2f}ms "
+            f"p99={np.percentile(latencies, 99):6.2f}ms "
+            f"rss={result['rss_mb']:7.1f}MB "
+            f"model_rss={result['model_rss_mb']:7.1f}MB"
+        )
+
+    fp32 = np.array(results["fp32"]["embeddings"], dtype=np.float32)
+    int8 = np.array(results["int8"]["embeddings"], dtype=np.float32)
+    reference = _neighbors(fp32, fp32, k)
+
+    print(f"recall@{k} int8 vs fp32:            {recall_at_k(reference, _neighbors(int8, int8, k)):.4f}")
+    print(f"recall@{k} int8 query, fp32 corpus: {recall_at_k(reference, _neighbors(int8, fp32, k)):.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare recall, latency and memory of the fp32 and int8 embedding models"
+    )
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--worker", choices=list(VARIANTS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(encode_variant(args.worker, args.size, args.seed)))
+        return
+
+    run(args.size, args.k, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import argparse
+from pathlib import Path
+
+from onnxruntime.quantization import QuantType, quantize_dynamic
+
+from src.core.model_files import MODEL_CACHE_DIR, MODEL_FILE, QUANTIZED_MODEL_FILE
+
+
+def quantize(source: Path, target: Path, per_channel: bool) -> None:
+    quantize_dynamic(
+        model_input=source,
+        model_output=target,
+        op_types_to_quantize=["MatMul", "Gather"],
+        weight_type=QuantType.QInt8,
+        per_channel=per_channel,
+    )
+
+    source_mb = source.stat().st_size / 1024 / 1024
+    target_mb = target.stat().st_size / 1024 / 1024
+    print(f"{source.name}: {source_mb:.1f}MB -> {target.name}: {target_mb:.1f}MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Produce a dynamically quantized INT8 copy of the embedding model")
+    parser.add_argument("--cache-dir", type=Path, default=MODEL_CACHE_DIR)
+    parser.add_argument("--per-channel", action="store_true")
+    args = parser.parse_args()
+
+    quantize(args.cache_dir / MODEL_FILE, args.cache_dir / QUANTIZED_MODEL_FILE, args.per_channel)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,10 @@ from src.repositories.profile import ProfileRepository
 from src.repositories.user import UserRepository
 from src.repositories.action import ActionRepository
 from src.repositories.match import MatchRepository
+from src.repositories.outbox import OutboxRepository
 from src.models.action import ActionTypeEnum
+from src.models.outbox import OutboxKindEnum
 from src.core.exceptions.action import ActionAlreadyRespondedException, SelfActionException
-from src.services.telegram import telegram_service
-from src.services.cache import cache
-from src.core.config import settings
 from src.core.logger import get_service_logger
 
 class ActionService:
@@ -17,241 +16,13 @@ class ActionService:
         self.__action_repo = ActionRepository(session)
         self.__match_repo = MatchRepository(session)
         self.__profile_repo = ProfileRepository(session)
+        self.__outbox_repo = OutboxRepository(session)
         self.logger = get_service_logger()
         self.logger.debug(
             "ActionService initialized",
             extra={"operation": "init"}
         )
 
-    async def _send_like_notification(self, to_user_id: int):
-        self.logger.debug(
-            "Sending like notification",
-            extra={
-                "operation": "_send_like_notification",
-                "to_user_id": to_user_id
-            }
-        )
-        
-        try:
-            to_user = await self.__user_repo.get(to_user_id)
-            
-            if not to_user or not to_user.telegram_id:
-                self.logger.debug(
-                    "User not found or no telegram_id, skipping notification",
-                    extra={
-                        "operation": "_send_like_notification",
-                        "to_user_id": to_user_id,
-                        "user_found": to_user is not None,
-                        "has_telegram_id": to_user.telegram_id if to_user else None
-                    }
-                )
-                return
-            
-            await telegram_service.notify_new_like(
-                chat_id=to_user.telegram_id,
-            )
-            
-            self.logger.debug(
-                "Like notification sent",
-                extra={
-                    "operation": "_send_like_notification",
-                    "to_user_id": to_user_id,
-                    "telegram_id": to_user.telegram_id
-                }
-            )
-            
-        except Exception as e:
-            self.logger.error(
-                "Failed to send like notification",
-                extra={
-                    "operation": "_send_like_notification",
-                    "to_user_id": to_user_id,
-                    "error_type": type(e).__name__,
-                    "error": str(e)
-                },
-                exc_info=True
-            )
-                
-    async def _send_match_notification(self, user1_id: int, user2_id: int):
-        self.logger.debug(
-            "Sending match notifications",
-            extra={
-                "operation": "_send_match_notification",
-                "user1_id": user1_id,
-                "user2_id": user2_id
-            }
-        )
-        
-        try:
-            user1 = await self.__user_repo.get(user1_id)
-            user2 = await self.__user_repo.get(user2_id)
-            
-            if user1 and user1.telegram_id:
-                await telegram_service.notify_new_match(
-                    chat_id=user1.telegram_id,
-                    matched_username=user2.username if user2 else None,
-                    matched_name=user2.first_name if user2 else None
-                )
-                self.logger.debug(
-                    "Match notification sent to user1",
-                    extra={
-                        "operation": "_send_match_notification",
-                        "user_id": user1_id,
-                        "telegram_id": user1.telegram_id
-                    }
-                )
-            
-            if user2 and user2.telegram_id:
-                await telegram_service.notify_new_match(
-                    chat_id=user2.telegram_id,
-                    matched_username=user1.username if user1 else None,
-                    matched_name=user1.first_name if user1 else None
-                )
-                self.logger.debug(
-                    "Match notification sent to user2",
-                    extra={
-                        "operation": "_send_match_notification",
-                        "user_id": user2_id,
-                        "telegram_id": user2.telegram_id
-                    }
-                )
-                
-        except Exception as e:
-            self.logger.error(
-                "Failed to send match notifications",
-                extra={
-                    "operation": "_send_match_notification",
-                    "user1_id": user1_id,
-                    "user2_id": user2_id,
-                    "error_type": type(e).__name__,
-                    "error": str(e)
-                },
-                exc_info=True
-            )
-    
-    async def _send_report_notification_to_admin(
-        self, 
-        from_user_id: int,
-        to_user_id: int,
-        report_reason: str
-    ):
-        self.logger.info(
-            "Processing report notification to admin",
-            extra={
-                "operation": "_send_report_notification_to_admin",
-                "from_user_id": from_user_id,
-                "to_user_id": to_user_id,
-                "report_reason": report_reason
-            }
-        )
-        
-        try:
-            profile = await self.__profile_repo.get_by_user_id(to_user_id)
-            reported_user = await self.__user_repo.get(to_user_id)
-            reporter_user = await self.__user_repo.get(from_user_id)
-            
-            if not profile or not reported_user:
-                self.logger.warning(
-                    "Profile or reported user not found for report",
-                    extra={
-                        "operation": "_send_report_notification_to_admin",
-                        "from_user_id": from_user_id,
-                        "to_user_id": to_user_id,
-                        "profile_found": profile is not None,
-                        "reported_user_found": reported_user is not None
-                    }
-                )
-                return
-            
-            gender_map = {
-                "male": "👨 Парень",
-                "female": "👩 Девушка",
-            }
-            gender_text = gender_map.get(profile.gender, profile.gender or "❓")
-            
-            desc_parts = profile.description.split('\n\n🏋️ Опыт тренировок:')
-            main_desc = desc_parts[0][:300] + ("..." if len(desc_parts[0]) > 300 else "")
-            experience = desc_parts[1] if len(desc_parts) > 1 else None
-            
-            reporter_name = (
-                f"@{reporter_user.username}" if reporter_user and reporter_user.username 
-                else f"ID: {reporter_user.telegram_id}" if reporter_user 
-                else "Неизвестно"
-            )
-            reported_name = (
-                f"@{reported_user.username}" if reported_user.username 
-                else f"ID: {reported_user.telegram_id}"
-            )
-            
-            caption = (
-                f"⚠️ <b>НОВАЯ ЖАЛОБА</b>\n\n"
-                f"🔍 <b>Информация:</b>\n"
-                f"• 📢 Пожаловался: {reporter_name}\n"
-                f"• 👤 На пользователя: {reported_name}\n"
-                f"• 📋 Причина: {report_reason}\n\n"
-                f"📝 <b>Профиль:</b>\n"
-                f"• Имя: {profile.name}\n"
-                f"• Возраст: {profile.age or '?'}\n"
-                f"• Пол: {gender_text}\n"
-                f"• Описание: <code>{main_desc}</code>\n"
-                f"{f'• Опыт: {experience}\n' if experience else ''}"
-                f"• USER_ID: <code>{to_user_id}</code>\n"
-                f"• Telegram ID: <code>{reported_user.telegram_id}</code>"
-            )
-            
-            media_payload = []
-            
-            if profile.media:
-                for media in profile.media[:3]:
-                    media_payload.append({
-                        "type": media.type,
-                        "media": media.file_id,
-                    })
-            
-            if media_payload:
-                await telegram_service.send_media_group(
-                    chat_id=settings.ADMIN_TELEGRAM_ID,
-                    media_items=media_payload,
-                    caption=caption,
-                    parse_mode="HTML"
-                )
-                self.logger.debug(
-                    "Report sent with media",
-                    extra={
-                        "operation": "_send_report_notification_to_admin",
-                        "from_user_id": from_user_id,
-                        "to_user_id": to_user_id,
-                        "media_count": len(media_payload)
-                    }
-                )
-            else:
-                await telegram_service.send_message(
-                    chat_id=settings.ADMIN_TELEGRAM_ID,
-                    text=caption,
-                    parse_mode="HTML"
-                )
-                self.logger.debug(
-                    "Report sent without media",
-                    extra={
-                        "operation": "_send_report_notification_to_admin",
-                        "from_user_id": from_user_id,
-                        "to_user_id": to_user_id
-                    }
-                )
-                
-        except Exception as e:
-            self.logger.error(
-                "Failed to send report notification to admin",
-                extra={
-                    "operation": "_send_report_notification_to_admin",
-                    "from_user_id": from_user_id,
-                    "to_user_id": to_user_id,
-                    "error_type": type(e).__name__,
-                    "error": str(e)
-                },
-                exc_info=True
-            )
-
     async def send_action(
         self, 
         from_user_id: int, 
@@ -300,11 +71,11 @@ class ActionService:
                 }
             )
             
-            await cache.add_seen_user_id(from_user_id, to_user_id)
-            await cache.add_seen_user_id(to_user_id, from_user_id)
+            self.__outbox_repo.add(OutboxKindEnum.seen, user_id=from_user_id, seen_user_id=to_user_id)
+            self.__outbox_repo.add(OutboxKindEnum.seen, user_id=to_user_id, seen_user_id=from_user_id)
             
             self.logger.debug(
-                "Users added to seen cache",
+                "Seen updates added to outbox",
                 extra={
                     "operation": "send_action",
                     "from_user_id": from_user_id,
@@ -313,7 +84,7 @@ class ActionService:
             )
 
             if action_type == ActionTypeEnum.like:
-                await self._send_like_notification(to_user_id)                    
+                self.__outbox_repo.add(OutboxKindEnum.like, user_id=to_user_id)
             elif action_type == ActionTypeEnum.report and report_reason:
                 self.logger.info(
                     "Report action processed",
@@ -324,10 +95,11 @@ class ActionService:
                         "report_reason": report_reason
                     }
                 )
-                await self._send_report_notification_to_admin(
-                    from_user_id,
-                    to_user_id,
-                    report_reason
+                self.__outbox_repo.add(
+                    OutboxKindEnum.report,
+                    from_user_id=from_user_id,
+                    to_user_id=to_user_id,
+                    report_reason=report_reason
                 )
             
             return {
@@ -433,10 +205,10 @@ class ActionService:
                 }
             )
             
-            await cache.add_seen_user_id(viewer_user_id, target_user_id)
+            self.__outbox_repo.add(OutboxKindEnum.seen, user_id=viewer_user_id, seen_user_id=target_user_id)
             
             self.logger.debug(
-                "User added to seen cache",
+                "Seen update added to outbox",
                 extra={
                     "operation": "decide_on_incoming",
                     "viewer_user_id": viewer_user_id,
@@ -457,12 +229,14 @@ class ActionService:
                         "user2_id": target_user_id
                     }
                 )
-                await self._send_match_notification(viewer_user_id, target_user_id)
+                self.__outbox_repo.add(OutboxKindEnum.match, user_id=viewer_user_id, matched_user_id=target_user_id)
+                self.__outbox_repo.add(OutboxKindEnum.match, user_id=target_user_id, matched_user_id=viewer_user_id)
                 result["match"] = match
                 result["match_id"] = match.id
             
             if decision_type == ActionTypeEnum.report:
-                await self._send_report_notification_to_admin(
+                self.__outbox_repo.add(
+                    OutboxKindEnum.report,
                     from_user_id=viewer_user_id,
                     to_user_id=target_user_id,
                     report_reason=report_reason
@@ -497,9 +271,9 @@ class ActionService:
         )
         
         try:
-            action = await self.__action_repo.get_next_incoming_like(user_id)
+            incoming = await self.__action_repo.get_next_incoming_like(user_id)
             
-            if not action:
+            if not incoming:
                 self.logger.debug(
                     "No incoming likes found",
                     extra={
@@ -509,19 +283,7 @@ class ActionService:
                 )
                 raise NoMoreProfilesException()
             
-            profile = await self.__profile_repo.get_by_user_id(action.from_user_id)
-            
-            if not profile or not profile.is_active:
-                self.logger.debug(
-                    "Profile is not active, skipping",
-                    extra={
-                        "operation": "get_next_incoming_like",
-                        "user_id": user_id,
-                        "from_user_id": action.from_user_id,
-                        "profile_id": profile.id if profile else None
-                    }
-                )
-                raise NoMoreProfilesException()
+            action, profile = incoming
             
             self.logger.debug(
                 "Found active profile for incoming like",
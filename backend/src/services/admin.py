@@ -1,32 +1,42 @@
-import asyncio
-from typing import Optional
+from typing import AsyncIterator, Awaitable, Callable, Optional, Protocol
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.repositories.admin import AdminRepository
 from src.core.exceptions.user import UserNotFound
-from src.core.exceptions.admin import InvalidPermissions
-from src.models.user import User
+from src.core.exceptions.admin import BroadcastJobNotFound, InvalidPermissions, UnsupportedExportOption
+from src.models.broadcast import BroadcastJob, BroadcastStatusEnum
+from src.repositories.broadcast import BroadcastJobRepository
 from src.repositories.profile import ProfileRepository
 from src.repositories.user import UserRepository
+from src.services.broadcast import BroadcastEngine
 from src.services.cache import cache
-from src.services.telegram import telegram_service
+from src.db.session import after_commit
+from src.services.export import EXPORT_FORMATS, ExportFormat
+from src.services.telegram import DeliveryResult, telegram_service
 from src.core.config import settings
 from src.core.logger import get_service_logger
 import secrets
-import uuid
 
+class Identity(Protocol):
+    @property
+    def id(self) -> int: ...
+
+    @property
+    def telegram_id(self) -> str: ...
 
 class AdminService:
     def __init__(self, session: AsyncSession):
+        self.__session = session
         self.__user_repo = UserRepository(session)
         self.__profile_repo = ProfileRepository(session)
         self.__admin_repo = AdminRepository(session)
+        self.__broadcast_repo = BroadcastJobRepository(session)
         self.logger = get_service_logger()
         self.logger.debug(
             "AdminService initialized",
             extra={"operation": "init"}
         )
 
-    async def _ensure_permissions(self, user: User):
+    async def _ensure_permissions(self, user: Identity):
         self.logger.debug(
             "Checking admin permissions",
             extra={
@@ -59,7 +69,7 @@ class AdminService:
             }
         )
 
-    async def ban_user(self, user_id: int, admin: User):
+    async def ban_user(self, user_id: int, admin: Identity):
         self.logger.info(
             "Ban user requested",
             extra={
@@ -94,6 +104,7 @@ class AdminService:
                 raise InvalidPermissions()
 
             await self.__user_repo.update(user, is_banned=True)
+            after_commit(self.__session, lambda: cache.invalidate_auth(user_id))
             self.logger.info(
                 "User banned successfully",
                 extra={
@@ -131,52 +142,87 @@ class AdminService:
             )
             raise
     
-    async def export_profiles_to_csv(
+    async def export_profiles(
         self,
-        admin: User,
-        limit: int = 1000,
-        offset: int = 0,
+        admin: Identity,
+        export_format: ExportFormat = "csv",
+        include_embedding: bool = False,
+        limit: Optional[int] = None,
+        after_id: int = 0,
         is_active: Optional[bool] = None,
-    ) -> str:
+    ) -> AsyncIterator[bytes]:
         self.logger.info(
-            "Export profiles to CSV requested",
+            "Export profiles requested",
             extra={
-                "operation": "export_profiles_to_csv",
+                "operation": "export_profiles",
                 "admin_id": admin.id,
+                "format": export_format,
+                "include_embedding": include_embedding,
                 "limit": limit,
-                "offset": offset,
+                "after_id": after_id,
                 "is_active": is_active
             }
         )
         
+        await self._ensure_permissions(admin)
+        
+        if include_embedding and export_format == "csv":
+            raise UnsupportedExportOption("Embeddings can only be exported as ndjson, arrow or parquet")
+        
+        rows = self.__admin_repo.iter_profile_rows(
+            batch_size=settings.EXPORT_BATCH_SIZE,
+            limit=limit,
+            after_id=after_id,
+            is_active=is_active,
+            include_embedding=include_embedding
+        )
+        
+        _, _, encode = EXPORT_FORMATS[export_format]
+        return encode(rows, include_embedding)
+
+    async def create_broadcast(
+        self,
+        admin: Identity,
+        admin_chat_id: int | str,
+        message_text: str
+    ) -> BroadcastJob:
+        self.logger.info(
+            "Broadcast requested",
+            extra={
+                "operation": "create_broadcast",
+                "admin_id": admin.id,
+                "admin_chat_id": admin_chat_id,
+                "message_length": len(message_text)
+            }
+        )
+        
         try:
             await self._ensure_permissions(admin)
             
-            csv_data = await self.__admin_repo.export_profiles_to_csv(
-                limit,
-                offset,
-                is_active
+            job = await self.__broadcast_repo.create(
+                admin_id=admin.id,
+                admin_chat_id=str(admin_chat_id),
+                message_text=message_text
             )
             
             self.logger.info(
-                "Profiles exported successfully",
+                "Broadcast job queued",
                 extra={
-                    "operation": "export_profiles_to_csv",
-                    "admin_id": admin.id,
-                    "csv_size_bytes": len(csv_data),
-                    "estimated_rows": csv_data.count('\n') - 1
+                    "operation": "create_broadcast",
+                    "job_id": job.id,
+                    "admin_id": admin.id
                 }
             )
             
-            return csv_data
+            return job
             
         except InvalidPermissions:
             raise
         except Exception as e:
             self.logger.error(
-                "Failed to export profiles",
+                "Failed to queue broadcast",
                 extra={
-                    "operation": "export_profiles_to_csv",
+                    "operation": "create_broadcast",
                     "admin_id": admin.id,
                     "error_type": type(e).__name__,
                     "error": str(e)
@@ -185,186 +231,105 @@ class AdminService:
             )
             raise
 
-    async def run_broadcast_task(
-        self,
-        admin: User,
-        admin_chat_id: int,
-        message_text: str,
-        batch_size: int = 50,
-        delay_between: float = 1.0,
-    ):
-        self.logger.info(
-            "Broadcast task requested",
+    async def get_broadcast(self, admin: Identity, job_id: int) -> BroadcastJob:
+        self.logger.debug(
+            "Getting broadcast job",
             extra={
-                "operation": "run_broadcast_task",
+                "operation": "get_broadcast",
                 "admin_id": admin.id,
-                "admin_chat_id": admin_chat_id,
-                "message_length": len(message_text),
-                "batch_size": batch_size,
-                "delay_between": delay_between
+                "job_id": job_id
             }
         )
         
-        try:
-            await self._ensure_permissions(admin)
-            
-            task_id = str(uuid.uuid4())[:8]
-            self.logger.info(
-                f"Broadcast task started",
-                extra={
-                    "operation": "run_broadcast_task",
-                    "task_id": task_id,
-                    "admin_id": admin.id
-                }
-            )
-            
-            stats = {
-                "total": 0,
-                "sent": 0,
-                "failed": 0,
-                "blocked": 0,
+        await self._ensure_permissions(admin)
+        
+        job = await self.__broadcast_repo.get(job_id)
+        if not job:
+            raise BroadcastJobNotFound(job_id)
+        
+        return job
+
+    async def run_broadcast_job(
+        self,
+        job: BroadcastJob,
+        on_checkpoint: Callable[[], Awaitable[None]],
+        batch_size: int = settings.BROADCAST_BATCH_SIZE,
+    ) -> dict:
+        self.logger.info(
+            "Broadcast job started",
+            extra={
+                "operation": "run_broadcast_job",
+                "job_id": job.id,
+                "last_user_id": job.last_user_id,
+                "current_stats": job.stats,
+                "batch_size": batch_size
             }
-            
-            offset = 0
-            batch_num = 1
-            
-            while True:
-                self.logger.debug(
-                    f"Processing batch {batch_num}",
-                    extra={
-                        "operation": "run_broadcast_task",
-                        "task_id": task_id,
-                        "batch_number": batch_num,
-                        "offset": offset,
-                        "batch_size": batch_size
-                    }
-                )
-                
-                users = await self.__user_repo.get_active_telegram_ids(
-                    limit=batch_size,
-                    offset=offset
-                )
-                
-                if not users:
-                    self.logger.debug(
-                        "No more users to process",
-                        extra={
-                            "operation": "run_broadcast_task",
-                            "task_id": task_id,
-                            "batch_number": batch_num
-                        }
-                    )
-                    break
-                
-                for user in users:
-                    telegram_id = user[0]
-                    stats["total"] += 1
-                                    
-                    try:
-                        success = await telegram_service.send_message(
-                            chat_id=telegram_id,
-                            text=message_text,
-                            parse_mode="HTML"
-                        )
-                        
-                        if success:
-                            stats["sent"] += 1
-                            self.logger.debug(
-                                f"Message sent to {telegram_id}",
-                                extra={
-                                    "operation": "run_broadcast_task",
-                                    "task_id": task_id,
-                                    "telegram_id": telegram_id,
-                                    "status": "sent"
-                                }
-                            )
-                        else:
-                            if "bot was blocked" in str(stats.get("last_error", "")).lower():
-                                stats["blocked"] += 1
-                                status = "blocked"
-                            else:
-                                stats["failed"] += 1
-                                status = "failed"
-                            
-                            self.logger.warning(
-                                f"Failed to send to {telegram_id}",
-                                extra={
-                                    "operation": "run_broadcast_task",
-                                    "task_id": task_id,
-                                    "telegram_id": telegram_id,
-                                    "status": status
-                                }
-                            )
-                                
-                    except Exception as e:
-                        stats["failed"] += 1
-                        error_msg = str(e).lower()
-                        if "blocked" in error_msg or "forbidden" in error_msg:
-                            stats["blocked"] += 1
-                            status = "blocked"
-                        else:
-                            status = "error"
-                        
-                        self.logger.warning(
-                            f"Exception sending to {telegram_id}",
-                            extra={
-                                "operation": "run_broadcast_task",
-                                "task_id": task_id,
-                                "telegram_id": telegram_id,
-                                "status": status,
-                                "error": str(e)
-                            }
-                        )
-                    
-                    await asyncio.sleep(0.1)
-                
-                offset += batch_size
-                batch_num += 1
-                
-                self.logger.info(
-                    f"Batch {batch_num-1} completed",
-                    extra={
-                        "operation": "run_broadcast_task",
-                        "task_id": task_id,
-                        "batch_number": batch_num-1,
-                        "current_stats": stats
-                    }
-                )
-                
-                if users:
-                    await asyncio.sleep(delay_between)
-            
-            await self._send_broadcast_stats_to_admin(
-                admin_chat_id=admin_chat_id,
-                task_id=task_id,
-                stats=stats,
-                message_preview=message_text[:100]
+        )
+        
+        async def send(chat_id: str) -> DeliveryResult:
+            return await telegram_service.deliver_message(
+                chat_id=chat_id,
+                text=job.message_text,
+                parse_mode="HTML"
             )
-            
+
+        async def report_progress(current_stats: dict):
             self.logger.info(
-                f"Broadcast task completed",
+                "Broadcast progress",
                 extra={
-                    "operation": "run_broadcast_task",
-                    "task_id": task_id,
-                    "admin_id": admin.id,
-                    "final_stats": stats
+                    "operation": "run_broadcast_job",
+                    "job_id": job.id,
+                    "current_stats": current_stats
                 }
             )
 
-        except InvalidPermissions:
-            raise
+        engine = BroadcastEngine(send, on_progress=report_progress, stats=job.stats)
+        engine.start()
+        
+        try:
+            async for rows in self.__user_repo.iter_active_telegram_ids(
+                batch_size=batch_size,
+                after_id=job.last_user_id
+            ):
+                await engine.send_batch(telegram_id for _, telegram_id in rows)
+                await self.__broadcast_repo.checkpoint(job, rows[-1][0], engine.stats)
+                await on_checkpoint()
         except Exception as e:
             self.logger.error(
-                "Broadcast task failed",
+                "Broadcast job interrupted",
                 extra={
-                    "operation": "run_broadcast_task",
-                    "admin_id": admin.id,
+                    "operation": "run_broadcast_job",
+                    "job_id": job.id,
+                    "last_user_id": job.last_user_id,
                     "error_type": type(e).__name__,
                     "error": str(e)
                 },
                 exc_info=True
             )
             raise
+        finally:
+            await engine.stop()
+        
+        await self.__broadcast_repo.finish(job, BroadcastStatusEnum.completed)
+        await on_checkpoint()
+        
+        await self._send_broadcast_stats_to_admin(
+            admin_chat_id=job.admin_chat_id,
+            task_id=str(job.id),
+            stats=engine.stats,
+            message_preview=job.message_text[:100]
+        )
+        
+        self.logger.info(
+            "Broadcast job completed",
+            extra={
+                "operation": "run_broadcast_job",
+                "job_id": job.id,
+                "final_stats": engine.stats
+            }
+        )
+        
+        return engine.stats
 
     async def _send_broadcast_stats_to_admin(
         self,
@@ -0,0 +1,202 @@
+import asyncio
+import time
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Optional
+from src.core.config import settings
+from src.core.logger import get_service_logger
+from src.services.telegram import DeliveryResult
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.__rate = rate
+        self.__capacity = capacity or rate
+        self.__tokens = self.__capacity
+        self.__updated = time.monotonic()
+        self.__lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.__tokens = min(self.__capacity, self.__tokens + (now - self.__updated) * self.__rate)
+        self.__updated = now
+
+    async def acquire(self):
+        async with self.__lock:
+            while True:
+                self._refill()
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.__tokens) / self.__rate)
+
+    def drain(self, hold: float = 0.0):
+        self._refill()
+        self.__tokens = min(self.__tokens, -hold * self.__rate)
+
+class PerChatLimiter:
+    def __init__(self, interval: float, max_tracked: int = 10000):
+        self.__interval = interval
+        self.__max_tracked = max_tracked
+        self.__next_allowed: dict[str, float] = {}
+
+    async def acquire(self, chat_id: str):
+        now = time.monotonic()
+        wait = self.__next_allowed.get(chat_id, now) - now
+        self.__next_allowed[chat_id] = max(now, self.__next_allowed.get(chat_id, now)) + self.__interval
+
+        if len(self.__next_allowed) > self.__max_tracked:
+            self.__next_allowed = {
+                key: value for key, value in self.__next_allowed.items() if value > now
+            }
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+class BroadcastEngine:
+    def __init__(
+        self,
+        send: Callable[[str], Awaitable[DeliveryResult]],
+        concurrency: int = settings.BROADCAST_CONCURRENCY,
+        rate: float = settings.BROADCAST_RATE_PER_SECOND,
+        per_chat_interval: float = settings.BROADCAST_PER_CHAT_INTERVAL,
+        max_retries: int = settings.BROADCAST_MAX_RETRIES,
+        progress_every: int = settings.BROADCAST_PROGRESS_EVERY,
+        on_progress: Optional[Callable[[dict], Awaitable[None]]] = None,
+        stats: Optional[dict] = None,
+    ):
+        self.__send = send
+        self.__concurrency = concurrency
+        self.__bucket = TokenBucket(rate)
+        self.__per_chat = PerChatLimiter(per_chat_interval)
+        self.__max_retries = max_retries
+        self.__progress_every = progress_every
+        self.__on_progress = on_progress
+        self.__paused_until = 0.0
+        self.__queue: asyncio.Queue | None = None
+        self.__workers: list[asyncio.Task] = []
+        self.logger = get_service_logger()
+        self.stats = {
+            "total": 0,
+            "sent": 0,
+            "failed": 0,
+            "blocked": 0,
+            "retried": 0,
+        }
+        if stats:
+            self.stats.update(stats)
+
+    async def _wait_if_paused(self):
+        while (delay := self.__paused_until - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+
+    def _pause(self, seconds: float):
+        self.__paused_until = max(self.__paused_until, time.monotonic() + seconds)
+        self.__bucket.drain(self.__paused_until - time.monotonic())
+
+    async def _deliver(self, chat_id: str) -> DeliveryResult:
+        attempt = 0
+
+        while True:
+            await self._wait_if_paused()
+            await self.__per_chat.acquire(chat_id)
+            await self.__bucket.acquire()
+
+            result = await self.__send(chat_id)
+            if result.ok or not result.retryable or attempt >= self.__max_retries:
+                return result
+
+            attempt += 1
+            self.stats["retried"] += 1
+
+            if result.retry_after is not None:
+                self.logger.warning(
+                    "Telegram flood limit hit, pausing broadcast",
+                    extra={
+                        "operation": "_deliver",
+                        "chat_id": chat_id,
+                        "retry_after": result.retry_after,
+                        "attempt": attempt
+                    }
+                )
+                self._pause(result.retry_after)
+            else:
+                await asyncio.sleep(min(2 ** attempt, 30))
+
+    async def _record(self, result: DeliveryResult):
+        self.stats["total"] += 1
+        if result.ok:
+            self.stats["sent"] += 1
+        elif result.blocked:
+            self.stats["blocked"] += 1
+        else:
+            self.stats["failed"] += 1
+
+        if self.stats["total"] % self.__progress_every == 0:
+            await self._report_progress()
+
+    async def _report_progress(self):
+        if self.__on_progress is None:
+            return
+        try:
+            await self.__on_progress(dict(self.stats))
+        except Exception as e:
+            self.logger.warning(
+                "Broadcast progress callback failed",
+                extra={
+                    "operation": "_report_progress",
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                }
+            )
+
+    async def _worker(self, queue: asyncio.Queue):
+        while True:
+            chat_id = await queue.get()
+            try:
+                result = await self._deliver(chat_id)
+            except Exception as e:
+                self.logger.error(
+                    "Broadcast delivery failed",
+                    extra={
+                        "operation": "_worker",
+                        "chat_id": chat_id,
+                        "error_type": type(e).__name__,
+                        "error": str(e)
+                    },
+                    exc_info=True
+                )
+                result = DeliveryResult(ok=False, error=str(e))
+
+            try:
+                await self._record(result)
+            finally:
+                queue.task_done()
+
+    def start(self):
+        self.__queue = asyncio.Queue(maxsize=self.__concurrency * 2)
+        self.__workers = [
+            asyncio.create_task(self._worker(self.__queue))
+            for _ in range(self.__concurrency)
+        ]
+
+    async def send_batch(self, chat_ids: Iterable[str]):
+        for chat_id in chat_ids:
+            await self.__queue.put(str(chat_id))
+        await self.__queue.join()
+
+    async def stop(self):
+        for worker in self.__workers:
+            worker.cancel()
+        await asyncio.gather(*self.__workers, return_exceptions=True)
+        self.__workers = []
+
+        if self.stats["total"] % self.__progress_every != 0:
+            await self._report_progress()
+
+    async def run(self, batches: AsyncIterator[Iterable[str]]) -> dict:
+        self.start()
+        try:
+            async for batch in batches:
+                await self.send_batch(batch)
+        finally:
+            await self.stop()
+
+        return self.stats
@@ -1,21 +1,195 @@
+import base64
 import json
+import time
 import redis.asyncio as redis
-from typing import List, Optional
+from array import array
+from typing import List, Optional, Tuple
 from src.core.config import settings
 from src.core.logger import get_cache_logger
 
+POP_NEXT_PROFILE_SCRIPT = """
+if (redis.call('LINDEX', KEYS[1], 0) or '') ~= ARGV[9] then
+    return -1
+end
+
+local profile_id = redis.call('LPOP', KEYS[1])
+local remaining = redis.call('LLEN', KEYS[1])
+
+local now = tonumber(ARGV[4])
+local last = tonumber(redis.call('HGET', KEYS[5], 'last') or '0')
+local rate = tonumber(redis.call('HGET', KEYS[5], 'rate') or '0')
+if last > 0 then
+    local gap = math.max(now - last, 0.1)
+    if gap < tonumber(ARGV[7]) then
+        rate = rate + tonumber(ARGV[6]) * (1 / gap - rate)
+    else
+        rate = rate / 2
+    end
+end
+redis.call('HSET', KEYS[5], 'last', ARGV[4], 'rate', tostring(rate))
+redis.call('HINCRBY', KEYS[5], 'swipes', 1)
+redis.call('EXPIRE', KEYS[5], ARGV[8])
+
+redis.call('ZADD', KEYS[4], ARGV[4], ARGV[5])
+
+if not profile_id then
+    return false
+end
+
+if remaining < tonumber(ARGV[2]) then
+    redis.call('XADD', KEYS[3], 'MAXLEN', '~', ARGV[3], '*', 'user_id', ARGV[5], 'remaining', remaining)
+end
+
+local profile = redis.call('HGETALL', KEYS[6])
+local user_id = nil
+local is_active = nil
+for i = 1, #profile, 2 do
+    if profile[i] == 'user_id' then
+        user_id = profile[i + 1]
+    elseif profile[i] == 'is_active' then
+        is_active = profile[i + 1]
+    end
+end
+
+if user_id and is_active == 'True' then
+    redis.call('SADD', KEYS[2], user_id)
+    redis.call('EXPIRE', KEYS[2], ARGV[1])
+end
+
+return {profile_id, profile}
+"""
+
+INVALIDATE_AUTH_SCRIPT = """
+local telegram_id = redis.call('GET', KEYS[1])
+if telegram_id then
+    redis.call('DEL', ARGV[1] .. telegram_id)
+end
+redis.call('DEL', KEYS[1])
+return telegram_id
+"""
+
+COALESCE_LIKE_SCRIPT = """
+local decided = redis.call('GET', KEYS[4])
+if decided then
+    return tonumber(decided)
+end
+
+local send_now = 0
+if redis.call('SET', KEYS[1], '1', 'NX', 'PX', ARGV[2]) then
+    send_now = 1
+else
+    redis.call('INCR', KEYS[2])
+    redis.call('PEXPIRE', KEYS[2], ARGV[3])
+    local flush_at = tonumber(ARGV[4]) + math.max(redis.call('PTTL', KEYS[1]), 0) / 1000
+    redis.call('ZADD', KEYS[3], 'NX', flush_at, ARGV[1])
+end
+
+redis.call('SET', KEYS[4], send_now, 'EX', ARGV[5])
+return send_now
+"""
+
+CLAIM_DUE_LIKE_DIGESTS_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+local digests = {}
+for _, user_id in ipairs(due) do
+    local count = redis.call('GET', ARGV[3] .. user_id)
+    if count then
+        redis.call('ZADD', KEYS[1], 'XX', tonumber(ARGV[1]) + tonumber(ARGV[4]), user_id)
+        table.insert(digests, user_id)
+        table.insert(digests, count)
+    else
+        redis.call('ZREM', KEYS[1], user_id)
+    end
+end
+return digests
+"""
+
+ACK_LIKE_DIGESTS_SCRIPT = """
+for i = 5, #ARGV, 2 do
+    local user_id = ARGV[i]
+    local count_key = ARGV[2] .. user_id
+    local remaining = redis.call('DECRBY', count_key, ARGV[i + 1])
+    redis.call('SET', ARGV[3] .. user_id, '1', 'PX', ARGV[4])
+    if remaining > 0 then
+        redis.call('PEXPIRE', count_key, tonumber(ARGV[4]) * 2)
+        redis.call('ZADD', KEYS[1], tonumber(ARGV[1]) + tonumber(ARGV[4]) / 1000, user_id)
+    else
+        redis.call('DEL', count_key)
+        redis.call('ZREM', KEYS[1], user_id)
+    end
+end
+return 1
+"""
+
+ENQUEUE_PROFILES_SCRIPT = """
+if ARGV[3] ~= '' then
+    redis.call('SADD', KEYS[2], ARGV[3])
+    redis.call('EXPIRE', KEYS[2], ARGV[2])
+    redis.call('LREM', KEYS[1], 0, ARGV[4])
+end
+
+local queued = {}
+for _, profile_id in ipairs(redis.call('LRANGE', KEYS[1], 0, -1)) do
+    queued[profile_id] = true
+end
+
+local added = 0
+for i = 5, #ARGV, 2 do
+    local profile_id = ARGV[i]
+    if not queued[profile_id] and redis.call('SISMEMBER', KEYS[2], ARGV[i + 1]) == 0 then
+        redis.call('RPUSH', KEYS[1], profile_id)
+        queued[profile_id] = true
+        added = added + 1
+    end
+end
+
+if added > 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return added
+"""
+
 class Cache:
+    SWIPE_EVENTS_KEY = "swipe:events"
+    ACTIVE_USERS_KEY = "swipe:active"
+    LIKE_DIGESTS_KEY = "notify:like:pending"
+    POP_ATTEMPTS = 3
+
     def __init__(
         self,
         redis_url: str, 
         queue_ttl: int = 3600,
         profile_ttl: int = 900,
         seen_ttl: int = 86400,
+        embedding_ttl: int = 2592000,
+        auth_ttl: int = 30,
+        feed_low_watermark: int = 5,
+        feed_stream_maxlen: int = 100000,
+        swipe_rate_alpha: float = 0.3,
+        swipe_session_gap: int = 300,
+        stats_ttl: int = 86400,
+        like_digest_window: int = 300,
+        like_event_ttl: int = 86400,
     ):
         self.__redis = redis.from_url(redis_url, decode_responses=True)
         self.__queue_ttl = queue_ttl
         self.__profile_ttl = profile_ttl
         self.__seen_ttl = seen_ttl
+        self.__embedding_ttl = embedding_ttl
+        self.__auth_ttl = auth_ttl
+        self.__feed_low_watermark = feed_low_watermark
+        self.__feed_stream_maxlen = feed_stream_maxlen
+        self.__swipe_rate_alpha = swipe_rate_alpha
+        self.__swipe_session_gap = swipe_session_gap
+        self.__stats_ttl = stats_ttl
+        self.__like_digest_window = like_digest_window
+        self.__like_event_ttl = like_event_ttl
+        self.__pop_next_profile = self.__redis.register_script(POP_NEXT_PROFILE_SCRIPT)
+        self.__invalidate_auth = self.__redis.register_script(INVALIDATE_AUTH_SCRIPT)
+        self.__coalesce_like = self.__redis.register_script(COALESCE_LIKE_SCRIPT)
+        self.__claim_due_like_digests = self.__redis.register_script(CLAIM_DUE_LIKE_DIGESTS_SCRIPT)
+        self.__ack_like_digests = self.__redis.register_script(ACK_LIKE_DIGESTS_SCRIPT)
+        self.__enqueue_profiles = self.__redis.register_script(ENQUEUE_PROFILES_SCRIPT)
         self.logger = get_cache_logger()
         self.logger.debug(
             "Cache initialized",
@@ -24,13 +198,23 @@ class Cache:
                 "redis_url": redis_url,
                 "queue_ttl": queue_ttl,
                 "profile_ttl": profile_ttl,
-                "seen_ttl": seen_ttl
+                "seen_ttl": seen_ttl,
+                "embedding_ttl": embedding_ttl,
+                "auth_ttl": auth_ttl,
+                "feed_low_watermark": feed_low_watermark
             }
         )
     
     def _queue_key(self, user_id: int) -> str:
         return f"swipe:queue:{user_id}"
     
+    def _replace_queue(self, pipe, queue_key: str, profile_ids: List[int]):
+        pipe.delete(queue_key)
+        
+        if profile_ids:
+            pipe.rpush(queue_key, *[str(id) for id in profile_ids])
+            pipe.expire(queue_key, self.__queue_ttl)
+    
     async def fill_queue(self, user_id: int, profile_ids: List[int]):
         self.logger.debug(
             "Filling queue",
@@ -43,12 +227,12 @@ class Cache:
         
         try:
             queue_key = self._queue_key(user_id)
-            await self.__redis.delete(queue_key)
+            
+            async with self.__redis.pipeline(transaction=True) as pipe:
+                self._replace_queue(pipe, queue_key, profile_ids)
+                await pipe.execute()
             
             if profile_ids:
-                await self.__redis.rpush(queue_key, *[str(id) for id in profile_ids])
-                await self.__redis.expire(queue_key, self.__queue_ttl)
-                
                 self.logger.debug(
                     f"Queue filled with {len(profile_ids)} profiles",
                     extra={
@@ -126,7 +310,138 @@ class Cache:
                 exc_info=True
             )
             raise
+    
+    async def pop_next_profile(self, user_id: int) -> Tuple[Optional[int], Optional[dict]]:
+        self.logger.debug(
+            "Popping next profile",
+            extra={
+                "operation": "pop_next_profile",
+                "user_id": user_id
+            }
+        )
+        
+        try:
+            queue_key = self._queue_key(user_id)
+            for _ in range(self.POP_ATTEMPTS):
+                head = await self.__redis.lindex(queue_key, 0)
+                result = await self.__pop_next_profile(
+                    keys=[
+                        queue_key,
+                        self._seen_key(user_id),
+                        self.SWIPE_EVENTS_KEY,
+                        self.ACTIVE_USERS_KEY,
+                        self._stats_key(user_id),
+                        self._profile_key(head or "")
+                    ],
+                    args=[
+                        self.__seen_ttl,
+                        self.__feed_low_watermark,
+                        self.__feed_stream_maxlen,
+                        time.time(),
+                        user_id,
+                        self.__swipe_rate_alpha,
+                        self.__swipe_session_gap,
+                        self.__stats_ttl,
+                        head or ""
+                    ]
+                )
+                if result != -1:
+                    break
+            else:
+                result = None
+            
+            if not result:
+                self.logger.debug(
+                    "Queue is empty",
+                    extra={
+                        "operation": "pop_next_profile",
+                        "user_id": user_id
+                    }
+                )
+                return None, None
+            
+            profile_id, fields = result
+            data = dict(zip(fields[::2], fields[1::2]))
+            profile = self._parse_profile(data) if data else None
+            
+            self.logger.debug(
+                f"Popped profile {profile_id} from queue",
+                extra={
+                    "operation": "pop_next_profile",
+                    "user_id": user_id,
+                    "profile_id": int(profile_id),
+                    "cached": profile is not None
+                }
+            )
+            
+            return int(profile_id), profile
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to pop next profile",
+                extra={
+                    "operation": "pop_next_profile",
+                    "user_id": user_id,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
+
+    def _stats_key(self, user_id: int) -> str:
+        return f"swipe:stats:{user_id}"
 
+    def _parse_stats(self, data: dict) -> dict:
+        return {
+            'rate': float(data.get('rate') or 0),
+            'swipes': int(data.get('swipes') or 0),
+            'refills': int(data.get('refills') or 0),
+        }
+
+    async def get_swipe_stats(self, user_id: int) -> dict:
+        try:
+            data = await self.__redis.hgetall(self._stats_key(user_id))
+            return self._parse_stats(data)
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to get swipe stats",
+                extra={
+                    "operation": "get_swipe_stats",
+                    "user_id": user_id,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
+    async def record_refill(self, user_id: int) -> dict:
+        try:
+            key = self._stats_key(user_id)
+            
+            async with self.__redis.pipeline(transaction=True) as pipe:
+                pipe.hincrby(key, 'refills', 1)
+                pipe.expire(key, self.__stats_ttl)
+                pipe.hgetall(key)
+                _, _, data = await pipe.execute()
+            
+            return self._parse_stats(data)
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to record refill",
+                extra={
+                    "operation": "record_refill",
+                    "user_id": user_id,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
 
     def _seen_key(self, user_id: int) -> str:
         return f"swipe:seen:{user_id}"
@@ -170,7 +485,40 @@ class Cache:
                 exc_info=True
             )
             raise
-    
+
+    async def add_seen_pairs(self, pairs: List[Tuple[int, int]]):
+        self.logger.debug(
+            "Adding seen users in batch",
+            extra={
+                "operation": "add_seen_pairs",
+                "pair_count": len(pairs)
+            }
+        )
+
+        if not pairs:
+            return
+
+        try:
+            async with self.__redis.pipeline(transaction=False) as pipe:
+                for from_user_id, to_user_id in pairs:
+                    key = self._seen_key(from_user_id)
+                    pipe.sadd(key, str(to_user_id))
+                    pipe.expire(key, self.__seen_ttl)
+                await pipe.execute()
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to add seen users in batch",
+                extra={
+                    "operation": "add_seen_pairs",
+                    "pair_count": len(pairs),
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
     async def get_seen_user_ids(self, user_id: int) -> List[int]:
         self.logger.debug(
             "Getting seen user ids",
@@ -213,6 +561,37 @@ class Cache:
     def _profile_key(self, profile_id: int) -> str:
         return f"swipe:profile:{profile_id}"
 
+    def _parse_profile(self, data: dict) -> dict:
+        return {
+            'id': int(data['id']),
+            'user_id': int(data['user_id']),
+            'name': data['name'],
+            'description': data['description'],
+            'gender': data['gender'],
+            'age': int(data['age']) if data['age'] else None,
+            'media': json.loads(data['media']),
+            'is_active': data['is_active'] == 'True',
+            'updated_at': data['updated_at'],
+            'created_at': data['created_at'],
+        }
+
+    def _store_profile(self, pipe, profile: dict):
+        key = self._profile_key(profile['id'])
+        
+        pipe.hset(key, mapping={
+            'id': str(profile['id']),
+            'user_id': str(profile['user_id']),
+            'name': profile.get('name', ''),
+            'description': profile.get('description', ''),
+            'gender': profile.get('gender', ''),
+            'age': str(profile.get('age', '')),
+            'media': json.dumps(profile.get('media', [])),
+            'is_active': str(profile.get('is_active', True)),
+            'updated_at': str(profile.get('updated_at', '')),
+            'created_at': str(profile.get('created_at', '')),
+        })
+        pipe.expire(key, self.__profile_ttl)
+
     async def cache_profile(self, profile: dict):
         self.logger.debug(
             "Caching profile",
@@ -224,22 +603,9 @@ class Cache:
         )
         
         try:
-            key = self._profile_key(profile['id'])
-            
-            await self.__redis.hset(key, mapping={
-                'id': str(profile['id']),
-                'user_id': str(profile['user_id']),
-                'name': profile.get('name', ''),
-                'description': profile.get('description', ''),
-                'gender': profile.get('gender', ''),
-                'age': str(profile.get('age', '')),
-                'media': json.dumps(profile.get('media', [])),
-                'is_active': str(profile.get('is_active', True)),
-                'updated_at': str(profile.get('updated_at', '')),
-                'created_at': str(profile.get('created_at', '')),
-            })
-            
-            await self.__redis.expire(key, self.__profile_ttl)
+            async with self.__redis.pipeline(transaction=False) as pipe:
+                self._store_profile(pipe, profile)
+                await pipe.execute()
             
             self.logger.debug(
                 f"Profile {profile['id']} cached",
@@ -265,6 +631,333 @@ class Cache:
             )
             raise
     
+    async def cache_profiles_many(self, profiles: List[dict]):
+        self.logger.debug(
+            "Caching profiles batch",
+            extra={
+                "operation": "cache_profiles_many",
+                "profile_count": len(profiles)
+            }
+        )
+        
+        if not profiles:
+            return
+        
+        try:
+            async with self.__redis.pipeline(transaction=False) as pipe:
+                for profile in profiles:
+                    self._store_profile(pipe, profile)
+                await pipe.execute()
+            
+            self.logger.debug(
+                f"Cached {len(profiles)} profiles",
+                extra={
+                    "operation": "cache_profiles_many",
+                    "profile_count": len(profiles),
+                    "ttl": self.__profile_ttl
+                }
+            )
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to cache profiles batch",
+                extra={
+                    "operation": "cache_profiles_many",
+                    "profile_count": len(profiles),
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
+    async def _enqueue_profiles(
+        self,
+        user_id: int,
+        profiles: List[dict],
+        shown: Optional[dict] = None
+    ) -> int:
+        args = [
+            self.__queue_ttl,
+            self.__seen_ttl,
+            str(shown['user_id']) if shown else '',
+            str(shown['id']) if shown else '',
+        ]
+        for profile in profiles:
+            args += [str(profile['id']), str(profile['user_id'])]
+        
+        async with self.__redis.pipeline(transaction=True) as pipe:
+            for profile in profiles:
+                self._store_profile(pipe, profile)
+            await self.__enqueue_profiles(
+                keys=[self._queue_key(user_id), self._seen_key(user_id)],
+                args=args,
+                client=pipe
+            )
+            results = await pipe.execute()
+        
+        return results[-1]
+
+    async def refill_queue(self, user_id: int, profiles: List[dict], shown: Optional[dict] = None) -> int:
+        self.logger.debug(
+            "Refilling queue",
+            extra={
+                "operation": "refill_queue",
+                "user_id": user_id,
+                "profile_count": len(profiles),
+                "shown_profile_id": shown['id'] if shown else None
+            }
+        )
+        
+        try:
+            added = await self._enqueue_profiles(user_id, profiles, shown)
+            
+            self.logger.debug(
+                f"Queue refilled with {added} profiles",
+                extra={
+                    "operation": "refill_queue",
+                    "user_id": user_id,
+                    "profile_count": len(profiles),
+                    "added": added,
+                    "ttl": self.__queue_ttl
+                }
+            )
+            
+            return added
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to refill queue",
+                extra={
+                    "operation": "refill_queue",
+                    "user_id": user_id,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+    
+    async def get_queue(self, user_id: int) -> List[int]:
+        try:
+            profile_ids = await self.__redis.lrange(self._queue_key(user_id), 0, -1)
+            return [int(profile_id) for profile_id in profile_ids]
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to get queue",
+                extra={
+                    "operation": "get_queue",
+                    "user_id": user_id,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
+    async def append_queue(self, user_id: int, profiles: List[dict]) -> int:
+        self.logger.debug(
+            "Appending to queue",
+            extra={
+                "operation": "append_queue",
+                "user_id": user_id,
+                "profile_count": len(profiles)
+            }
+        )
+        
+        if not profiles:
+            return 0
+        
+        try:
+            return await self._enqueue_profiles(user_id, profiles)
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to append to queue",
+                extra={
+                    "operation": "append_queue",
+                    "user_id": user_id,
+                    "profile_count": len(profiles),
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
+    async def ensure_group(self, stream: str, group: str):
+        try:
+            await self.__redis.xgroup_create(stream, group, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def read_group(
+        self,
+        stream: str,
+        group: str,
+        consumer: str,
+        count: int,
+        block_ms: int,
+        pending: bool = False
+    ) -> List[Tuple[str, dict]]:
+        try:
+            response = await self.__redis.xreadgroup(
+                group,
+                consumer,
+                {stream: "0" if pending else ">"},
+                count=count,
+                block=None if pending else block_ms
+            )
+            
+            if not response:
+                return []
+            
+            _, events = response[0]
+            return events
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to read stream",
+                extra={
+                    "operation": "read_group",
+                    "stream": stream,
+                    "group": group,
+                    "consumer": consumer,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
+    async def ack(self, stream: str, group: str, event_ids: List[str]):
+        if not event_ids:
+            return
+        
+        await self.__redis.xack(stream, group, *event_ids)
+
+    def _like_cooldown_key(self, user_id) -> str:
+        return f"notify:like:cooldown:{user_id}"
+
+    def _like_count_key(self, user_id) -> str:
+        return f"notify:like:count:{user_id}"
+
+    def _like_event_key(self, event_id) -> str:
+        return f"notify:like:event:{event_id}"
+
+    async def coalesce_like(self, user_id: int, event_id: int) -> bool:
+        if self.__like_digest_window <= 0:
+            return True
+        
+        try:
+            window_ms = self.__like_digest_window * 1000
+            send_now = await self.__coalesce_like(
+                keys=[
+                    self._like_cooldown_key(user_id),
+                    self._like_count_key(user_id),
+                    self.LIKE_DIGESTS_KEY,
+                    self._like_event_key(event_id)
+                ],
+                args=[user_id, window_ms, window_ms * 2, time.time(), self.__like_event_ttl]
+            )
+            
+            self.logger.debug(
+                "Like notification coalesced" if not send_now else "Like notification sent through",
+                extra={
+                    "operation": "coalesce_like",
+                    "user_id": user_id,
+                    "event_id": event_id
+                }
+            )
+            
+            return bool(send_now)
+            
+        except Exception as e:
+            self.logger.warning(
+                "Failed to coalesce like notification, sending immediately",
+                extra={
+                    "operation": "coalesce_like",
+                    "user_id": user_id,
+                    "event_id": event_id,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                }
+            )
+            return True
+
+    async def claim_due_like_digests(self, limit: int, lease: int) -> List[Tuple[int, int]]:
+        try:
+            response = await self.__claim_due_like_digests(
+                keys=[self.LIKE_DIGESTS_KEY],
+                args=[time.time(), limit, self._like_count_key(""), lease]
+            )
+            
+            return [
+                (int(response[i]), int(response[i + 1]))
+                for i in range(0, len(response), 2)
+            ]
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to claim due like digests",
+                extra={
+                    "operation": "claim_due_like_digests",
+                    "limit": limit,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
+    async def ack_like_digests(self, digests: List[Tuple[int, int]]):
+        if not digests:
+            return
+        
+        try:
+            args = [
+                time.time(),
+                self._like_count_key(""),
+                self._like_cooldown_key(""),
+                self.__like_digest_window * 1000
+            ]
+            for user_id, count in digests:
+                args.extend([user_id, count])
+            
+            await self.__ack_like_digests(keys=[self.LIKE_DIGESTS_KEY], args=args)
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to acknowledge like digests",
+                extra={
+                    "operation": "ack_like_digests",
+                    "count": len(digests),
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
+    async def get_recently_active_user_ids(self, since: float, limit: int) -> List[int]:
+        async with self.__redis.pipeline(transaction=False) as pipe:
+            pipe.zremrangebyscore(self.ACTIVE_USERS_KEY, "-inf", f"({since}")
+            pipe.zrevrangebyscore(self.ACTIVE_USERS_KEY, "+inf", since, start=0, num=limit)
+            _, user_ids = await pipe.execute()
+        
+        return [int(user_id) for user_id in user_ids]
+
+    async def get_queue_lengths(self, user_ids: List[int]) -> List[int]:
+        if not user_ids:
+            return []
+        
+        async with self.__redis.pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                pipe.llen(self._queue_key(user_id))
+            return await pipe.execute()
+    
     async def get_cached_profile(self, profile_id: int) -> Optional[dict]:
         self.logger.debug(
             "Getting cached profile",
@@ -289,18 +982,7 @@ class Cache:
                 )
                 return None
             
-            profile = {
-                'id': int(data['id']),
-                'user_id': int(data['user_id']),
-                'name': data['name'],
-                'description': data['description'],
-                'gender': data['gender'],
-                'age': int(data['age']) if data['age'] else None,
-                'media': json.loads(data['media']),
-                'is_active': data['is_active'] == 'True',
-                'updated_at': data['updated_at'],
-                'created_at': data['created_at'],
-            }
+            profile = self._parse_profile(data)
             
             self.logger.debug(
                 f"Profile {profile_id} retrieved from cache",
@@ -362,6 +1044,179 @@ class Cache:
             )
             raise
     
+    def _embedding_key(self, model_version: str, text_hash: str) -> str:
+        return f"embedding:{model_version}:{text_hash}"
+
+    async def get_embedding(self, model_version: str, text_hash: str) -> Optional[List[float]]:
+        self.logger.debug(
+            "Getting cached embedding",
+            extra={
+                "operation": "get_embedding",
+                "model_version": model_version,
+                "text_hash": text_hash
+            }
+        )
+        
+        try:
+            key = self._embedding_key(model_version, text_hash)
+            data = await self.__redis.getex(key, ex=self.__embedding_ttl)
+            
+            if not data:
+                self.logger.debug(
+                    "Embedding not found in cache",
+                    extra={
+                        "operation": "get_embedding",
+                        "text_hash": text_hash,
+                        "found": False
+                    }
+                )
+                return None
+            
+            embedding = array('f', base64.b64decode(data)).tolist()
+            
+            self.logger.debug(
+                "Embedding retrieved from cache",
+                extra={
+                    "operation": "get_embedding",
+                    "text_hash": text_hash,
+                    "found": True
+                }
+            )
+            
+            return embedding
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to get cached embedding",
+                extra={
+                    "operation": "get_embedding",
+                    "text_hash": text_hash,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
+    async def set_embedding(self, model_version: str, text_hash: str, embedding: List[float]):
+        self.logger.debug(
+            "Caching embedding",
+            extra={
+                "operation": "set_embedding",
+                "model_version": model_version,
+                "text_hash": text_hash
+            }
+        )
+        
+        try:
+            key = self._embedding_key(model_version, text_hash)
+            data = base64.b64encode(array('f', embedding).tobytes()).decode()
+            await self.__redis.set(key, data, ex=self.__embedding_ttl)
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to cache embedding",
+                extra={
+                    "operation": "set_embedding",
+                    "text_hash": text_hash,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+    
+    def _auth_key(self, telegram_id: str) -> str:
+        return f"auth:{telegram_id}"
+
+    def _auth_user_key(self, user_id: int) -> str:
+        return f"auth:user:{user_id}"
+
+    async def get_auth(self, telegram_id: str) -> Optional[dict]:
+        try:
+            data = await self.__redis.hgetall(self._auth_key(telegram_id))
+            
+            if not data:
+                self.logger.debug(
+                    "Auth entry not found in cache",
+                    extra={
+                        "operation": "get_auth",
+                        "telegram_id": telegram_id,
+                        "found": False
+                    }
+                )
+                return None
+            
+            return {
+                'user_id': int(data['user_id']),
+                'is_banned': data['is_banned'] == '1',
+                'has_active_profile': data['has_active_profile'] == '1',
+            }
+            
+        except Exception as e:
+            self.logger.warning(
+                "Failed to get cached auth entry, falling back to database",
+                extra={
+                    "operation": "get_auth",
+                    "telegram_id": telegram_id,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                }
+            )
+            return None
+
+    async def set_auth(self, telegram_id: str, user_id: int, is_banned: bool, has_active_profile: bool):
+        try:
+            auth_key = self._auth_key(telegram_id)
+            
+            async with self.__redis.pipeline(transaction=True) as pipe:
+                pipe.hset(auth_key, mapping={
+                    'user_id': str(user_id),
+                    'is_banned': '1' if is_banned else '0',
+                    'has_active_profile': '1' if has_active_profile else '0',
+                })
+                pipe.expire(auth_key, self.__auth_ttl)
+                pipe.set(self._auth_user_key(user_id), telegram_id, ex=self.__auth_ttl)
+                await pipe.execute()
+            
+        except Exception as e:
+            self.logger.warning(
+                "Failed to cache auth entry",
+                extra={
+                    "operation": "set_auth",
+                    "telegram_id": telegram_id,
+                    "user_id": user_id,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                }
+            )
+
+    async def invalidate_auth(self, user_id: int):
+        self.logger.debug(
+            "Invalidating auth cache",
+            extra={
+                "operation": "invalidate_auth",
+                "user_id": user_id
+            }
+        )
+        
+        try:
+            await self.__invalidate_auth(
+                keys=[self._auth_user_key(user_id)],
+                args=[self._auth_key("")]
+            )
+            
+        except Exception as e:
+            self.logger.warning(
+                "Failed to invalidate auth cache",
+                extra={
+                    "operation": "invalidate_auth",
+                    "user_id": user_id,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                }
+            )
+
     async def close(self):
         self.logger.debug(
             "Closing cache connection",
@@ -386,4 +1241,12 @@ class Cache:
             )
             raise
 
-cache = Cache(settings.REDIS_URL)
\ No newline at end of file
+cache = Cache(
+    settings.REDIS_URL,
+    auth_ttl=settings.AUTH_CACHE_TTL,
+    feed_low_watermark=settings.FEED_LOW_WATERMARK,
+    feed_stream_maxlen=settings.FEED_STREAM_MAXLEN,
+    swipe_rate_alpha=settings.SWIPE_RATE_ALPHA,
+    swipe_session_gap=settings.SWIPE_SESSION_GAP_SECONDS,
+    like_digest_window=settings.NOTIFICATION_LIKE_DIGEST_WINDOW,
+)
\ No newline at end of file
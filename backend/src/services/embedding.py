@@ -1,40 +1,324 @@
+import asyncio
+import hashlib
+import os
+import threading
+import time
+import unicodedata
 import numpy as np
-from onnxruntime import InferenceSession
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from onnxruntime import GraphOptimizationLevel, InferenceSession, SessionOptions
 from tokenizers import Tokenizer
 from pathlib import Path
+from src.core.config import settings
+from src.core.logger import get_service_logger
+from src.core.model_files import MODEL_CACHE_DIR, MODEL_FILE, QUANTIZED_MODEL_FILE
+from src.services.cache import cache
+
+MAX_SEQUENCE_LENGTH = 256
+WARMUP_TEXT = "warm up"
+
+def model_version(quantized: bool | None = None) -> str:
+    if quantized is None:
+        quantized = settings.EMBEDDING_QUANTIZED
+    return f"{settings.EMBEDDING_MODEL_VERSION}-int8" if quantized else settings.EMBEDDING_MODEL_VERSION
+
+class EmbeddingModel:
+    def __init__(
+        self,
+        cache_dir: Path = MODEL_CACHE_DIR,
+        pad_to: int | None = None,
+        quantized: bool | None = None
+    ):
+        if quantized is None:
+            quantized = settings.EMBEDDING_QUANTIZED
 
-class EmbeddingService:
-    def __init__(self):
-        cache_dir = Path('/app/model_cache')
-        
         self.tokenizer = Tokenizer.from_file(str(cache_dir / "tokenizer.json"))
-        
-        self.tokenizer.enable_padding(length=256)
-        self.tokenizer.enable_truncation(max_length=256)
-        
+
+        if pad_to:
+            self.tokenizer.enable_padding(length=pad_to)
+        else:
+            self.tokenizer.enable_padding()
+        self.tokenizer.enable_truncation(max_length=MAX_SEQUENCE_LENGTH)
+
+        options = SessionOptions()
+        options.intra_op_num_threads = settings.EMBEDDING_INTRA_OP_THREADS
+        options.inter_op_num_threads = settings.EMBEDDING_INTER_OP_THREADS
+
+        model_path = cache_dir / (QUANTIZED_MODEL_FILE if quantized else MODEL_FILE)
+        optimized_path = cache_dir / f"{model_path.stem}.optimized.onnx"
+        pending_path = None
+
+        if (
+            settings.EMBEDDING_CACHE_OPTIMIZED_MODEL
+            and optimized_path.exists()
+            and optimized_path.stat().st_mtime >= model_path.stat().st_mtime
+        ):
+            model_path = optimized_path
+            options.graph_optimization_level = GraphOptimizationLevel.ORT_DISABLE_ALL
+        elif settings.EMBEDDING_CACHE_OPTIMIZED_MODEL and os.access(cache_dir, os.W_OK):
+            options.graph_optimization_level = GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+            pending_path = cache_dir / f"{model_path.stem}.optimized.{os.getpid()}.onnx"
+            options.optimized_model_filepath = str(pending_path)
+
         self.session = InferenceSession(
-            str(cache_dir / "model.onnx"),
+            str(model_path),
+            sess_options=options,
             providers=['CPUExecutionProvider']
         )
-    
+
+        if pending_path is not None and pending_path.exists():
+            os.replace(pending_path, optimized_path)
+
     def _mean_pooling(self, last_hidden_state, attention_mask):
         mask = np.expand_dims(attention_mask, -1).astype(float)
         return np.sum(last_hidden_state * mask, 1) / np.maximum(mask.sum(1), 1e-9)
 
-    async def generate_embedding(self, text: str) -> list[float]:
-        encoding = self.tokenizer.encode(text)
-        
+    def encode_batch(self, texts: list[str]) -> list[list[float]]:
+        encodings = self.tokenizer.encode_batch(texts)
+
         inputs = {
-            'input_ids': np.array([encoding.ids], dtype=np.int64),
-            'attention_mask': np.array([encoding.attention_mask], dtype=np.int64),
-            'token_type_ids': np.array([encoding.type_ids], dtype=np.int64)
+            'input_ids': np.array([e.ids for e in encodings], dtype=np.int64),
+            'attention_mask': np.array([e.attention_mask for e in encodings], dtype=np.int64),
+            'token_type_ids': np.array([e.type_ids for e in encodings], dtype=np.int64)
         }
-        
+
         outputs = self.session.run(['last_hidden_state'], inputs)
-        
+
         embeddings = self._mean_pooling(outputs[0], inputs['attention_mask'])
         embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
-        
-        return embeddings[0].tolist()
+
+        return embeddings.tolist()
+
+    def encode(self, text: str) -> list[float]:
+        return self.encode_batch([text])[0]
+
+def text_hash(text: str) -> str:
+    normalized = " ".join(unicodedata.normalize("NFC", text).split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+_worker_model: EmbeddingModel | None = None
+
+def _encode_batch_in_worker(texts: list[str]) -> list[list[float]]:
+    global _worker_model
+    if _worker_model is None:
+        _worker_model = EmbeddingModel()
+    return _worker_model.encode_batch(texts)
+
+class EmbeddingService:
+    def __init__(self):
+        self.logger = get_service_logger()
+        self.queue_depth = 0
+        self.__max_batch_size = settings.EMBEDDING_MAX_BATCH_SIZE
+        self.__batch_wait = settings.EMBEDDING_BATCH_WAIT_MS / 1000
+        self.__queue: asyncio.Queue | None = None
+        self.__batcher: asyncio.Task | None = None
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__batches_in_flight = 0
+        self.__batches = 0
+        self.__batched_texts = 0
+        self.__slots: asyncio.Semaphore | None = None
+        self.__model: EmbeddingModel | None = None
+        self.__model_lock = threading.Lock()
+        self.__executor: ProcessPoolExecutor | ThreadPoolExecutor | None = None
+
+        self.logger.debug(
+            "EmbeddingService initialized",
+            extra={
+                "operation": "init",
+                "executor": settings.EMBEDDING_EXECUTOR,
+                "model_version": model_version(),
+                "workers": settings.EMBEDDING_WORKERS,
+                "intra_op_threads": settings.EMBEDDING_INTRA_OP_THREADS,
+                "inter_op_threads": settings.EMBEDDING_INTER_OP_THREADS,
+                "max_batch_size": self.__max_batch_size,
+                "batch_wait_ms": settings.EMBEDDING_BATCH_WAIT_MS
+            }
+        )
+
+    def _get_executor(self) -> ProcessPoolExecutor | ThreadPoolExecutor:
+        if self.__executor is None:
+            if settings.EMBEDDING_EXECUTOR == "process":
+                self.__executor = ProcessPoolExecutor(max_workers=settings.EMBEDDING_WORKERS)
+            else:
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=settings.EMBEDDING_WORKERS,
+                    thread_name_prefix="embedding"
+                )
+        return self.__executor
+
+    def _get_model(self) -> EmbeddingModel:
+        if self.__model is None:
+            with self.__model_lock:
+                if self.__model is None:
+                    started = time.perf_counter()
+                    self.__model = EmbeddingModel()
+                    self.logger.info(
+                        "Embedding model loaded",
+                        extra={
+                            "operation": "_get_model",
+                            "duration_ms": round((time.perf_counter() - started) * 1000, 2)
+                        }
+                    )
+        return self.__model
+
+    def _encode_batch(self, texts: list[str]) -> list[list[float]]:
+        return self._get_model().encode_batch(texts)
+
+    async def _encode(self, texts: list[str]) -> list[list[float]]:
+        loop = asyncio.get_running_loop()
+        if settings.EMBEDDING_EXECUTOR == "process":
+            return await loop.run_in_executor(self._get_executor(), _encode_batch_in_worker, texts)
+        return await loop.run_in_executor(self._get_executor(), self._encode_batch, texts)
+
+    async def warm_up(self):
+        started = time.perf_counter()
+
+        try:
+            workers = settings.EMBEDDING_WORKERS if settings.EMBEDDING_EXECUTOR == "process" else 1
+            await asyncio.gather(*(self._encode([WARMUP_TEXT]) for _ in range(workers)))
+        except Exception as e:
+            self.logger.error(
+                "Embedding warm-up failed",
+                extra={
+                    "operation": "warm_up",
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+
+        self.logger.info(
+            "Embedding model warmed up",
+            extra={
+                "operation": "warm_up",
+                "executor": settings.EMBEDDING_EXECUTOR,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2)
+            }
+        )
+
+    def _ensure_batcher(self):
+        loop = asyncio.get_running_loop()
+        if self.__batcher is None or self.__batcher.done() or self.__loop is not loop:
+            if self.__batcher is not None and not self.__batcher.done() and not self.__loop.is_closed():
+                self.__loop.call_soon_threadsafe(self.__batcher.cancel)
+            self.__loop = loop
+            self.__queue = asyncio.Queue()
+            self.__slots = asyncio.Semaphore(settings.EMBEDDING_WORKERS)
+            self.__batcher = loop.create_task(self._batch_loop())
+
+    def metrics(self) -> dict:
+        return {
+            "queue_depth": self.queue_depth,
+            "queued": self.__queue.qsize() if self.__queue is not None else 0,
+            "batches_in_flight": self.__batches_in_flight,
+            "batches": self.__batches,
+            "avg_batch_size": round(self.__batched_texts / self.__batches, 2) if self.__batches else 0.0,
+            "max_batch_size": self.__max_batch_size,
+        }
+
+    async def _collect_batch(self) -> list[tuple[str, asyncio.Future]]:
+        batch = [await self.__queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.__batch_wait
+
+        while len(batch) < self.__max_batch_size:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.__queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _batch_loop(self):
+        while True:
+            batch = await self._collect_batch()
+            await self.__slots.acquire()
+            task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+            task.add_done_callback(lambda _: self.__slots.release())
+
+    async def _run_batch(self, batch: list[tuple[str, asyncio.Future]]):
+        texts = [text for text, _ in batch]
+        started = time.perf_counter()
+        self.__batches_in_flight += 1
+
+        try:
+            embeddings = await self._encode(texts)
+        except Exception as e:
+            self.logger.error(
+                "Embedding batch failed",
+                extra={
+                    "operation": "_run_batch",
+                    "batch_size": len(batch),
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self.__batches_in_flight -= 1
+
+        self.__batches += 1
+        self.__batched_texts += len(batch)
+        for (_, future), embedding in zip(batch, embeddings):
+            if not future.done():
+                future.set_result(embedding)
+
+        self.logger.debug(
+            "Embedding batch processed",
+            extra={
+                "operation": "_run_batch",
+                "batch_size": len(batch),
+                "queue_depth": self.queue_depth,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2)
+            }
+        )
+
+    async def _get_cached(self, key: str) -> list[float] | None:
+        try:
+            return await cache.get_embedding(model_version(), key)
+        except Exception:
+            return None
+
+    async def _store_cached(self, key: str, embedding: list[float]):
+        try:
+            await cache.set_embedding(model_version(), key, embedding)
+        except Exception:
+            pass
+
+    async def generate_embedding(self, text: str) -> list[float]:
+        key = text_hash(text)
+
+        cached = await self._get_cached(key)
+        if cached is not None:
+            return cached
+
+        self._ensure_batcher()
+        future = asyncio.get_running_loop().create_future()
+
+        self.queue_depth += 1
+        try:
+            self.__queue.put_nowait((text, future))
+            embedding = await future
+        finally:
+            self.queue_depth -= 1
+
+        await self._store_cached(key, embedding)
+        return embedding
+
+    def close(self):
+        if self.__batcher is not None:
+            self.__batcher.cancel()
+            self.__batcher = None
+            self.__loop = None
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
 
 embedding_service = EmbeddingService()
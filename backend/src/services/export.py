@@ -0,0 +1,209 @@
+import csv
+import io
+import json
+import zlib
+from typing import AsyncIterator, Callable, Literal
+
+import numpy as np
+from sqlalchemy import Row
+
+EMBEDDING_DIMENSIONS = 384
+
+ExportFormat = Literal["csv", "ndjson", "arrow", "parquet"]
+
+CSV_HEADERS = [
+    'profile_id',
+    'user_id',
+    'telegram_id',
+    'username',
+    'first_name',
+    'name',
+    'gender',
+    'age',
+    'description',
+    'media_count',
+    'is_active',
+    'created_at',
+    'updated_at',
+]
+
+def _csv_row(row: Row) -> list:
+    return [
+        row.profile_id,
+        row.user_id,
+        row.telegram_id,
+        row.username or '',
+        row.first_name or '',
+        row.name or '',
+        row.gender.value if row.gender else '',
+        row.age or '',
+        row.description or '',
+        row.media_count,
+        row.is_active,
+        row.created_at.isoformat() if row.created_at else '',
+        row.updated_at.isoformat() if row.updated_at else '',
+    ]
+
+async def encode_csv(batches: AsyncIterator[list[Row]], include_embedding: bool = False) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+
+    writer.writerow(CSV_HEADERS)
+    yield buffer.getvalue().encode('utf-8-sig')
+
+    async for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(_csv_row(row) for row in rows)
+        yield buffer.getvalue().encode('utf-8')
+
+def _json_row(row: Row, include_embedding: bool) -> dict:
+    data = {
+        'profile_id': row.profile_id,
+        'user_id': row.user_id,
+        'telegram_id': row.telegram_id,
+        'username': row.username,
+        'first_name': row.first_name,
+        'name': row.name,
+        'gender': row.gender.value if row.gender else None,
+        'age': row.age,
+        'description': row.description,
+        'media_count': row.media_count,
+        'is_active': row.is_active,
+        'created_at': row.created_at.isoformat() if row.created_at else None,
+        'updated_at': row.updated_at.isoformat() if row.updated_at else None,
+    }
+    if include_embedding:
+        data['embedding'] = row.embedding.tolist() if row.embedding is not None else None
+    return data
+
+async def encode_ndjson_gzip(batches: AsyncIterator[list[Row]], include_embedding: bool = False) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(level=6, wbits=31)
+
+    async for rows in batches:
+        lines = "".join(
+            json.dumps(_json_row(row, include_embedding), ensure_ascii=False) + "\n"
+            for row in rows
+        )
+        chunk = compressor.compress(lines.encode('utf-8'))
+        if chunk:
+            yield chunk
+
+    yield compressor.flush()
+
+def _arrow_schema(include_embedding: bool):
+    import pyarrow as pa
+
+    fields = [
+        pa.field('profile_id', pa.int32(), nullable=False),
+        pa.field('user_id', pa.int32(), nullable=False),
+        pa.field('telegram_id', pa.string(), nullable=False),
+        pa.field('username', pa.string()),
+        pa.field('first_name', pa.string()),
+        pa.field('name', pa.string()),
+        pa.field('gender', pa.dictionary(pa.int8(), pa.string())),
+        pa.field('age', pa.int16()),
+        pa.field('description', pa.string()),
+        pa.field('media_count', pa.int16(), nullable=False),
+        pa.field('is_active', pa.bool_(), nullable=False),
+        pa.field('created_at', pa.timestamp('us')),
+        pa.field('updated_at', pa.timestamp('us')),
+    ]
+    if include_embedding:
+        fields.append(pa.field('embedding', pa.list_(pa.float32(), EMBEDDING_DIMENSIONS)))
+    return pa.schema(fields)
+
+def _embedding_array(rows: list[Row]):
+    import pyarrow as pa
+
+    missing = np.array([row.embedding is None for row in rows])
+    values = np.zeros((len(rows), EMBEDDING_DIMENSIONS), dtype=np.float32)
+    for i, row in enumerate(rows):
+        if row.embedding is not None:
+            values[i] = row.embedding
+
+    return pa.FixedSizeListArray.from_arrays(
+        pa.array(values.reshape(-1), type=pa.float32()),
+        EMBEDDING_DIMENSIONS,
+        mask=pa.array(missing) if missing.any() else None
+    )
+
+def _record_batch(rows: list[Row], schema, include_embedding: bool):
+    import pyarrow as pa
+
+    columns = {
+        name: [getattr(row, name) for row in rows]
+        for name in CSV_HEADERS
+        if name != 'gender'
+    }
+    columns['gender'] = [row.gender.value if row.gender else None for row in rows]
+
+    arrays = []
+    for field in schema:
+        if field.name == 'embedding':
+            arrays.append(_embedding_array(rows))
+        elif field.name == 'gender':
+            arrays.append(pa.array(columns['gender'], type=pa.string()).dictionary_encode().cast(field.type))
+        else:
+            arrays.append(pa.array(columns[field.name], type=field.type))
+
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+class _ChunkSink(io.RawIOBase):
+    def __init__(self):
+        super().__init__()
+        self.__chunks: list[bytes] = []
+        self.__position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self.__chunks.append(chunk)
+        self.__position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self.__position
+
+    def drain(self) -> bytes:
+        data = b"".join(self.__chunks)
+        self.__chunks.clear()
+        return data
+
+async def encode_arrow(batches: AsyncIterator[list[Row]], include_embedding: bool = False) -> AsyncIterator[bytes]:
+    import pyarrow as pa
+
+    schema = _arrow_schema(include_embedding)
+    sink = _ChunkSink()
+    writer = pa.ipc.new_stream(sink, schema)
+
+    async for rows in batches:
+        writer.write_batch(_record_batch(rows, schema, include_embedding))
+        yield sink.drain()
+
+    writer.close()
+    yield sink.drain()
+
+async def encode_parquet(batches: AsyncIterator[list[Row]], include_embedding: bool = False) -> AsyncIterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _arrow_schema(include_embedding)
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression='zstd')
+
+    async for rows in batches:
+        writer.write_table(pa.Table.from_batches([_record_batch(rows, schema, include_embedding)]))
+        yield sink.drain()
+
+    writer.close()
+    yield sink.drain()
+
+EXPORT_FORMATS: dict[str, tuple[str, str, Callable]] = {
+    "csv": ("text/csv", "csv", encode_csv),
+    "ndjson": ("application/gzip", "ndjson.gz", encode_ndjson_gzip),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows", encode_arrow),
+    "parquet": ("application/vnd.apache.parquet", "parquet", encode_parquet),
+}
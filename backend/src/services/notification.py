@@ -0,0 +1,237 @@
+from typing import Iterable
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.models.outbox import OutboxEvent, OutboxKindEnum
+from src.models.profile import Profile
+from src.models.user import User
+from src.repositories.profile import ProfileRepository
+from src.repositories.user import UserRepository
+from src.services.telegram import DeliveryResult, telegram_service
+from src.core.config import settings
+from src.core.logger import get_service_logger
+
+
+class NotificationService:
+    def __init__(self, session: AsyncSession):
+        self.__user_repo = UserRepository(session)
+        self.__profile_repo = ProfileRepository(session)
+        self.__users: dict[int, User | None] = {}
+        self.__profiles: dict[int, Profile | None] = {}
+        self.logger = get_service_logger()
+
+    async def preload(self, events: Iterable[OutboxEvent]):
+        user_ids, profile_user_ids = set(), set()
+
+        for event in events:
+            for key in ("user_id", "matched_user_id", "from_user_id", "to_user_id"):
+                if key in event.payload:
+                    user_ids.add(int(event.payload[key]))
+            if event.kind == OutboxKindEnum.report.value:
+                profile_user_ids.add(int(event.payload["to_user_id"]))
+
+        users = await self.__user_repo.get_by_ids(list(user_ids))
+        self.__users.update(dict.fromkeys(user_ids))
+        self.__users.update({user.id: user for user in users})
+
+        profiles = await self.__profile_repo.get_by_user_ids(list(profile_user_ids))
+        self.__profiles.update(dict.fromkeys(profile_user_ids))
+        self.__profiles.update({profile.user_id: profile for profile in profiles})
+
+        self.logger.debug(
+            "Notification recipients preloaded",
+            extra={
+                "operation": "preload",
+                "user_count": len(users),
+                "profile_count": len(profiles)
+            }
+        )
+
+    async def _get_user(self, user_id: int) -> User | None:
+        if user_id not in self.__users:
+            self.__users[user_id] = await self.__user_repo.get(user_id)
+        return self.__users[user_id]
+
+    async def _get_profile(self, user_id: int) -> Profile | None:
+        if user_id not in self.__profiles:
+            self.__profiles[user_id] = await self.__profile_repo.get_by_user_id(user_id)
+        return self.__profiles[user_id]
+
+    async def _deliver_like(self, user_id: int) -> DeliveryResult:
+        to_user = await self._get_user(user_id)
+
+        if not to_user or not to_user.telegram_id:
+            self.logger.debug(
+                "User not found or no telegram_id, skipping notification",
+                extra={
+                    "operation": "_deliver_like",
+                    "to_user_id": user_id,
+                    "user_found": to_user is not None
+                }
+            )
+            return DeliveryResult(ok=False, error="recipient not found")
+
+        return await telegram_service.notify_new_like(chat_id=to_user.telegram_id)
+
+    async def _deliver_like_digest(self, user_id: int, count: int) -> DeliveryResult:
+        if count <= 1:
+            return await self._deliver_like(user_id)
+
+        to_user = await self._get_user(user_id)
+
+        if not to_user or not to_user.telegram_id:
+            self.logger.debug(
+                "User not found or no telegram_id, skipping notification",
+                extra={
+                    "operation": "_deliver_like_digest",
+                    "to_user_id": user_id,
+                    "user_found": to_user is not None
+                }
+            )
+            return DeliveryResult(ok=False, error="recipient not found")
+
+        return await telegram_service.notify_like_digest(chat_id=to_user.telegram_id, count=count)
+
+    async def _deliver_match(self, user_id: int, matched_user_id: int) -> DeliveryResult:
+        user = await self._get_user(user_id)
+        matched_user = await self._get_user(matched_user_id)
+
+        if not user or not user.telegram_id:
+            self.logger.debug(
+                "User not found or no telegram_id, skipping notification",
+                extra={
+                    "operation": "_deliver_match",
+                    "user_id": user_id,
+                    "user_found": user is not None
+                }
+            )
+            return DeliveryResult(ok=False, error="recipient not found")
+
+        return await telegram_service.notify_new_match(
+            chat_id=user.telegram_id,
+            matched_username=matched_user.username if matched_user else None,
+            matched_name=matched_user.first_name if matched_user else None
+        )
+
+    async def _deliver_report(
+        self,
+        from_user_id: int,
+        to_user_id: int,
+        report_reason: str
+    ) -> DeliveryResult:
+        self.logger.info(
+            "Processing report notification to admin",
+            extra={
+                "operation": "_deliver_report",
+                "from_user_id": from_user_id,
+                "to_user_id": to_user_id,
+                "report_reason": report_reason
+            }
+        )
+
+        profile = await self._get_profile(to_user_id)
+        reported_user = await self._get_user(to_user_id)
+        reporter_user = await self._get_user(from_user_id)
+
+        if not profile or not reported_user:
+            self.logger.warning(
+                "Profile or reported user not found for report",
+                extra={
+                    "operation": "_deliver_report",
+                    "from_user_id": from_user_id,
+                    "to_user_id": to_user_id,
+                    "profile_found": profile is not None,
+                    "reported_user_found": reported_user is not None
+                }
+            )
+            return DeliveryResult(ok=False, error="reported profile not found")
+
+        gender_map = {
+            "male": "👨 Парень",
+            "female": "👩 Девушка",
+        }
+        gender_text = gender_map.get(profile.gender, profile.gender or "❓")
+
+        desc_parts = profile.description.split('\n\n🏋️ Опыт тренировок:')
+        main_desc = desc_parts[0][:300] + ("..." if len(desc_parts[0]) > 300 else "")
+        experience = desc_parts[1] if len(desc_parts) > 1 else None
+
+        reporter_name = (
+            f"@{reporter_user.username}" if reporter_user and reporter_user.username
+            else f"ID: {reporter_user.telegram_id}" if reporter_user
+            else "Неизвестно"
+        )
+        reported_name = (
+            f"@{reported_user.username}" if reported_user.username
+            else f"ID: {reported_user.telegram_id}"
+        )
+
+        caption = (
+            f"⚠️ <b>НОВАЯ ЖАЛОБА</b>\n\n"
+            f"🔍 <b>Информация:</b>\n"
+            f"• 📢 Пожаловался: {reporter_name}\n"
+            f"• 👤 На пользователя: {reported_name}\n"
+            f"• 📋 Причина: {report_reason}\n\n"
+            f"📝 <b>Профиль:</b>\n"
+            f"• Имя: {profile.name}\n"
+            f"• Возраст: {profile.age or '?'}\n"
+            f"• Пол: {gender_text}\n"
+            f"• Описание: <code>{main_desc}</code>\n"
+            f"{f'• Опыт: {experience}\n' if experience else ''}"
+            f"• USER_ID: <code>{to_user_id}</code>\n"
+            f"• Telegram ID: <code>{reported_user.telegram_id}</code>"
+        )
+
+        media_payload = []
+
+        if profile.media:
+            for media in profile.media[:3]:
+                media_payload.append({
+                    "type": media["type"],
+                    "media": media["file_id"],
+                })
+
+        if media_payload:
+            sent = await telegram_service.send_media_group(
+                chat_id=settings.ADMIN_TELEGRAM_ID,
+                media_items=media_payload,
+                caption=caption,
+                parse_mode="HTML"
+            )
+            return DeliveryResult(ok=sent, error=None if sent else "media group not sent")
+
+        return await telegram_service.deliver_message(
+            chat_id=settings.ADMIN_TELEGRAM_ID,
+            text=caption,
+            parse_mode="HTML"
+        )
+
+    async def deliver(self, kind: str, payload: dict) -> DeliveryResult:
+        self.logger.debug(
+            "Delivering notification",
+            extra={
+                "operation": "deliver",
+                "kind": kind,
+                **payload
+            }
+        )
+
+        if kind == OutboxKindEnum.like.value:
+            return await self._deliver_like(int(payload["user_id"]))
+        if kind == OutboxKindEnum.like_digest.value:
+            return await self._deliver_like_digest(int(payload["user_id"]), int(payload["count"]))
+        if kind == OutboxKindEnum.match.value:
+            return await self._deliver_match(int(payload["user_id"]), int(payload["matched_user_id"]))
+        if kind == OutboxKindEnum.report.value:
+            return await self._deliver_report(
+                int(payload["from_user_id"]),
+                int(payload["to_user_id"]),
+                payload["report_reason"]
+            )
+
+        self.logger.warning(
+            "Unknown notification kind",
+            extra={
+                "operation": "deliver",
+                "kind": kind
+            }
+        )
+        return DeliveryResult(ok=False, error=f"unknown notification kind {kind}")
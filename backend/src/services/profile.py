@@ -1,3 +1,5 @@
+import math
+from typing import List, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.profile import Profile
@@ -10,10 +12,17 @@ from src.core.exceptions.profile import (
     ProfileAlreadyExistsException
 )
 from src.services.cache import cache
+from src.db.session import after_commit
+from src.core.config import settings
 from src.core.logger import get_service_logger
 
+def prefetch_size(swipe_rate: float) -> int:
+    size = math.ceil(swipe_rate * settings.SWIPE_PREFETCH_HORIZON)
+    return max(settings.SWIPE_PREFETCH_MIN, min(settings.SWIPE_PREFETCH_MAX, size))
+
 class ProfileService:
     def __init__(self, session: AsyncSession):
+        self.__session = session
         self.__profile_repo = ProfileRepository(session)
         self.logger = get_service_logger()
         self.logger.debug(
@@ -122,6 +131,7 @@ class ProfileService:
                 embedding=embedding,
                 is_active=True
             )
+            after_commit(self.__session, lambda: cache.invalidate_auth(user_id))
             
             self.logger.info(
                 "Profile created successfully",
@@ -190,7 +200,7 @@ class ProfileService:
                     for m in update_data['media']
                 ]
             
-            if 'description' in update_data and update_data['description']:
+            if update_data.get('description') and update_data['description'] != profile.description:
                 self.logger.debug(
                     "Regenerating embedding for updated description",
                     extra={
@@ -215,6 +225,8 @@ class ProfileService:
             )
             
             updated_profile = await self.__profile_repo.update(profile, **update_data)
+            if 'is_active' in update_data:
+                after_commit(self.__session, lambda: cache.invalidate_auth(user_id))
             
             self.logger.info(
                 "Profile updated successfully",
@@ -253,7 +265,7 @@ class ProfileService:
         )
         
         try:
-            profile_id = await cache.pop_from_queue(user_id)
+            profile_id, cached = await cache.pop_next_profile(user_id)
 
             if profile_id:
                 self.logger.debug(
@@ -266,9 +278,7 @@ class ProfileService:
                     }
                 )
                 
-                cached = await cache.get_cached_profile(profile_id)
                 if cached and cached.get('is_active'):
-                    await cache.add_seen_user_id(user_id, cached["user_id"])
                     self.logger.debug(
                         "Returning cached profile",
                         extra={
@@ -300,73 +310,16 @@ class ProfileService:
                     )
                     return profile_dict
 
-            current_profile = await self.__profile_repo.get_by_user_id(user_id)
-            seen_user_ids = await cache.get_seen_user_ids(user_id)
-            
-            self.logger.debug(
-                f"Seen {len(seen_user_ids)} users, looking for similar profiles",
-                extra={
-                    "operation": "get_next_profile",
-                    "user_id": user_id,
-                    "seen_count": len(seen_user_ids)
-                }
-            )
-            
-            if current_profile and current_profile.embedding is not None:
-                user_embedding = current_profile.embedding
-                if hasattr(user_embedding, 'tolist'):
-                    user_embedding = user_embedding.tolist()
-                elif not isinstance(user_embedding, list):
-                    user_embedding = list(user_embedding)
-                            
-                profiles = await self.__profile_repo.get_similar_profiles(
-                    user_embedding=user_embedding,
-                    seen_user_ids=seen_user_ids + [user_id],
-                    limit=10
-                )
-                
-                if profiles:
-                    self.logger.debug(
-                        f"Found {len(profiles)} similar profiles",
-                        extra={
-                            "operation": "get_next_profile",
-                            "user_id": user_id,
-                            "profiles_found": len(profiles),
-                            "type": "similar"
-                        }
-                    )
-                    
-                    for ind, p in enumerate(profiles):
-                        if ind != 0: 
-                            await cache.cache_profile(self._profile_to_dict(p))
-
-                    profile_ids = [p.id for p in profiles[1:]]
-                    await cache.fill_queue(user_id, profile_ids)
-
-                    return profiles[0]
-                    
-            profiles = await self.__profile_repo.get_random_profiles(
-                seen_user_ids=seen_user_ids + [user_id],
-                limit=10,
-            )
+            stats = await cache.get_swipe_stats(user_id)
+            profiles = await self._find_candidates(user_id, limit=self._prefetch_size(stats) + 1)
+            await self._record_refill(user_id, "request")
             
             if profiles:
-                self.logger.debug(
-                    f"Found {len(profiles)} random profiles",
-                    extra={
-                        "operation": "get_next_profile",
-                        "user_id": user_id,
-                        "profiles_found": len(profiles),
-                        "type": "random"
-                    }
+                await cache.refill_queue(
+                    user_id,
+                    [self._profile_to_dict(p) for p in profiles[1:]],
+                    shown={'id': profiles[0].id, 'user_id': profiles[0].user_id}
                 )
-                
-                for ind, p in enumerate(profiles):
-                    if ind != 0: 
-                        await cache.cache_profile(self._profile_to_dict(p))
-
-                profile_ids = [p.id for p in profiles[1:]]
-                await cache.fill_queue(user_id, profile_ids)
 
                 return profiles[0]
             
@@ -394,6 +347,118 @@ class ProfileService:
             )
             raise
     
+    async def _find_candidates(
+        self,
+        user_id: int,
+        limit: int,
+        exclude_profile_ids: Sequence[int] = ()
+    ) -> List[Profile]:
+        user_embedding = await self.__profile_repo.get_embedding_by_user_id(user_id)
+        seen_user_ids = await cache.get_seen_user_ids(user_id)
+        
+        self.logger.debug(
+            f"Seen {len(seen_user_ids)} users, looking for candidate profiles",
+            extra={
+                "operation": "_find_candidates",
+                "user_id": user_id,
+                "seen_count": len(seen_user_ids),
+                "excluded_count": len(exclude_profile_ids)
+            }
+        )
+        
+        profiles = await self.__profile_repo.get_candidates(
+            user_embedding=user_embedding,
+            seen_user_ids=seen_user_ids,
+            limit=limit,
+            user_id=user_id,
+            exclude_profile_ids=exclude_profile_ids,
+            exploration_ratio=settings.SWIPE_EXPLORATION_RATIO
+        )
+        
+        self.logger.debug(
+            f"Found {len(profiles)} candidate profiles",
+            extra={
+                "operation": "_find_candidates",
+                "user_id": user_id,
+                "profiles_found": len(profiles),
+                "type": "hybrid" if user_embedding is not None else "exploration"
+            }
+        )
+        return profiles
+
+    def _prefetch_size(self, stats: dict) -> int:
+        return prefetch_size(stats['rate'])
+
+    async def _record_refill(self, user_id: int, source: str):
+        stats = await cache.record_refill(user_id)
+        
+        self.logger.info(
+            "Swipe queue refilled from database",
+            extra={
+                "operation": "_record_refill",
+                "user_id": user_id,
+                "source": source,
+                "swipe_rate": round(stats['rate'], 3),
+                "prefetch_size": self._prefetch_size(stats),
+                "swipes": stats['swipes'],
+                "refills": stats['refills'],
+                "db_hits_per_swipe": round(stats['refills'] / max(stats['swipes'], 1), 4)
+            }
+        )
+
+    async def top_up_queue(self, user_id: int, target_size: int | None = None) -> int:
+        self.logger.debug(
+            "Topping up swipe queue",
+            extra={
+                "operation": "top_up_queue",
+                "user_id": user_id,
+                "target_size": target_size
+            }
+        )
+        
+        try:
+            if target_size is None:
+                target_size = self._prefetch_size(await cache.get_swipe_stats(user_id))
+            
+            queued = await cache.get_queue(user_id)
+            missing = target_size - len(queued)
+            
+            if missing < settings.FEED_MIN_TOP_UP:
+                return 0
+            
+            profiles = await self._find_candidates(
+                user_id,
+                limit=missing,
+                exclude_profile_ids=queued
+            )
+            await self._record_refill(user_id, "feed_builder")
+            await cache.append_queue(user_id, [self._profile_to_dict(p) for p in profiles])
+            
+            self.logger.debug(
+                f"Queue topped up with {len(profiles)} profiles",
+                extra={
+                    "operation": "top_up_queue",
+                    "user_id": user_id,
+                    "queued": len(queued),
+                    "added": len(profiles)
+                }
+            )
+            
+            return len(profiles)
+            
+        except Exception as e:
+            self.logger.error(
+                "Failed to top up swipe queue",
+                extra={
+                    "operation": "top_up_queue",
+                    "user_id": user_id,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            raise
+    
     def _profile_to_dict(self, profile: Profile) -> dict:
         profile_dict = {
             'id': profile.id,
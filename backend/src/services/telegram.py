@@ -1,32 +1,76 @@
 import httpx
+from dataclasses import dataclass
+from importlib.util import find_spec
 from typing import Optional
 from src.core.config import settings
 from src.core.logger import get_service_logger
 
+@dataclass
+class DeliveryResult:
+    ok: bool
+    status_code: int | None = None
+    retry_after: float | None = None
+    error: str | None = None
+    transient: bool = False
+
+    @property
+    def blocked(self) -> bool:
+        return self.status_code == 403
+
+    @property
+    def retryable(self) -> bool:
+        if self.status_code is None:
+            return self.transient
+        return self.status_code == 429 or self.status_code >= 500
+
 class TelegramNotificationService:
-    def __init__(self, bot_token: str):
+    def __init__(self, bot_token: str, api_url: str = settings.TELEGRAM_API_URL):
         self.__bot_token = bot_token
-        self.__base_url = f"https://api.telegram.org/bot{bot_token}"
+        self.__base_url = f"{api_url.rstrip('/')}/bot{bot_token}"
+        self.__client: httpx.AsyncClient | None = None
+        self.__http2 = settings.TELEGRAM_HTTP2 and find_spec("h2") is not None
         self.logger = get_service_logger()
         self.logger.debug(
             "TelegramNotificationService initialized",
             extra={
                 "operation": "init",
-                "has_bot_token": bool(bot_token)
+                "has_bot_token": bool(bot_token),
+                "http2": self.__http2
             }
         )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self.__client is None or self.__client.is_closed:
+            self.__client = httpx.AsyncClient(
+                http2=self.__http2,
+                timeout=10.0,
+                limits=httpx.Limits(
+                    max_connections=settings.TELEGRAM_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.TELEGRAM_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.TELEGRAM_KEEPALIVE_EXPIRY
+                )
+            )
+        return self.__client
+
+    async def start(self):
+        self._get_client()
+
+    async def close(self):
+        if self.__client is not None:
+            await self.__client.aclose()
+            self.__client = None
     
-    async def send_message(
+    async def deliver_message(
         self,
         chat_id: int | str,
         text: str,
         parse_mode: str = "HTML",
         reply_markup: dict = None
-    ) -> bool:
+    ) -> DeliveryResult:
         self.logger.debug(
             "Sending message",
             extra={
-                "operation": "send_message",
+                "operation": "deliver_message",
                 "chat_id": str(chat_id),
                 "text_length": len(text),
                 "parse_mode": parse_mode,
@@ -38,11 +82,11 @@ class TelegramNotificationService:
             self.logger.warning(
                 "Telegram bot token not configured, skipping notification",
                 extra={
-                    "operation": "send_message",
+                    "operation": "deliver_message",
                     "chat_id": str(chat_id)
                 }
             )
-            return False
+            return DeliveryResult(ok=False, error="bot token not configured")
         
         url = f"{self.__base_url}/sendMessage"
         payload = {
@@ -55,60 +99,85 @@ class TelegramNotificationService:
             payload["reply_markup"] = reply_markup
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(url, json=payload)
+            response = await self._get_client().post(url, json=payload)
+            
+            if response.status_code == 200:
+                self.logger.info(
+                    f"Message sent to chat {chat_id}",
+                    extra={
+                        "operation": "deliver_message",
+                        "chat_id": str(chat_id),
+                        "status": "success",
+                        "status_code": response.status_code
+                    }
+                )
+                return DeliveryResult(ok=True, status_code=response.status_code)
+            
+            retry_after = self._retry_after(response)
+            self.logger.error(
+                f"Failed to send message to {chat_id}",
+                extra={
+                    "operation": "deliver_message",
+                    "chat_id": str(chat_id),
+                    "status_code": response.status_code,
+                    "retry_after": retry_after,
+                    "response": response.text[:200] if response.text else None
+                }
+            )
+            return DeliveryResult(
+                ok=False,
+                status_code=response.status_code,
+                retry_after=retry_after,
+                error=response.text[:200] if response.text else None
+            )
                 
-                if response.status_code == 200:
-                    self.logger.info(
-                        f"Message sent to chat {chat_id}",
-                        extra={
-                            "operation": "send_message",
-                            "chat_id": str(chat_id),
-                            "status": "success",
-                            "status_code": response.status_code
-                        }
-                    )
-                    return True
-                else:
-                    self.logger.error(
-                        f"Failed to send message to {chat_id}",
-                        extra={
-                            "operation": "send_message",
-                            "chat_id": str(chat_id),
-                            "status_code": response.status_code,
-                            "response": response.text[:200] if response.text else None
-                        }
-                    )
-                    return False
-                    
         except httpx.TimeoutException as e:
             self.logger.error(
                 f"Timeout sending message to {chat_id}",
                 extra={
-                    "operation": "send_message",
+                    "operation": "deliver_message",
                     "chat_id": str(chat_id),
                     "error_type": "TimeoutException",
                     "error": str(e)
                 }
             )
-            return False
+            return DeliveryResult(ok=False, error=str(e), transient=True)
         except Exception as e:
             self.logger.error(
                 f"Error sending message to {chat_id}",
                 extra={
-                    "operation": "send_message",
+                    "operation": "deliver_message",
                     "chat_id": str(chat_id),
                     "error_type": type(e).__name__,
                     "error": str(e)
                 },
                 exc_info=True
             )
-            return False
+            return DeliveryResult(ok=False, error=str(e), transient=isinstance(e, httpx.TransportError))
+
+    def _retry_after(self, response: httpx.Response) -> float | None:
+        if response.status_code != 429:
+            return None
+        try:
+            return float(response.json()["parameters"]["retry_after"])
+        except Exception:
+            header = response.headers.get("Retry-After")
+            return float(header) if header and header.isdigit() else 1.0
+
+    async def send_message(
+        self,
+        chat_id: int | str,
+        text: str,
+        parse_mode: str = "HTML",
+        reply_markup: dict = None
+    ) -> bool:
+        result = await self.deliver_message(chat_id, text, parse_mode, reply_markup)
+        return result.ok
     
     async def notify_new_like(
         self,
         chat_id: int | str,
-    ) -> bool:
+    ) -> DeliveryResult:
         self.logger.debug(
             "Sending new like notification",
             extra={
@@ -128,9 +197,9 @@ class TelegramNotificationService:
             ]
         }
         
-        result = await self.send_message(chat_id, text, reply_markup=reply_markup)
+        result = await self.deliver_message(chat_id, text, reply_markup=reply_markup)
         
-        if result:
+        if result.ok:
             self.logger.debug(
                 "New like notification sent",
                 extra={
@@ -142,12 +211,46 @@ class TelegramNotificationService:
         
         return result
     
+    async def notify_like_digest(
+        self,
+        chat_id: int | str,
+        count: int,
+    ) -> DeliveryResult:
+        self.logger.debug(
+            "Sending like digest notification",
+            extra={
+                "operation": "notify_like_digest",
+                "chat_id": str(chat_id),
+                "count": count
+            }
+        )
+        
+        if count % 10 == 1 and count % 100 != 11:
+            likes = "новый лайк"
+        elif count % 10 in (2, 3, 4) and count % 100 not in (12, 13, 14):
+            likes = "новых лайка"
+        else:
+            likes = "новых лайков"
+        
+        text = (
+            f"❤️ <b>У вас {count} {likes}!</b>\n"
+            f"Зайдите в бота, чтобы посмотреть анкеты! 👀"
+        )
+        
+        reply_markup = {
+            "inline_keyboard": [
+                [{"text": "👤 Посмотреть анкеты", "callback_data": "check_incoming"}]
+            ]
+        }
+        
+        return await self.deliver_message(chat_id, text, reply_markup=reply_markup)
+    
     async def notify_new_match(
         self,
         chat_id: int | str,
         matched_username: Optional[str] = None,
         matched_name: Optional[str] = None
-    ) -> bool:
+    ) -> DeliveryResult:
         sender = f"@{matched_username}" if matched_username else (matched_name or "Пользователь")
         
         self.logger.info(
@@ -167,9 +270,9 @@ class TelegramNotificationService:
             f"Теперь вы можете написать друг другу!"
         )
                 
-        result = await self.send_message(chat_id, text)
+        result = await self.deliver_message(chat_id, text)
         
-        if result:
+        if result.ok:
             self.logger.debug(
                 "New match notification sent",
                 extra={
@@ -239,32 +342,31 @@ class TelegramNotificationService:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(url, json=payload)
+            response = await self._get_client().post(url, json=payload, timeout=60.0)
+            
+            if response.status_code == 200:
+                self.logger.info(
+                    f"Media group sent to {chat_id}",
+                    extra={
+                        "operation": "send_media_group",
+                        "chat_id": str(chat_id),
+                        "media_sent": len(media_items[:10]),
+                        "status": "success"
+                    }
+                )
+                return True
+            else:
+                self.logger.error(
+                    f"Failed to send media group to {chat_id}",
+                    extra={
+                        "operation": "send_media_group",
+                        "chat_id": str(chat_id),
+                        "status_code": response.status_code,
+                        "response": response.text[:200] if response.text else None
+                    }
+                )
+                return False
                 
-                if response.status_code == 200:
-                    self.logger.info(
-                        f"Media group sent to {chat_id}",
-                        extra={
-                            "operation": "send_media_group",
-                            "chat_id": str(chat_id),
-                            "media_sent": len(media_items[:10]),
-                            "status": "success"
-                        }
-                    )
-                    return True
-                else:
-                    self.logger.error(
-                        f"Failed to send media group to {chat_id}",
-                        extra={
-                            "operation": "send_media_group",
-                            "chat_id": str(chat_id),
-                            "status_code": response.status_code,
-                            "response": response.text[:200] if response.text else None
-                        }
-                    )
-                    return False
-                    
         except httpx.TimeoutException as e:
             self.logger.error(
                 f"Timeout sending media group to {chat_id}",
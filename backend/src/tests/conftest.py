@@ -78,26 +78,54 @@ async def client(session):
     app.dependency_overrides = {}
 
 
+@pytest_asyncio.fixture(scope="function")
+async def redis_cache():
+    from src.core.config import settings
+    from src.services.cache import Cache
+    
+    test_cache = Cache(settings.REDIS_URL, auth_ttl=settings.AUTH_CACHE_TTL)
+    yield test_cache
+    await test_cache.close()
+
+
+@pytest.fixture(autouse=True)
+def mock_auth_cache():
+    from src.services.cache import cache
+    
+    with patch.object(cache, 'get_auth', AsyncMock(return_value=None)) as get_auth, \
+         patch.object(cache, 'set_auth', AsyncMock()) as set_auth, \
+         patch.object(cache, 'invalidate_auth', AsyncMock()) as invalidate_auth:
+        yield {
+            'get': get_auth,
+            'set': set_auth,
+            'invalidate': invalidate_auth,
+        }
+
+
 @pytest.fixture
 def mock_cache():
     with patch('src.services.profile.cache') as mock_profile_cache, \
-         patch('src.services.action.cache') as mock_action_cache, \
          patch('src.services.admin.cache') as mock_admin_cache:
         
-        for mock in [mock_profile_cache, mock_action_cache, mock_admin_cache]:
+        for mock in [mock_profile_cache, mock_admin_cache]:
             mock.add_seen_user_id = AsyncMock()
             mock.get_seen_user_ids = AsyncMock(return_value=[])
             mock.invalidate_profile = AsyncMock()
+            mock.invalidate_auth = AsyncMock()
             mock.add_seen = AsyncMock()
             mock.get_seen = AsyncMock(return_value=[])
             mock.pop_from_queue = AsyncMock(return_value=None)
+            mock.pop_next_profile = AsyncMock(return_value=(None, None))
             mock.get_cached_profile = AsyncMock(return_value=None)
             mock.fill_queue = AsyncMock()
+            mock.refill_queue = AsyncMock()
             mock.cache_profile = AsyncMock()
+            mock.cache_profiles_many = AsyncMock()
+            mock.get_swipe_stats = AsyncMock(return_value={'rate': 0.0, 'swipes': 0, 'refills': 0})
+            mock.record_refill = AsyncMock(return_value={'rate': 0.0, 'swipes': 0, 'refills': 0})
         
         yield {
             'profile': mock_profile_cache,
-            'action': mock_action_cache,
             'admin': mock_admin_cache,
         }
 
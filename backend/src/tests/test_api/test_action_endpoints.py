@@ -1,6 +1,5 @@
 import pytest
 from src.models.profile import GenderEnum
-from unittest.mock import AsyncMock
 
 
 @pytest.mark.asyncio
@@ -29,8 +28,6 @@ async def test_send_action_success(client, session, mock_cache):
         age=23
     )
     
-    mock_cache['action'].add_seen_user_id = AsyncMock()
-    
     response = await client.post(
         "/actions",
         json={"to_user_id": user2.id, "action_type": "like"},
@@ -69,8 +66,6 @@ async def test_send_action_multiple_times(client, session, mock_cache):
         age=23
     )
     
-    mock_cache['action'].add_seen_user_id = AsyncMock()
-    
     response1 = await client.post(
         "/actions",
         json={"to_user_id": user2.id, "action_type": "like"},
@@ -1,5 +1,4 @@
 import pytest
-from unittest.mock import AsyncMock
 from src.models.profile import GenderEnum
 from src.models.action import ActionTypeEnum
 
@@ -125,8 +124,6 @@ async def test_get_incoming_like_excludes_answered(client, session, mock_cache):
     await action_repo.mark_as_responded(action1.id)
     await session.commit()
     
-    mock_cache['action'].add_seen_user_id = AsyncMock()
-    
     response = await client.get(
         "/matches/incoming/next",
         headers={"X-Telegram-ID": "222333444"}
@@ -175,8 +172,6 @@ async def test_decide_incoming_like_creates_match(client, session, mock_cache):
         action_type=ActionTypeEnum.like.value.lower()
     )
     
-    mock_cache['action'].add_seen_user_id = AsyncMock()
-    
     response = await client.post(
         "/matches/incoming/decide",
         json={
@@ -230,8 +225,6 @@ async def test_decide_incoming_dislike_no_match(client, session, mock_cache):
         action_type=ActionTypeEnum.like.value.lower()
     )
     
-    mock_cache['action'].add_seen_user_id = AsyncMock()
-    
     response = await client.post(
         "/matches/incoming/decide",
         json={
@@ -105,6 +105,33 @@ async def test_create_profile_user_not_found(client):
     assert response.status_code == 401
 
 
+@pytest.mark.asyncio
+async def test_auth_cache_populated_on_miss(client, session, mock_auth_cache):
+    from src.repositories.user import UserRepository
+
+    user_repo = UserRepository(session)
+    user = await user_repo.create(telegram_id="303030303", username="@cached")
+    
+    response = await client.get("/profile", headers={"X-Telegram-ID": "303030303"})
+    
+    assert response.status_code == 404
+    mock_auth_cache['set'].assert_called_once_with("303030303", user.id, False, False)
+
+
+@pytest.mark.asyncio
+async def test_auth_cache_hit_rejects_banned_user(client, mock_auth_cache):
+    mock_auth_cache['get'].return_value = {
+        'user_id': 1,
+        'is_banned': True,
+        'has_active_profile': True,
+    }
+    
+    response = await client.get("/profile", headers={"X-Telegram-ID": "404040404"})
+    
+    assert response.status_code == 403
+    mock_auth_cache['set'].assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_get_profile_success(client, session):    
     from src.repositories.user import UserRepository
@@ -289,10 +316,9 @@ async def test_get_next_profile_success(client, session, mock_cache):
             embedding=[0.1 + i*0.01] * 384
         )
     
-    mock_cache['profile'].pop_from_queue = AsyncMock(return_value=None)
+    mock_cache['profile'].pop_next_profile = AsyncMock(return_value=(None, None))
     mock_cache['profile'].get_seen_user_ids = AsyncMock(return_value=[])
-    mock_cache['profile'].fill_queue = AsyncMock()
-    mock_cache['profile'].cache_profile = AsyncMock()
+    mock_cache['profile'].refill_queue = AsyncMock()
     mock_cache['profile'].add_seen_user_id = AsyncMock()
     
     response = await client.get(
@@ -325,7 +351,7 @@ async def test_get_next_profile_no_more_profiles(client, session, mock_cache):
         embedding=[0.5] * 384
     )
     
-    mock_cache['profile'].pop_from_queue = AsyncMock(return_value=None)
+    mock_cache['profile'].pop_next_profile = AsyncMock(return_value=(None, None))
     mock_cache['profile'].get_seen_user_ids = AsyncMock(return_value=[])
 
     response = await client.get(
@@ -344,7 +370,7 @@ async def test_get_next_profile_user_has_no_profile(client, session, mock_cache)
     
     await user_repo.create(telegram_id="707070707", username="@no_profile_next")
     
-    mock_cache['profile'].pop_from_queue = AsyncMock(return_value=None)
+    mock_cache['profile'].pop_next_profile = AsyncMock(return_value=(None, None))
     mock_cache['profile'].get_seen_user_ids = AsyncMock(return_value=[])
     
     response = await client.get(
@@ -410,7 +436,7 @@ async def test_get_next_profile_excludes_seen(client, session, mock_cache):
     )
     await session.commit()
     
-    mock_cache['profile'].pop_from_queue = AsyncMock(return_value=None)
+    mock_cache['profile'].pop_next_profile = AsyncMock(return_value=(None, None))
     mock_cache['profile'].get_seen_user_ids = AsyncMock(return_value=[user1.id])
     
     response = await client.get(
@@ -114,7 +114,58 @@ async def test_get_next_incoming_like_returns_one(session):
         action_type="like"
     )
     
-    action = await action_repo.get_next_incoming_like(receiver.id)
+    action, profile = await action_repo.get_next_incoming_like(receiver.id)
     
-    assert action is not None
     assert action.from_user_id in [sender1.id, sender2.id]
+    assert profile.user_id == action.from_user_id
+
+
+@pytest.mark.asyncio
+async def test_get_next_incoming_like_skips_inactive_likers(session):
+    from datetime import datetime, timedelta
+    from src.repositories.profile import ProfileRepository
+    from src.models.profile import GenderEnum
+    
+    user_repo = UserRepository(session)
+    profile_repo = ProfileRepository(session)
+    action_repo = ActionRepository(session)
+    
+    receiver = await user_repo.create(telegram_id="recv_skip")
+    active = await user_repo.create(telegram_id="send_skip_active")
+    inactive = await user_repo.create(telegram_id="send_skip_inactive")
+    
+    await profile_repo.create(
+        user_id=active.id,
+        name="Active",
+        description="Люблю спорт",
+        gender=GenderEnum.male,
+        age=30
+    )
+    await profile_repo.create(
+        user_id=inactive.id,
+        name="Inactive",
+        description="Люблю кроссфит",
+        gender=GenderEnum.male,
+        age=28,
+        is_active=False
+    )
+    
+    older = await action_repo.create(
+        from_user_id=active.id,
+        to_user_id=receiver.id,
+        action_type="like",
+        created_at=datetime.utcnow() - timedelta(hours=1)
+    )
+    await action_repo.create(
+        from_user_id=inactive.id,
+        to_user_id=receiver.id,
+        action_type="like"
+    )
+    
+    action, profile = await action_repo.get_next_incoming_like(receiver.id)
+    
+    assert action.id == older.id
+    assert profile.name == "Active"
+    
+    await action_repo.mark_as_responded(older.id)
+    assert await action_repo.get_next_incoming_like(receiver.id) is None
@@ -5,6 +5,12 @@ from src.repositories.admin import AdminRepository
 from src.repositories.user import UserRepository
 from src.repositories.profile import ProfileRepository
 from src.models.profile import GenderEnum
+from src.services.export import encode_csv
+
+
+async def _export_csv(repo: AdminRepository, **kwargs) -> str:
+    chunks = [chunk async for chunk in encode_csv(repo.iter_profile_rows(**kwargs))]
+    return b"".join(chunks).decode("utf-8-sig")
 
 
 @pytest.mark.asyncio
@@ -27,7 +33,7 @@ async def test_export_profiles_to_csv_basic(session):
         )
     
     repo = AdminRepository(session)
-    csv_content = await repo.export_profiles_to_csv(limit=10, offset=0)
+    csv_content = await _export_csv(repo, limit=10)
     
     reader = csv.reader(io.StringIO(csv_content))
     rows = list(reader)
@@ -62,11 +68,11 @@ async def test_export_profiles_filter_active(session):
     
     repo = AdminRepository(session)
     
-    csv_active = await repo.export_profiles_to_csv(limit=10, is_active=True)
+    csv_active = await _export_csv(repo, limit=10, is_active=True)
     assert "Active" in csv_active
     assert "Inactive" not in csv_active
     
-    csv_inactive = await repo.export_profiles_to_csv(limit=10, is_active=False)
+    csv_inactive = await _export_csv(repo, limit=10, is_active=False)
     assert "Inactive" in csv_inactive
     assert "Active" not in csv_inactive
 
@@ -87,12 +93,58 @@ async def test_export_profiles_pagination(session):
     
     repo = AdminRepository(session)
     
-    csv_page1 = await repo.export_profiles_to_csv(limit=2, offset=0)
-    rows1 = csv_page1.strip().split('\n')
+    csv_page1 = await _export_csv(repo, limit=2)
+    rows1 = list(csv.reader(io.StringIO(csv_page1)))
     assert len(rows1) == 3
     
-    csv_page2 = await repo.export_profiles_to_csv(limit=2, offset=2)
-    rows2 = csv_page2.strip().split('\n')
+    csv_page2 = await _export_csv(repo, limit=2, after_id=int(rows1[-1][0]))
+    rows2 = list(csv.reader(io.StringIO(csv_page2)))
     assert len(rows2) == 3
     
-    assert rows1[1] != rows2[1]
\ No newline at end of file
+    assert rows1[1] != rows2[1]
+    assert int(rows2[1][0]) > int(rows1[-1][0])
+
+
+@pytest.mark.asyncio
+async def test_iter_profile_rows_batches(session):
+    user_repo = UserRepository(session)
+    profile_repo = ProfileRepository(session)
+    
+    for i in range(5):
+        user = await user_repo.create(telegram_id=f"batch{i}")
+        await profile_repo.create(
+            user_id=user.id,
+            name=f"Batch{i}",
+            description="Desc",
+            gender=GenderEnum.male
+        )
+    
+    repo = AdminRepository(session)
+    batches = [rows async for rows in repo.iter_profile_rows(batch_size=2)]
+    
+    assert [len(rows) for rows in batches][:2] == [2, 2]
+    profile_ids = [row.profile_id for rows in batches for row in rows]
+    assert profile_ids == sorted(profile_ids)
+
+
+@pytest.mark.asyncio
+async def test_iter_profile_rows_ends_transaction_between_batches(session):
+    user_repo = UserRepository(session)
+    profile_repo = ProfileRepository(session)
+    
+    for i in range(3):
+        user = await user_repo.create(telegram_id=f"txbatch{i}")
+        await profile_repo.create(
+            user_id=user.id,
+            name=f"TxBatch{i}",
+            description="Desc",
+            gender=GenderEnum.male
+        )
+    
+    repo = AdminRepository(session)
+    batches = 0
+    async for rows in repo.iter_profile_rows(batch_size=1):
+        assert not session.in_transaction()
+        batches += 1
+    
+    assert batches == 3
\ No newline at end of file
@@ -0,0 +1,71 @@
+import pytest
+from datetime import timedelta
+from sqlalchemy import func
+from src.repositories.broadcast import BroadcastJobRepository
+from src.repositories.user import UserRepository
+from src.models.broadcast import BroadcastStatusEnum
+
+
+@pytest.mark.asyncio
+async def test_claim_next_pending_job(session):
+    admin = await UserRepository(session).create(telegram_id="910001")
+    repo = BroadcastJobRepository(session)
+    job = await repo.create(admin_id=admin.id, admin_chat_id="910001", message_text="Привет!")
+    
+    claimed = await repo.claim_next(stale_after=timedelta(minutes=2))
+    
+    assert claimed.id == job.id
+    assert claimed.status == BroadcastStatusEnum.running
+    assert claimed.heartbeat_at is not None
+    assert await repo.claim_next(stale_after=timedelta(minutes=2)) is None
+
+
+@pytest.mark.asyncio
+async def test_claim_next_resumes_stale_job(session):
+    repo = BroadcastJobRepository(session)
+    job = await repo.create(
+        admin_chat_id="910002",
+        message_text="Привет!",
+        status=BroadcastStatusEnum.running,
+        last_user_id=500,
+        heartbeat_at=func.now() - timedelta(minutes=10)
+    )
+    
+    claimed = await repo.claim_next(stale_after=timedelta(minutes=2))
+    
+    assert claimed.id == job.id
+    assert claimed.last_user_id == 500
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_and_finish(session):
+    repo = BroadcastJobRepository(session)
+    job = await repo.create(admin_chat_id="910003", message_text="Привет!")
+    
+    await repo.checkpoint(job, 42, {"total": 3, "sent": 2, "failed": 0, "blocked": 1, "retried": 0})
+    await repo.finish(job, BroadcastStatusEnum.completed)
+    
+    assert job.last_user_id == 42
+    assert job.stats["blocked"] == 1
+    assert job.status == BroadcastStatusEnum.completed
+    assert job.finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_released_job_waits_for_backoff(session):
+    repo = BroadcastJobRepository(session)
+    job = await repo.create(admin_chat_id="910004", message_text="Привет!")
+    
+    claimed = await repo.claim_next(stale_after=timedelta(minutes=2))
+    await repo.finish(
+        claimed,
+        BroadcastStatusEnum.pending,
+        error="RuntimeError: boom",
+        retry_after=timedelta(minutes=5)
+    )
+    
+    assert await repo.claim_next(stale_after=timedelta(minutes=2)) is None
+    
+    await repo.update(job, available_at=func.now() - timedelta(seconds=1))
+    
+    assert (await repo.claim_next(stale_after=timedelta(minutes=2))).id == job.id
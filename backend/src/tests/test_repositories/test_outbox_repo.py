@@ -0,0 +1,34 @@
+import pytest
+from datetime import timedelta
+from src.repositories.outbox import OutboxRepository
+from src.models.outbox import OutboxKindEnum
+
+
+@pytest.mark.asyncio
+async def test_claim_batch_leases_events(session):
+    repo = OutboxRepository(session)
+    repo.add(OutboxKindEnum.seen, user_id=1, seen_user_id=2)
+    repo.add(OutboxKindEnum.like, user_id=2)
+    await session.flush()
+    
+    claimed = await repo.claim_batch(10, lease=timedelta(minutes=1))
+    
+    assert [event.kind for event in claimed] == ["seen", "like"]
+    assert claimed[1].payload == {"user_id": 2}
+    assert await repo.claim_batch(10, lease=timedelta(minutes=1)) == []
+
+
+@pytest.mark.asyncio
+async def test_complete_and_reschedule(session):
+    repo = OutboxRepository(session)
+    done = repo.add(OutboxKindEnum.like, user_id=2)
+    retried = repo.add(OutboxKindEnum.match, user_id=1, matched_user_id=2)
+    await session.flush()
+    
+    await repo.claim_batch(10, lease=timedelta(minutes=1))
+    await repo.complete([done.id])
+    await repo.reschedule(retried.id, 0, error="flood limit")
+    
+    assert await repo.get(done.id) is None
+    reclaimed = await repo.claim_batch(10, lease=timedelta(minutes=1))
+    assert [event.id for event in reclaimed] == [retried.id]
@@ -1,7 +1,14 @@
+import random
+import re
 import pytest
-from src.repositories.profile import ProfileRepository
+from sqlalchemy import event, text
+from sqlalchemy.exc import InvalidRequestError
+from src.repositories.profile import ProfileRepository, exploration_quota
 from src.repositories.user import UserRepository
+from src.repositories.action import ActionRepository
 from src.models.profile import GenderEnum
+from src.models.action import ActionTypeEnum
+from src.core.config import settings
 
 
 @pytest.mark.asyncio
@@ -90,6 +97,30 @@ async def test_delete_profile(session):
     assert found is None
 
 
+@pytest.mark.asyncio
+async def test_get_by_user_id_defers_embedding(session):
+    user_repo = UserRepository(session)
+    user = await user_repo.create(telegram_id="121212")
+    
+    repo = ProfileRepository(session)
+    await repo.create(
+        user_id=user.id,
+        name="Deferred",
+        description="Desc",
+        gender=GenderEnum.male,
+        embedding=[0.1] * 384
+    )
+    session.expunge_all()
+    
+    profile = await repo.get_by_user_id(user.id)
+    with pytest.raises(InvalidRequestError):
+        profile.embedding
+    
+    embedding = await repo.get_embedding_by_user_id(user.id)
+    assert len(embedding) == 384
+    assert embedding[0] == pytest.approx(0.1)
+
+
 @pytest.mark.asyncio
 async def test_get_similar_profiles(session):
     user_repo = UserRepository(session)
@@ -155,6 +186,31 @@ async def test_get_random_profiles(session):
     assert all(p.is_active for p in random_profiles)
 
 
+@pytest.mark.asyncio
+async def test_get_random_profiles_excludes_profile_ids(session):
+    user_repo = UserRepository(session)
+    profile_repo = ProfileRepository(session)
+    
+    profile_ids = []
+    for i in range(3):
+        user = await user_repo.create(telegram_id=f"61000{i}")
+        profile = await profile_repo.create(
+            user_id=user.id,
+            name=f"Queued{i}",
+            description="Desc",
+            gender=GenderEnum.male
+        )
+        profile_ids.append(profile.id)
+    
+    random_profiles = await profile_repo.get_random_profiles(
+        seen_user_ids=[],
+        limit=10,
+        exclude_profile_ids=profile_ids[:2]
+    )
+    
+    assert [p.id for p in random_profiles] == [profile_ids[2]]
+
+
 @pytest.mark.asyncio
 async def test_get_similar_excludes_seen(session):
     user_repo = UserRepository(session)
@@ -188,4 +244,251 @@ async def test_get_similar_excludes_seen(session):
     )
     
     assert len(similar) == 1
-    assert similar[0].user_id == ids[2]
\ No newline at end of file
+    assert similar[0].user_id == ids[2]
+
+@pytest.mark.asyncio
+async def test_get_similar_profiles_orders_by_distance(session):
+    user_repo = UserRepository(session)
+    profile_repo = ProfileRepository(session)
+    
+    far_user = await user_repo.create(telegram_id="710001")
+    await profile_repo.create(
+        user_id=far_user.id,
+        name="Far",
+        description="Desc",
+        gender=GenderEnum.female,
+        embedding=[0.1, -0.1] * 192
+    )
+    
+    near_user = await user_repo.create(telegram_id="710002")
+    await profile_repo.create(
+        user_id=near_user.id,
+        name="Near",
+        description="Desc",
+        gender=GenderEnum.female,
+        embedding=[0.1] * 383 + [0.2]
+    )
+    
+    similar = await profile_repo.get_similar_profiles(
+        user_embedding=[0.1] * 384,
+        seen_user_ids=[],
+        limit=10,
+    )
+    
+    assert [p.name for p in similar] == ["Near", "Far"]
+
+
+@pytest.mark.asyncio
+async def test_get_similar_excludes_acted_users(session):
+    user_repo = UserRepository(session)
+    profile_repo = ProfileRepository(session)
+    action_repo = ActionRepository(session)
+    
+    current = await user_repo.create(telegram_id="720000")
+    await profile_repo.create(
+        user_id=current.id,
+        name="Current",
+        description="Test",
+        gender=GenderEnum.male,
+        embedding=[0.1] * 384
+    )
+    
+    ids = []
+    for i in range(3):
+        user = await user_repo.create(telegram_id=f"72000{i+1}")
+        await profile_repo.create(
+            user_id=user.id,
+            name=f"User{i}",
+            description="Desc",
+            gender=GenderEnum.female,
+            embedding=[0.1] * 384
+        )
+        ids.append(user.id)
+    
+    await action_repo.create(
+        from_user_id=current.id,
+        to_user_id=ids[0],
+        action_type=ActionTypeEnum.dislike
+    )
+    await action_repo.create(
+        from_user_id=ids[1],
+        to_user_id=current.id,
+        action_type=ActionTypeEnum.like
+    )
+    
+    similar = await profile_repo.get_similar_profiles(
+        user_embedding=[0.1] * 384,
+        seen_user_ids=[],
+        limit=10,
+        user_id=current.id,
+    )
+    
+    assert sorted(p.user_id for p in similar) == ids[1:]
+
+
+@pytest.mark.asyncio
+async def test_get_similar_scans_past_excluded_neighbours(session):
+    user_repo = UserRepository(session)
+    profile_repo = ProfileRepository(session)
+    action_repo = ActionRepository(session)
+    
+    current = await user_repo.create(telegram_id="725000")
+    
+    excluded = settings.VECTOR_HNSW_EF_SEARCH + 10
+    seen_ids = []
+    for i in range(excluded):
+        user = await user_repo.create(telegram_id=f"7251{i:03d}")
+        await profile_repo.create(
+            user_id=user.id,
+            name=f"Near{i}",
+            description="Desc",
+            gender=GenderEnum.female,
+            embedding=[0.1] * 383 + [0.1 + i * 0.001]
+        )
+        if i % 2:
+            seen_ids.append(user.id)
+        else:
+            await action_repo.create(
+                from_user_id=current.id,
+                to_user_id=user.id,
+                action_type=ActionTypeEnum.dislike
+            )
+    
+    far_ids = []
+    for i in range(3):
+        user = await user_repo.create(telegram_id=f"7252{i:03d}")
+        await profile_repo.create(
+            user_id=user.id,
+            name=f"Far{i}",
+            description="Desc",
+            gender=GenderEnum.female,
+            embedding=[0.1, -0.1 * (i + 1)] * 192
+        )
+        far_ids.append(user.id)
+    
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+    similar = await profile_repo.get_similar_profiles(
+        user_embedding=[0.1] * 384,
+        seen_user_ids=seen_ids,
+        limit=3,
+        user_id=current.id,
+    )
+    
+    assert [p.user_id for p in similar] == far_ids
+
+
+@pytest.mark.asyncio
+async def test_get_candidates_mixes_similar_and_sampled(session):
+    user_repo = UserRepository(session)
+    profile_repo = ProfileRepository(session)
+    
+    for i in range(8):
+        user = await user_repo.create(telegram_id=f"73000{i}")
+        await profile_repo.create(
+            user_id=user.id,
+            name=f"Candidate{i}",
+            description="Desc",
+            gender=GenderEnum.female,
+            embedding=[0.1 + i * 0.01] * 384
+        )
+    
+    candidates = await profile_repo.get_candidates(
+        user_embedding=[0.1] * 384,
+        seen_user_ids=[],
+        limit=6,
+        exploration_ratio=0.5,
+    )
+    
+    ids = [p.id for p in candidates]
+    assert len(ids) == 6
+    assert len(set(ids)) == 6
+    
+    sampled = await profile_repo.get_candidates(
+        user_embedding=None,
+        seen_user_ids=[],
+        limit=5,
+    )
+    
+    assert len(sampled) == 5
+    assert all(p.is_active for p in sampled)
+
+
+@pytest.mark.parametrize("limit", [1, 2, 4, 10])
+def test_exploration_quota_keeps_configured_mix_for_small_limits(limit):
+    random.seed(limit)
+    draws = 5000
+    
+    explored = sum(exploration_quota(limit, 0.2) for _ in range(draws))
+    
+    assert explored / (draws * limit) == pytest.approx(0.2, abs=0.02)
+
+
+def test_exploration_quota_is_exact_for_whole_shares():
+    assert {exploration_quota(10, 0.2) for _ in range(100)} == {2}
+    assert {exploration_quota(3, 0) for _ in range(100)} == {0}
+    assert {exploration_quota(3, 1) for _ in range(100)} == {3}
+
+
+@pytest.mark.asyncio
+async def test_get_candidates_fills_prefetch_beyond_ef_search(session):
+    user_repo = UserRepository(session)
+    profile_repo = ProfileRepository(session)
+    
+    limit = settings.SWIPE_PREFETCH_MAX + 1
+    assert limit > settings.VECTOR_HNSW_EF_SEARCH
+    
+    for i in range(limit + 10):
+        user = await user_repo.create(telegram_id=f"7260{i:03d}")
+        await profile_repo.create(
+            user_id=user.id,
+            name=f"Prefetch{i}",
+            description="Desc",
+            gender=GenderEnum.female,
+            embedding=[0.1] * 383 + [0.1 + i * 0.001]
+        )
+    
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+    candidates = await profile_repo.get_candidates(
+        user_embedding=[0.1] * 384,
+        seen_user_ids=[],
+        limit=limit,
+        exploration_ratio=0,
+    )
+    
+    assert len(candidates) == limit
+
+
+@pytest.mark.asyncio
+async def test_get_candidates_does_not_select_embedding(session):
+    user_repo = UserRepository(session)
+    profile_repo = ProfileRepository(session)
+    
+    user = await user_repo.create(telegram_id="727000")
+    await profile_repo.create(
+        user_id=user.id,
+        name="Narrow",
+        description="Desc",
+        gender=GenderEnum.female,
+        embedding=[0.1] * 384
+    )
+    
+    statements = []
+    engine = session.bind.sync_engine
+    
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        candidates = await profile_repo.get_candidates(
+            user_embedding=[0.1] * 384,
+            seen_user_ids=[],
+            limit=5,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    
+    assert [p.name for p in candidates] == ["Narrow"]
+    query = statements[-1]
+    assert "UNION ALL" in query
+    assert not re.search(r"profiles\.embedding(?!\s*<[=#-]>)", query)
@@ -0,0 +1,145 @@
+import importlib.util
+import json
+import pytest
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+from sqlalchemy import event, text
+from src.db.vector import EMBEDDING_INDEX_NAME, embedding_index_options
+from src.repositories.action import ActionRepository
+from src.repositories.admin import AdminRepository
+from src.repositories.broadcast import BroadcastJobRepository
+from src.repositories.outbox import OutboxRepository
+from src.repositories.profile import ProfileRepository
+from src.repositories.user import UserRepository
+
+EMBEDDING = [0.1] * 384
+
+
+@contextmanager
+def _capture_statements(session):
+    statements = []
+    engine = session.bind.sync_engine
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _index_names(plan: dict) -> set[str]:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        names |= _index_names(child)
+    return names
+
+
+async def _used_indexes(session, call) -> set[str]:
+    with _capture_statements(session) as statements:
+        await call()
+
+    statement, parameters = [
+        (statement, parameters) for statement, parameters in statements
+        if "set_config" not in statement
+    ][-1]
+
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return _index_names(plan[0]["Plan"])
+
+
+async def _first_export_batch(session):
+    return [batch async for batch in AdminRepository(session).iter_profile_rows(batch_size=10)]
+
+
+QUERIES = [
+    ("user_get", lambda s: UserRepository(s).get(1), {"users_pkey"}),
+    ("user_by_telegram_id", lambda s: UserRepository(s).get_by_telegram_id("plan"), {"idx_users_telegram_id"}),
+    ("user_by_ids", lambda s: UserRepository(s).get_by_ids([1, 2]), {"users_pkey"}),
+    ("active_telegram_ids", lambda s: UserRepository(s).get_active_telegram_ids(after_id=0), {"users_pkey"}),
+    ("profile_by_user_id", lambda s: ProfileRepository(s).get_by_user_id(1), {"profiles_user_id_key"}),
+    ("profiles_by_user_ids", lambda s: ProfileRepository(s).get_by_user_ids([1, 2]), {"profiles_user_id_key"}),
+    ("embedding_by_user_id", lambda s: ProfileRepository(s).get_embedding_by_user_id(1), {"profiles_user_id_key"}),
+    (
+        "similar_profiles",
+        lambda s: ProfileRepository(s).get_similar_profiles(EMBEDDING, [], user_id=1),
+        {"idx_profiles_embedding", "idx_actions_pair"}
+    ),
+    (
+        "candidates",
+        lambda s: ProfileRepository(s).get_candidates(EMBEDDING, [], user_id=1),
+        {"idx_profiles_embedding", "idx_profiles_sample_key", "idx_actions_pair"}
+    ),
+    ("action_by_pair", lambda s: ActionRepository(s).get_action(1, 2), {"idx_actions_pair"}),
+    (
+        "next_incoming_like",
+        lambda s: ActionRepository(s).get_next_incoming_like(1),
+        {"idx_actions_unresponded_likes", "profiles_user_id_key"}
+    ),
+    ("mark_as_responded", lambda s: ActionRepository(s).mark_as_responded(1), {"user_actions_pkey"}),
+    ("export_profiles", _first_export_batch, {"profiles_pkey"}),
+    (
+        "claim_broadcast_job",
+        lambda s: BroadcastJobRepository(s).claim_next(stale_after=timedelta(minutes=2)),
+        {"idx_broadcast_jobs_status"}
+    ),
+    (
+        "claim_outbox_batch",
+        lambda s: OutboxRepository(s).claim_batch(10, lease=timedelta(minutes=1)),
+        {"outbox_events_pkey"}
+    ),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("call,expected", [q[1:] for q in QUERIES], ids=[q[0] for q in QUERIES])
+async def test_repository_query_uses_indexes(session, call, expected):
+    used = await _used_indexes(session, lambda: call(session))
+
+    assert expected <= used, f"expected {sorted(expected)}, plan used {sorted(used)}"
+
+
+@pytest.mark.asyncio
+async def test_dropped_indexes_are_gone(session):
+    result = await session.execute(text("SELECT indexname FROM pg_indexes WHERE schemaname = 'public'"))
+    indexes = set(result.scalars().all())
+
+    assert indexes.isdisjoint({
+        "idx_actions_type",
+        "idx_actions_from_user",
+        "idx_actions_incoming",
+        "idx_profiles_active",
+        "idx_profiles_gender",
+        "ix_users_id",
+        "ix_profiles_id",
+        "ix_user_actions_id",
+        "ix_matches_id",
+    })
+
+
+@pytest.mark.asyncio
+async def test_next_incoming_like_uses_partial_index_with_generic_plan(session):
+    await session.execute(text("SET LOCAL plan_cache_mode = force_generic_plan"))
+
+    used = await _used_indexes(session, lambda: ActionRepository(session).get_next_incoming_like(1))
+
+    assert "idx_actions_unresponded_likes" in used, f"plan used {sorted(used)}"
+
+
+def test_embedding_index_matches_latest_migration():
+    path = Path(__file__).parents[3] / "alembic" / "versions" / "202610181500_query_shape_indexes.py"
+    spec = importlib.util.spec_from_file_location("query_shape_indexes", path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    assert migration.EMBEDDING_INDEX_NAME == EMBEDDING_INDEX_NAME
+    assert migration.EMBEDDING_INDEX_OPTIONS == embedding_index_options()
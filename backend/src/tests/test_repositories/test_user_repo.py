@@ -143,4 +143,18 @@ async def test_create_if_not_exists_returns_existing(session):
     
     assert user1.id == user2.id
     assert user2.username == "@original"
-    assert user2.first_name != "ShouldNotChange"
\ No newline at end of file
+    assert user2.first_name != "ShouldNotChange"
+
+
+@pytest.mark.asyncio
+async def test_iter_active_telegram_ids_keyset(session):
+    repo = UserRepository(session)
+    
+    for i in range(5):
+        await repo.create(telegram_id=f"50000{i}", is_banned=(i == 2))
+    
+    batches = [batch async for batch in repo.iter_active_telegram_ids(batch_size=2)]
+    telegram_ids = [telegram_id for batch in batches for _, telegram_id in batch]
+    
+    assert telegram_ids == ["500000", "500001", "500003", "500004"]
+    assert [len(batch) for batch in batches] == [2, 2]
@@ -1,7 +1,8 @@
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock, call
 from src.services.action import ActionService
 from src.models.action import ActionTypeEnum
+from src.models.outbox import OutboxKindEnum
 from src.core.exceptions.action import (
     SelfActionException,
     ActionAlreadyRespondedException
@@ -15,15 +16,13 @@ def mock_repos():
          patch('src.services.action.ActionRepository') as MockActionRepo, \
          patch('src.services.action.MatchRepository') as MockMatchRepo, \
          patch('src.services.action.ProfileRepository') as MockProfileRepo, \
-         patch('src.services.action.cache') as MockCache, \
-         patch('src.services.action.telegram_service') as MockTelegram:
+         patch('src.services.action.OutboxRepository') as MockOutboxRepo:
         
         mock_user_repo = MockUserRepo.return_value
         mock_action_repo = MockActionRepo.return_value
         mock_match_repo = MockMatchRepo.return_value
         mock_profile_repo = MockProfileRepo.return_value
-        mock_cache = MockCache
-        mock_telegram = MockTelegram
+        mock_outbox_repo = MockOutboxRepo.return_value
         
         mock_user_repo.get = AsyncMock(return_value=MagicMock(id=1, telegram_id="123", username="@test", first_name="Test"))
         mock_action_repo.create = AsyncMock(return_value=MagicMock(id=999, is_responded=False))
@@ -31,21 +30,14 @@ def mock_repos():
         mock_action_repo.mark_as_responded = AsyncMock()
         mock_match_repo.create_match = AsyncMock(return_value=MagicMock(id=100))
         mock_profile_repo.get_by_user_id = AsyncMock()
-        
-        mock_cache.add_seen_user_id = AsyncMock()
-        
-        mock_telegram.send_message = AsyncMock(return_value=True)
-        mock_telegram.notify_new_like = AsyncMock()
-        mock_telegram.notify_new_match = AsyncMock()
-        mock_telegram.send_media_group = AsyncMock()
+        mock_outbox_repo.add = MagicMock()
         
         yield {
             'user': mock_user_repo,
             'action': mock_action_repo,
             'match': mock_match_repo,
             'profile': mock_profile_repo,
-            'cache': mock_cache,
-            'telegram': mock_telegram,
+            'outbox': mock_outbox_repo,
         }
 
 
@@ -75,46 +67,38 @@ async def test_send_action_self_raises(action_service):
 
 
 @pytest.mark.asyncio
-async def test_send_like_sends_notification(action_service, mock_repos):
+async def test_send_like_writes_outbox_events(action_service, mock_repos):
     mock_action = MagicMock(id=999)
     mock_repos['action'].create = AsyncMock(return_value=mock_action)
     
-    with patch('src.services.action.telegram_service') as mock_telegram:
-        mock_telegram.notify_new_like = AsyncMock()
-        
-        await action_service.send_action(1, 2, ActionTypeEnum.like)
-        
-        mock_telegram.notify_new_like.assert_called_once()
+    await action_service.send_action(1, 2, ActionTypeEnum.like)
+    
+    mock_repos['outbox'].add.assert_has_calls([
+        call(OutboxKindEnum.seen, user_id=1, seen_user_id=2),
+        call(OutboxKindEnum.seen, user_id=2, seen_user_id=1),
+        call(OutboxKindEnum.like, user_id=2),
+    ])
 
 
 @pytest.mark.asyncio
-async def test_send_report_with_reason_sends_to_admin(action_service, mock_repos):
+async def test_send_report_with_reason_writes_outbox_event(action_service, mock_repos):
     mock_action = MagicMock(id=999)
     mock_repos['action'].create = AsyncMock(return_value=mock_action)
     
-    mock_profile = MagicMock(
-        name="Test",
-        description="Люблю тренироваться каждый день в зале",
-        gender="male",
-        age=25,
-        media=[]
+    await action_service.send_action(
+        from_user_id=1,
+        to_user_id=2,
+        action_type=ActionTypeEnum.report,
+        report_reason="Спам"
     )
-    mock_repos['profile'].get_by_user_id = AsyncMock(return_value=mock_profile)
-    
-    mock_user = MagicMock(username="testuser", telegram_id="123")
-    mock_repos['user'].get = AsyncMock(return_value=mock_user)
     
-    with patch('src.services.action.telegram_service') as mock_telegram:
-        mock_telegram.send_message = AsyncMock(return_value=True)
-        
-        await action_service.send_action(
-            from_user_id=1,
-            to_user_id=2,
-            action_type=ActionTypeEnum.report,
-            report_reason="Спам"
-        )
-        
-        mock_telegram.send_message.assert_called_once()
+    mock_repos['outbox'].add.assert_any_call(
+        OutboxKindEnum.report,
+        from_user_id=1,
+        to_user_id=2,
+        report_reason="Спам"
+    )
+    mock_repos['profile'].get_by_user_id.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -161,19 +145,20 @@ async def test_decide_on_incoming_like_creates_match(action_service, mock_repos)
     mock_profile = MagicMock(id=1, is_active=True)
     mock_repos['profile'].get_by_user_id = AsyncMock(return_value=mock_profile)
     
-    with patch('src.services.action.telegram_service') as mock_telegram:
-        mock_telegram.notify_new_match = AsyncMock()
-        
-        result = await action_service.decide_on_incoming(
-            viewer_user_id=2,
-            action_id=123,
-            decision_type=ActionTypeEnum.like,
-            report_reason=None
-        )
-        
-        assert 'match_id' in result
-        mock_repos['match'].create_match.assert_called_once_with(2, 1)
-        assert mock_telegram.notify_new_match.call_count == 2
+    result = await action_service.decide_on_incoming(
+        viewer_user_id=2,
+        action_id=123,
+        decision_type=ActionTypeEnum.like,
+        report_reason=None
+    )
+    
+    assert 'match_id' in result
+    mock_repos['match'].create_match.assert_called_once_with(2, 1)
+    mock_repos['outbox'].add.assert_has_calls([
+        call(OutboxKindEnum.seen, user_id=2, seen_user_id=1),
+        call(OutboxKindEnum.match, user_id=2, matched_user_id=1),
+        call(OutboxKindEnum.match, user_id=1, matched_user_id=2),
+    ])
 
 
 @pytest.mark.asyncio
@@ -262,16 +247,15 @@ async def test_get_next_incoming_like_returns_profile_and_action_id(action_servi
         is_responded=False
     )
     
-    mock_repos['action'].get_next_incoming_like = AsyncMock(return_value=incoming)
-    
     mock_profile = MagicMock(id=1, is_active=True)
-    mock_repos['profile'].get_by_user_id = AsyncMock(return_value=mock_profile)
+    mock_repos['action'].get_next_incoming_like = AsyncMock(return_value=(incoming, mock_profile))
     
     result = await action_service.get_next_incoming_like(user_id=2)
     
     assert result['profile'] == mock_profile
     assert result['action_id'] == 123
     mock_repos['action'].get_next_incoming_like.assert_called_once_with(2)
+    mock_repos['profile'].get_by_user_id.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -303,29 +287,26 @@ async def test_multiple_likes_same_users_proper_handling(action_service, mock_re
     mock_profile = MagicMock(id=1, is_active=True)
     mock_repos['profile'].get_by_user_id = AsyncMock(return_value=mock_profile)
     
-    with patch('src.services.action.telegram_service') as mock_telegram:
-        mock_telegram.notify_new_like = AsyncMock()
-        
-        result_1 = await action_service.send_action(
-            from_user_id=1,
-            to_user_id=2,
-            action_type=ActionTypeEnum.like
-        )
-        assert result_1 == 100
-        
-        result_2 = await action_service.send_action(
-            from_user_id=1,
-            to_user_id=2,
-            action_type=ActionTypeEnum.like
-        )
-        assert result_2 == 101
-        assert result_2 != result_1
-        
-        result_3 = await action_service.send_action(
-            from_user_id=1,
-            to_user_id=2,
-            action_type=ActionTypeEnum.like
-        )
-        assert result_3 == 102
-        
-        assert mock_repos['action'].create.call_count == 3
+    result_1 = await action_service.send_action(
+        from_user_id=1,
+        to_user_id=2,
+        action_type=ActionTypeEnum.like
+    )
+    assert result_1 == 100
+    
+    result_2 = await action_service.send_action(
+        from_user_id=1,
+        to_user_id=2,
+        action_type=ActionTypeEnum.like
+    )
+    assert result_2 == 101
+    assert result_2 != result_1
+    
+    result_3 = await action_service.send_action(
+        from_user_id=1,
+        to_user_id=2,
+        action_type=ActionTypeEnum.like
+    )
+    assert result_3 == 102
+    
+    assert mock_repos['action'].create.call_count == 3
@@ -1,8 +1,18 @@
+import gzip
+import json
+import numpy as np
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from src.services.admin import AdminService
-from src.core.exceptions.admin import InvalidPermissions
+from src.db.session import run_after_commit
+from src.core.exceptions.admin import BroadcastJobNotFound, InvalidPermissions, UnsupportedExportOption
 from src.core.exceptions.user import UserNotFound
+from src.services.telegram import DeliveryResult
+
+
+async def _rows(*batches):
+    for batch in batches:
+        yield batch
 
 
 @pytest.fixture
@@ -10,30 +20,41 @@ def mock_repos():
     with patch('src.services.admin.UserRepository') as MockUserRepo, \
          patch('src.services.admin.ProfileRepository') as MockProfileRepo, \
          patch('src.services.admin.AdminRepository') as MockAdminRepo, \
+         patch('src.services.admin.BroadcastJobRepository') as MockBroadcastRepo, \
          patch('src.services.admin.cache') as MockCache, \
          patch('src.services.admin.telegram_service') as MockTelegram:
         
         mock_user_repo = MockUserRepo.return_value
         mock_profile_repo = MockProfileRepo.return_value
         mock_admin_repo = MockAdminRepo.return_value
+        mock_broadcast_repo = MockBroadcastRepo.return_value
         mock_cache = MockCache
         mock_telegram = MockTelegram
         
         mock_user_repo.get = AsyncMock()
         mock_user_repo.update = AsyncMock()
-        mock_user_repo.get_active_telegram_ids = AsyncMock(return_value=[])
+        mock_user_repo.iter_active_telegram_ids = MagicMock(side_effect=lambda **kwargs: _rows())
         mock_profile_repo.get_by_user_id = AsyncMock()
         mock_profile_repo.delete = AsyncMock()
-        mock_admin_repo.export_profiles_to_csv = AsyncMock(return_value="csv_data")
+        mock_admin_repo.iter_profile_rows = MagicMock(side_effect=lambda **kwargs: _rows())
+        mock_broadcast_repo.create = AsyncMock()
+        mock_broadcast_repo.get = AsyncMock()
+        mock_broadcast_repo.checkpoint = AsyncMock()
+        mock_broadcast_repo.finish = AsyncMock()
         
         mock_cache.invalidate_profile = AsyncMock()
+        mock_cache.invalidate_auth = AsyncMock()
         
         mock_telegram.send_message = AsyncMock(return_value=True)
+        mock_telegram.deliver_message = AsyncMock(
+            return_value=DeliveryResult(ok=True, status_code=200)
+        )
         
         yield {
             'user': mock_user_repo,
             'profile': mock_profile_repo,
             'admin': mock_admin_repo,
+            'broadcast': mock_broadcast_repo,
             'cache': mock_cache,
             'telegram': mock_telegram,
         }
@@ -77,7 +98,7 @@ async def test_ensure_permissions_regular_user_raises(admin_service, mock_regula
 
 
 @pytest.mark.asyncio
-async def test_ban_user_success(admin_service, mock_repos, mock_admin_user):
+async def test_ban_user_success(admin_service, mock_repos, mock_admin_user, session):
     mock_target = MagicMock(
         id=42,
         telegram_id="banned_user",
@@ -96,6 +117,10 @@ async def test_ban_user_success(admin_service, mock_repos, mock_admin_user):
     mock_repos['user'].update.assert_called_once_with(mock_target, is_banned=True)
     mock_repos['profile'].delete.assert_called_once_with(mock_profile)
     mock_repos['cache'].invalidate_profile.assert_called_once_with(100)
+    mock_repos['cache'].invalidate_auth.assert_not_called()
+    
+    await run_after_commit(session)
+    mock_repos['cache'].invalidate_auth.assert_called_once_with(42)
 
 
 @pytest.mark.asyncio
@@ -116,55 +141,134 @@ async def test_ban_user_cannot_ban_self(admin_service, mock_repos, mock_admin_us
 
 @pytest.mark.asyncio
 async def test_export_profiles_to_csv(admin_service, mock_repos, mock_admin_user):
-    mock_csv = "profile_id,user_id,name\n1,2,Test"
-    mock_repos['admin'].export_profiles_to_csv = AsyncMock(return_value=mock_csv)
+    row = MagicMock(
+        profile_id=1, user_id=2, telegram_id="555", username=None, first_name="Test",
+        gender=None, age=None, description="Desc", media_count=0, is_active=True,
+        created_at=None, updated_at=None
+    )
+    row.name = "Test"
+    mock_repos['admin'].iter_profile_rows = MagicMock(return_value=_rows([row]))
     
-    result = await admin_service.export_profiles_to_csv(
+    chunks = await admin_service.export_profiles(
         admin=mock_admin_user,
         limit=100,
-        offset=0,
         is_active=True
     )
+    result = b"".join([chunk async for chunk in chunks]).decode("utf-8-sig")
     
-    assert result == mock_csv
+    assert result.startswith('"profile_id","user_id"')
+    assert '"1","2","555"' in result
     
-    mock_repos['admin'].export_profiles_to_csv.assert_called_once_with(
-        100, 0, True
+    mock_repos['admin'].iter_profile_rows.assert_called_once_with(
+        batch_size=1000, limit=100, after_id=0, is_active=True, include_embedding=False
     )
 
 
 @pytest.mark.asyncio
-async def test_run_broadcast_task_basic(admin_service, mock_repos, mock_admin_user):
-    with patch('src.services.admin.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
-        mock_sleep.return_value = None
-        
-        mock_repos['user'].get_active_telegram_ids = AsyncMock(
-            side_effect=[
-                [("111",), ("222",)],
-                []
-            ]
+async def test_export_profiles_ndjson_with_embedding(admin_service, mock_repos, mock_admin_user):
+    row = MagicMock(
+        profile_id=1, user_id=2, telegram_id="555", username=None, first_name="Test",
+        gender=None, age=21, description="Desc", media_count=0, is_active=True,
+        created_at=None, updated_at=None, embedding=np.full(384, 0.5, dtype=np.float32)
+    )
+    row.name = "Test"
+    mock_repos['admin'].iter_profile_rows = MagicMock(return_value=_rows([row]))
+    
+    chunks = await admin_service.export_profiles(
+        admin=mock_admin_user,
+        export_format="ndjson",
+        include_embedding=True
+    )
+    payload = gzip.decompress(b"".join([chunk async for chunk in chunks]))
+    record = json.loads(payload.decode("utf-8").splitlines()[0])
+    
+    assert record["telegram_id"] == "555"
+    assert len(record["embedding"]) == 384
+
+
+@pytest.mark.asyncio
+async def test_export_profiles_csv_with_embedding_raises(admin_service, mock_repos, mock_admin_user):
+    with pytest.raises(UnsupportedExportOption):
+        await admin_service.export_profiles(admin=mock_admin_user, include_embedding=True)
+
+
+@pytest.mark.asyncio
+async def test_export_profiles_regular_user_raises(admin_service, mock_repos, mock_regular_user):
+    with pytest.raises(InvalidPermissions):
+        await admin_service.export_profiles(admin=mock_regular_user)
+    
+    mock_repos['admin'].iter_profile_rows.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_broadcast_queues_job(admin_service, mock_repos, mock_admin_user):
+    await admin_service.create_broadcast(mock_admin_user, mock_admin_user.telegram_id, "Привет!")
+    
+    mock_repos['broadcast'].create.assert_called_once_with(
+        admin_id=999,
+        admin_chat_id="121231231",
+        message_text="Привет!"
+    )
+    mock_repos['telegram'].deliver_message.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_broadcast_regular_user_raises(admin_service, mock_repos, mock_regular_user):
+    with pytest.raises(InvalidPermissions):
+        await admin_service.create_broadcast(mock_regular_user, mock_regular_user.telegram_id, "Привет!")
+    
+    mock_repos['broadcast'].create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_broadcast_not_found(admin_service, mock_repos, mock_admin_user):
+    mock_repos['broadcast'].get.return_value = None
+    
+    with pytest.raises(BroadcastJobNotFound):
+        await admin_service.get_broadcast(mock_admin_user, 42)
+
+
+@pytest.mark.asyncio
+async def test_run_broadcast_job_resumes_from_checkpoint(admin_service, mock_repos):
+    job = MagicMock()
+    job.id = 7
+    job.admin_chat_id = "121231231"
+    job.message_text = "Тестовая рассылка"
+    job.last_user_id = 10
+    job.stats = {"total": 5, "sent": 5, "failed": 0, "blocked": 0, "retried": 0}
+    
+    mock_repos['user'].iter_active_telegram_ids = MagicMock(
+        return_value=_rows([(11, "111"), (12, "222")])
+    )
+    on_checkpoint = AsyncMock()
+    
+    import asyncio
+    try:
+        stats = await asyncio.wait_for(
+            admin_service.run_broadcast_job(job, on_checkpoint=on_checkpoint, batch_size=2),
+            timeout=5.0
         )
-        
-        import asyncio
-        try:
-            await asyncio.wait_for(
-                admin_service.run_broadcast_task(
-                    admin=mock_admin_user,
-                    admin_chat_id=121231231,
-                    message_text="Тестовая рассылка",
-                    batch_size=2,
-                    delay_between=0.01
-                ),
-                timeout=5.0
-            )
-        except asyncio.TimeoutError:
-            pytest.fail("Broadcast task timed out")
-        
+    except asyncio.TimeoutError:
+        pytest.fail("Broadcast job timed out")
+    
+    mock_repos['user'].iter_active_telegram_ids.assert_called_once_with(batch_size=2, after_id=10)
+    
     user_messages = [
-        call_args for call_args in mock_repos['telegram'].send_message.call_args_list
+        call_args for call_args in mock_repos['telegram'].deliver_message.call_args_list
         if call_args[1]['chat_id'] in ['111', '222']
     ]
     assert len(user_messages) == 2
+    assert stats["total"] == 7
+    assert stats["sent"] == 7
+    
+    checkpoint_args = mock_repos['broadcast'].checkpoint.call_args[0]
+    assert checkpoint_args[1] == 12
+    mock_repos['broadcast'].finish.assert_called_once()
+    assert on_checkpoint.await_count == 2
+    
+    stats_call = mock_repos['telegram'].send_message.call_args
+    assert stats_call[1]['chat_id'] == "121231231"
+    assert "Всего пользователей: 7" in stats_call[1]['text']
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,78 @@
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock
+from src.services.broadcast import BroadcastEngine
+from src.services.telegram import DeliveryResult
+
+
+async def _batches(*batches):
+    for batch in batches:
+        yield batch
+
+
+@pytest.mark.asyncio
+async def test_broadcast_counts_sent_and_blocked():
+    async def send(chat_id: str) -> DeliveryResult:
+        if chat_id == "2":
+            return DeliveryResult(ok=False, status_code=403)
+        return DeliveryResult(ok=True, status_code=200)
+
+    engine = BroadcastEngine(send, concurrency=4, rate=1000)
+    stats = await engine.run(_batches(["1", "2"], ["3"]))
+
+    assert stats["total"] == 3
+    assert stats["sent"] == 2
+    assert stats["blocked"] == 1
+    assert stats["failed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_broadcast_retries_after_flood_limit():
+    send = AsyncMock(side_effect=[
+        DeliveryResult(ok=False, status_code=429, retry_after=0.01),
+        DeliveryResult(ok=True, status_code=200),
+    ])
+    progress = AsyncMock()
+
+    engine = BroadcastEngine(send, concurrency=1, rate=1000, per_chat_interval=0, on_progress=progress)
+    stats = await engine.run(_batches(["1"]))
+
+    assert send.await_count == 2
+    assert stats["sent"] == 1
+    assert stats["retried"] == 1
+    progress.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_does_not_retry_bad_request():
+    send = AsyncMock(return_value=DeliveryResult(ok=False, status_code=400))
+
+    engine = BroadcastEngine(send, concurrency=1, rate=1000)
+    stats = await engine.run(_batches(["1"]))
+
+    assert send.await_count == 1
+    assert stats["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_broadcast_holds_senders_waiting_for_tokens_during_flood_pause():
+    sent_at = []
+    flood_at = []
+
+    async def send(chat_id: str) -> DeliveryResult:
+        if chat_id == "0" and not flood_at:
+            await asyncio.sleep(0.05)
+            flood_at.append(time.monotonic())
+            return DeliveryResult(ok=False, status_code=429, retry_after=1.0)
+        sent_at.append(time.monotonic())
+        await asyncio.sleep(0.05)
+        return DeliveryResult(ok=True, status_code=200)
+
+    engine = BroadcastEngine(send, concurrency=5, rate=2, per_chat_interval=0)
+    stats = await engine.run(_batches([str(i) for i in range(5)]))
+
+    assert stats["sent"] == 5
+    assert stats["retried"] == 1
+    assert any(at > flood_at[0] for at in sent_at)
+    assert all(at >= flood_at[0] + 1.0 for at in sent_at if at > flood_at[0])
@@ -0,0 +1,173 @@
+import asyncio
+import uuid
+import numpy as np
+import pytest
+from unittest.mock import patch
+from src.core.config import settings
+from src.services.cache import Cache
+
+
+@pytest.mark.asyncio
+async def test_embedding_round_trip_keeps_float32_values(redis_cache):
+    text_hash = uuid.uuid4().hex
+    embedding = np.random.default_rng(7).standard_normal(384).astype(np.float32).tolist()
+    
+    assert await redis_cache.get_embedding("test-model", text_hash) is None
+    
+    await redis_cache.set_embedding("test-model", text_hash, embedding)
+    cached = await redis_cache.get_embedding("test-model", text_hash)
+    
+    assert cached == embedding
+    assert await redis_cache.get_embedding("other-model", text_hash) is None
+
+
+@pytest.mark.asyncio
+async def test_auth_entry_round_trip_and_invalidation(redis_cache):
+    telegram_id = uuid.uuid4().hex
+    user_id = int(uuid.uuid4().int % 10**9)
+    
+    assert await redis_cache.get_auth(telegram_id) is None
+    
+    await redis_cache.set_auth(telegram_id, user_id, is_banned=False, has_active_profile=True)
+    
+    assert await redis_cache.get_auth(telegram_id) == {
+        'user_id': user_id,
+        'is_banned': False,
+        'has_active_profile': True,
+    }
+    
+    await redis_cache.invalidate_auth(user_id)
+    
+    assert await redis_cache.get_auth(telegram_id) is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_auth_without_entry_is_noop(redis_cache):
+    await redis_cache.invalidate_auth(int(uuid.uuid4().int % 10**9))
+
+
+def _queued_profile(profile_id: int, user_id: int) -> dict:
+    return {
+        'id': profile_id,
+        'user_id': user_id,
+        'name': f"Profile {profile_id}",
+        'description': "Desc",
+        'gender': "female",
+        'age': 25,
+        'media': [],
+        'is_active': True,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("refill_first", [True, False])
+async def test_concurrent_refill_and_top_up_do_not_duplicate(redis_cache, refill_first):
+    user_id = int(uuid.uuid4().int % 10**9)
+    base = user_id * 10
+    shown, queued, extra = _queued_profile(base, base + 1), [
+        _queued_profile(base + 2, base + 3),
+        _queued_profile(base + 4, base + 5),
+    ], _queued_profile(base + 6, base + 7)
+    
+    refill = redis_cache.refill_queue(user_id, queued, shown=shown)
+    top_up = redis_cache.append_queue(user_id, [shown] + queued + [extra])
+    await asyncio.gather(*((refill, top_up) if refill_first else (top_up, refill)))
+    
+    queue = await redis_cache.get_queue(user_id)
+    
+    assert len(queue) == len(set(queue))
+    assert shown['id'] not in queue
+    assert set(queue) == {base + 2, base + 4, base + 6}
+    assert shown['user_id'] in await redis_cache.get_seen_user_ids(user_id)
+    
+    assert await redis_cache.append_queue(user_id, [shown] + queued) == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesce_like_decision_is_stable_on_retry(redis_cache):
+    user_id = int(uuid.uuid4().int % 10**9)
+    first_event, second_event = user_id * 10, user_id * 10 + 1
+    
+    assert await redis_cache.coalesce_like(user_id, first_event) is True
+    assert await redis_cache.coalesce_like(user_id, second_event) is False
+    
+    assert await redis_cache.coalesce_like(user_id, first_event) is True
+    assert await redis_cache.coalesce_like(user_id, second_event) is False
+
+
+@pytest.mark.asyncio
+async def test_retried_coalesced_like_is_not_sent_again(redis_cache):
+    from src.models.outbox import OutboxEvent, OutboxKindEnum
+    from src.workers.outbox import coalesce_likes
+    
+    user_id = int(uuid.uuid4().int % 10**9)
+    sent = OutboxEvent(id=user_id * 10, kind=OutboxKindEnum.like.value, payload={"user_id": user_id}, attempts=1)
+    coalesced = OutboxEvent(id=user_id * 10 + 1, kind=OutboxKindEnum.like.value, payload={"user_id": user_id}, attempts=1)
+    
+    with patch('src.workers.outbox.cache', redis_cache):
+        assert set(await coalesce_likes([sent, coalesced])) == {coalesced.id}
+        
+        coalesced.attempts = 2
+        assert set(await coalesce_likes([coalesced])) == {coalesced.id}
+
+
+@pytest.mark.asyncio
+async def test_claimed_like_digest_survives_until_ack():
+    user_id = int(uuid.uuid4().int % 10**9)
+    digest_cache = Cache(settings.REDIS_URL, like_digest_window=1)
+    
+    try:
+        assert await digest_cache.coalesce_like(user_id, user_id * 10) is True
+        assert await digest_cache.coalesce_like(user_id, user_id * 10 + 1) is False
+        assert await digest_cache.coalesce_like(user_id, user_id * 10 + 2) is False
+        
+        await asyncio.sleep(1.1)
+        
+        claimed = dict(await digest_cache.claim_due_like_digests(1000, lease=0))
+        assert claimed[user_id] == 2
+        
+        reclaimed = dict(await digest_cache.claim_due_like_digests(1000, lease=60))
+        assert reclaimed[user_id] == 2
+        
+        assert user_id not in dict(await digest_cache.claim_due_like_digests(1000, lease=60))
+        
+        await digest_cache.ack_like_digests([(user_id, 2)])
+        await asyncio.sleep(1.1)
+        
+        assert user_id not in dict(await digest_cache.claim_due_like_digests(1000, lease=60))
+    finally:
+        await digest_cache.close()
+
+
+@pytest.mark.asyncio
+async def test_pop_from_empty_queue_leaves_refill_to_request_path(redis_cache):
+    user_id = int(uuid.uuid4().int % 10**9)
+    base = user_id * 10
+    redis_cache.SWIPE_EVENTS_KEY = f"test:swipe:events:{uuid.uuid4().hex}"
+    await redis_cache.ensure_group(redis_cache.SWIPE_EVENTS_KEY, "test")
+    
+    assert await redis_cache.pop_next_profile(user_id) == (None, None)
+    assert await redis_cache.read_group(redis_cache.SWIPE_EVENTS_KEY, "test", "test", count=10, block_ms=1) == []
+    
+    await redis_cache.refill_queue(user_id, [_queued_profile(base, base + 1)])
+    profile_id, _ = await redis_cache.pop_next_profile(user_id)
+    
+    assert profile_id == base
+    events = await redis_cache.read_group(redis_cache.SWIPE_EVENTS_KEY, "test", "test", count=10, block_ms=1)
+    assert [fields['user_id'] for _, fields in events] == [str(user_id)]
+
+
+@pytest.mark.asyncio
+async def test_pop_next_profile_returns_cached_profile_and_marks_owner_seen(redis_cache):
+    user_id = int(uuid.uuid4().int % 10**9)
+    base = user_id * 10
+    first, second = _queued_profile(base, base + 1), _queued_profile(base + 2, base + 3)
+    await redis_cache.refill_queue(user_id, [first, second])
+    
+    profile_id, profile = await redis_cache.pop_next_profile(user_id)
+    
+    assert profile_id == first['id']
+    assert profile['user_id'] == first['user_id']
+    assert await redis_cache.get_queue(user_id) == [second['id']]
+    assert first['user_id'] in await redis_cache.get_seen_user_ids(user_id)
+    assert second['user_id'] not in await redis_cache.get_seen_user_ids(user_id)
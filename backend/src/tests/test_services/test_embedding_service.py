@@ -0,0 +1,160 @@
+import asyncio
+import threading
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from tokenizers import Tokenizer
+from tokenizers.models import WordLevel
+from tokenizers.pre_tokenizers import Whitespace
+from src.core.lifespan import lifespan
+from src.main import app
+from src.services.embedding import EmbeddingModel, EmbeddingService, model_version, text_hash
+
+
+@pytest.fixture
+def mock_model():
+    with patch('src.services.embedding.EmbeddingModel') as MockModel, \
+         patch('src.services.embedding.cache') as MockCache:
+        MockModel.return_value.encode_batch = MagicMock(
+            side_effect=lambda texts: [[0.1] * 384 for _ in texts]
+        )
+        MockCache.get_embedding = AsyncMock(return_value=None)
+        MockCache.set_embedding = AsyncMock()
+        yield MockModel
+
+
+@pytest.mark.asyncio
+async def test_model_loaded_lazily(mock_model):
+    service = EmbeddingService()
+
+    mock_model.assert_not_called()
+
+    await service.warm_up()
+    await service.generate_embedding("Люблю жим лежа")
+
+    mock_model.assert_called_once()
+    service.close()
+
+
+@pytest.mark.asyncio
+async def test_inference_runs_on_dedicated_executor(mock_model):
+    threads = []
+
+    def encode_batch(texts):
+        threads.append(threading.current_thread())
+        return [[0.1] * 384 for _ in texts]
+
+    mock_model.return_value.encode_batch = MagicMock(side_effect=encode_batch)
+    service = EmbeddingService()
+
+    await service.generate_embedding("Люблю жим лежа")
+
+    assert threads
+    assert threads[0] is not threading.main_thread()
+    assert threads[0].name.startswith("embedding")
+    service.close()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_shuts_down_embedding_executor(mock_model):
+    service = EmbeddingService()
+
+    with patch('src.core.lifespan.embedding_service', service), \
+         patch('src.core.lifespan.telegram_service') as mock_telegram, \
+         patch('src.core.lifespan.cache') as mock_cache, \
+         patch('src.core.lifespan.init_logging'), \
+         patch('src.core.lifespan.stop_logging'):
+        mock_telegram.start = AsyncMock()
+        mock_telegram.close = AsyncMock()
+        mock_cache.close = AsyncMock()
+
+        async with lifespan(app):
+            executor = service._get_executor()
+            assert not executor._shutdown
+
+    assert executor._shutdown
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_batch(mock_model):
+    mock_model.return_value.encode_batch = MagicMock(
+        side_effect=lambda texts: [[float(len(text))] * 384 for text in texts]
+    )
+    service = EmbeddingService()
+    texts = ["a", "bb", "ccc", "dddd"]
+
+    embeddings = await asyncio.gather(*(service.generate_embedding(text) for text in texts))
+
+    mock_model.return_value.encode_batch.assert_called_once_with(texts)
+    assert [embedding[0] for embedding in embeddings] == [1.0, 2.0, 3.0, 4.0]
+    assert service.metrics()["batches"] == 1
+    assert service.metrics()["avg_batch_size"] == 4
+    assert service.metrics()["queue_depth"] == 0
+    service.close()
+
+
+@pytest.mark.asyncio
+async def test_batcher_follows_running_loop(mock_model):
+    service = EmbeddingService()
+
+    await service.generate_embedding("first loop")
+    await asyncio.to_thread(asyncio.run, service.generate_embedding("second loop"))
+    embedding = await service.generate_embedding("first loop again")
+
+    assert len(embedding) == 384
+    assert mock_model.return_value.encode_batch.call_count == 3
+    service.close()
+
+
+def test_encode_batch_pads_to_longest_text(tmp_path):
+    tokenizer = Tokenizer(WordLevel({"[PAD]": 0, "[UNK]": 1, "a": 2, "b": 3}, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = Whitespace()
+    shapes = []
+
+    def run(_, inputs):
+        shapes.append(inputs['input_ids'].shape)
+        return [np.ones((*inputs['input_ids'].shape, 384), dtype=np.float32)]
+
+    with patch('src.services.embedding.Tokenizer.from_file', return_value=tokenizer), \
+         patch('src.services.embedding.InferenceSession') as MockSession:
+        MockSession.return_value.run = MagicMock(side_effect=run)
+        model = EmbeddingModel(cache_dir=tmp_path)
+
+        embeddings = model.encode_batch(["a", "a b a"])
+        model.encode_batch(["b", "a"])
+
+    assert shapes == [(2, 3), (2, 1)]
+    assert len(embeddings) == 2
+    assert embeddings[0] == pytest.approx(embeddings[1])
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_inference(mock_model):
+    with patch('src.services.embedding.cache') as mock_cache:
+        mock_cache.get_embedding = AsyncMock(return_value=[0.5] * 384)
+        mock_cache.set_embedding = AsyncMock()
+        service = EmbeddingService()
+
+        embedding = await service.generate_embedding("  Люблю   жим лежа ")
+
+    assert embedding == [0.5] * 384
+    mock_cache.get_embedding.assert_awaited_once_with(model_version(), text_hash("Люблю жим лежа"))
+    mock_model.return_value.encode_batch.assert_not_called()
+    mock_cache.set_embedding.assert_not_called()
+    service.close()
+
+
+@pytest.mark.asyncio
+async def test_cache_miss_stores_embedding(mock_model):
+    with patch('src.services.embedding.cache') as mock_cache:
+        mock_cache.get_embedding = AsyncMock(return_value=None)
+        mock_cache.set_embedding = AsyncMock()
+        service = EmbeddingService()
+
+        embedding = await service.generate_embedding("Люблю жим лежа")
+
+    mock_model.return_value.encode_batch.assert_called_once_with(["Люблю жим лежа"])
+    mock_cache.set_embedding.assert_awaited_once_with(
+        model_version(), text_hash("Люблю жим лежа"), embedding
+    )
+    service.close()
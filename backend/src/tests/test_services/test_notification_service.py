@@ -0,0 +1,188 @@
+import pytest
+from unittest.mock import AsyncMock, patch, MagicMock
+from src.models.outbox import OutboxEvent
+from src.services.notification import NotificationService
+from src.services.telegram import DeliveryResult
+
+
+@pytest.fixture
+def mock_deps():
+    with patch('src.services.notification.UserRepository') as MockUserRepo, \
+         patch('src.services.notification.ProfileRepository') as MockProfileRepo, \
+         patch('src.services.notification.telegram_service') as MockTelegram:
+        
+        mock_user_repo = MockUserRepo.return_value
+        mock_user_repo.get = AsyncMock()
+        mock_user_repo.get_by_ids = AsyncMock(return_value=[])
+        
+        mock_profile_repo = MockProfileRepo.return_value
+        mock_profile_repo.get_by_user_id = AsyncMock()
+        mock_profile_repo.get_by_user_ids = AsyncMock(return_value=[])
+        
+        MockTelegram.notify_new_like = AsyncMock(return_value=DeliveryResult(ok=True, status_code=200))
+        MockTelegram.notify_new_match = AsyncMock(return_value=DeliveryResult(ok=True, status_code=200))
+        MockTelegram.notify_like_digest = AsyncMock(return_value=DeliveryResult(ok=True, status_code=200))
+        MockTelegram.deliver_message = AsyncMock(return_value=DeliveryResult(ok=True, status_code=200))
+        
+        yield {
+            'user': mock_user_repo,
+            'profile': mock_profile_repo,
+            'telegram': MockTelegram,
+        }
+
+
+@pytest.fixture
+def notification_service(session, mock_deps):
+    return NotificationService(session)
+
+
+@pytest.mark.asyncio
+async def test_deliver_like(notification_service, mock_deps):
+    mock_deps['user'].get = AsyncMock(return_value=MagicMock(id=2, telegram_id="222"))
+    
+    result = await notification_service.deliver("like", {"user_id": "2"})
+    
+    assert result.ok
+    mock_deps['user'].get.assert_called_once_with(2)
+    mock_deps['telegram'].notify_new_like.assert_called_once_with(chat_id="222")
+
+
+@pytest.mark.asyncio
+async def test_deliver_like_digest_sends_single_message(notification_service, mock_deps):
+    mock_deps['user'].get = AsyncMock(return_value=MagicMock(id=2, telegram_id="222"))
+    
+    result = await notification_service.deliver("like_digest", {"user_id": 2, "count": 7})
+    
+    assert result.ok
+    mock_deps['telegram'].notify_like_digest.assert_called_once_with(chat_id="222", count=7)
+    mock_deps['telegram'].notify_new_like.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_deliver_like_digest_of_one_is_a_plain_like(notification_service, mock_deps):
+    mock_deps['user'].get = AsyncMock(return_value=MagicMock(id=2, telegram_id="222"))
+    
+    await notification_service.deliver("like_digest", {"user_id": 2, "count": 1})
+    
+    mock_deps['telegram'].notify_new_like.assert_called_once_with(chat_id="222")
+    mock_deps['telegram'].notify_like_digest.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_deliver_match_uses_matched_user_name(notification_service, mock_deps):
+    user = MagicMock(id=1, telegram_id="111")
+    matched = MagicMock(id=2, telegram_id="222", username="gymbro", first_name="Alex")
+    mock_deps['user'].get = AsyncMock(side_effect=[user, matched])
+    
+    result = await notification_service.deliver("match", {"user_id": "1", "matched_user_id": "2"})
+    
+    assert result.ok
+    mock_deps['telegram'].notify_new_match.assert_called_once_with(
+        chat_id="111",
+        matched_username="gymbro",
+        matched_name="Alex"
+    )
+
+
+@pytest.mark.asyncio
+async def test_deliver_like_missing_recipient_is_not_retried(notification_service, mock_deps):
+    mock_deps['user'].get = AsyncMock(return_value=None)
+    
+    result = await notification_service.deliver("like", {"user_id": "2"})
+    
+    assert not result.ok
+    assert not result.retryable
+    mock_deps['telegram'].notify_new_like.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_preload_resolves_recipients_in_one_query(notification_service, mock_deps):
+    mock_deps['user'].get_by_ids = AsyncMock(return_value=[
+        MagicMock(id=1, telegram_id="111"),
+        MagicMock(id=2, telegram_id="222", username="gymbro", first_name="Alex"),
+    ])
+    events = [
+        OutboxEvent(kind="like", payload={"user_id": 1}),
+        OutboxEvent(kind="match", payload={"user_id": 1, "matched_user_id": 2}),
+        OutboxEvent(kind="like", payload={"user_id": 3}),
+    ]
+    
+    await notification_service.preload(events)
+    for event in events:
+        await notification_service.deliver(event.kind, event.payload)
+    
+    mock_deps['user'].get_by_ids.assert_called_once()
+    assert sorted(mock_deps['user'].get_by_ids.call_args.args[0]) == [1, 2, 3]
+    mock_deps['user'].get.assert_not_called()
+    mock_deps['telegram'].notify_new_like.assert_called_once_with(chat_id="111")
+
+
+@pytest.mark.asyncio
+async def test_deliver_report_sends_to_admin(notification_service, mock_deps):
+    mock_profile = MagicMock(
+        name="Test",
+        description="Люблю тренироваться каждый день в зале",
+        gender="male",
+        age=25,
+        media=[]
+    )
+    mock_deps['profile'].get_by_user_id = AsyncMock(return_value=mock_profile)
+    mock_deps['user'].get = AsyncMock(return_value=MagicMock(username="testuser", telegram_id="123"))
+    
+    result = await notification_service.deliver(
+        "report",
+        {"from_user_id": 1, "to_user_id": 2, "report_reason": "Спам"}
+    )
+    
+    assert result.ok
+    mock_deps['telegram'].deliver_message.assert_called_once()
+    assert "Спам" in mock_deps['telegram'].deliver_message.call_args.kwargs["text"]
+
+
+@pytest.mark.asyncio
+async def test_deliver_report_with_media_sends_media_group(notification_service, mock_deps):
+    mock_profile = MagicMock(
+        description="Люблю тренироваться",
+        gender="female",
+        age=23,
+        media=[
+            {"type": "photo", "file_id": "photo-1"},
+            {"type": "video", "file_id": "video-1"},
+        ]
+    )
+    mock_profile.name = "Test"
+    mock_deps['profile'].get_by_user_id = AsyncMock(return_value=mock_profile)
+    mock_deps['user'].get = AsyncMock(return_value=MagicMock(username="testuser", telegram_id="123"))
+    mock_deps['telegram'].send_media_group = AsyncMock(return_value=True)
+    
+    result = await notification_service.deliver(
+        "report",
+        {"from_user_id": 1, "to_user_id": 2, "report_reason": "Спам"}
+    )
+    
+    assert result.ok
+    mock_deps['telegram'].deliver_message.assert_not_called()
+    kwargs = mock_deps['telegram'].send_media_group.call_args.kwargs
+    assert kwargs["media_items"] == [
+        {"type": "photo", "media": "photo-1"},
+        {"type": "video", "media": "video-1"},
+    ]
+    assert "Спам" in kwargs["caption"]
+
+
+@pytest.mark.asyncio
+async def test_programming_errors_in_delivery_are_not_retried():
+    from src.services.broadcast import TokenBucket
+    from src.workers.outbox import send_notifications
+    
+    event = OutboxEvent(id=1, kind="report", payload={}, attempts=1)
+    
+    with patch('src.workers.outbox.async_session_maker', MagicMock()), \
+         patch('src.workers.outbox.NotificationService') as MockService:
+        MockService.return_value.preload = AsyncMock()
+        MockService.return_value.deliver = AsyncMock(side_effect=AttributeError("'dict' object has no attribute 'type'"))
+        
+        results = await send_notifications([event], TokenBucket(1000))
+    
+    assert not results[event.id].ok
+    assert not results[event.id].retryable
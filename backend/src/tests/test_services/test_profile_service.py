@@ -1,8 +1,10 @@
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from src.services.profile import ProfileService
+from src.db.session import run_after_commit
 from src.schemas.profile import ProfileCreate, ProfileUpdate
 from src.models.profile import GenderEnum
+from src.core.config import settings
 from src.core.exceptions.profile import (
     ProfileNotFoundException,
     NoMoreProfilesException,
@@ -17,10 +19,12 @@ def mock_repos():
         
         mock_profile_repo.create = AsyncMock()
         mock_profile_repo.get_by_user_id = AsyncMock()
+        mock_profile_repo.get_embedding_by_user_id = AsyncMock(return_value=None)
         mock_profile_repo.get = AsyncMock()
         mock_profile_repo.update = AsyncMock()
         mock_profile_repo.get_similar_profiles = AsyncMock(return_value=[])
         mock_profile_repo.get_random_profiles = AsyncMock(return_value=[])
+        mock_profile_repo.get_candidates = AsyncMock(return_value=[])
         
         yield {'profile': mock_profile_repo}
 
@@ -61,11 +65,13 @@ async def test_get_profile_not_found(profile_service, mock_repos):
 
 
 @pytest.mark.asyncio
-async def test_create_profile_success(profile_service, mock_repos):
+async def test_create_profile_success(profile_service, mock_repos, session):
     mock_repos['profile'].get_by_user_id = AsyncMock(return_value=None)
     
-    with patch('src.services.profile.embedding_service') as mock_embedding:
+    with patch('src.services.profile.embedding_service') as mock_embedding, \
+         patch('src.services.profile.cache') as mock_cache:
         mock_embedding.generate_embedding = AsyncMock(return_value=[0.1] * 384)
+        mock_cache.invalidate_auth = AsyncMock()
         
         mock_created = MagicMock(id=1, user_id=1, name="Алексей")
         mock_repos['profile'].create = AsyncMock(return_value=mock_created)
@@ -82,6 +88,10 @@ async def test_create_profile_success(profile_service, mock_repos):
         
         assert result == mock_created
         mock_repos['profile'].create.assert_called_once()
+        mock_cache.invalidate_auth.assert_not_called()
+        
+        await run_after_commit(session)
+        mock_cache.invalidate_auth.assert_called_once_with(1)
 
 
 @pytest.mark.asyncio
@@ -128,6 +138,30 @@ async def test_update_profile_success(profile_service, mock_repos):
         mock_repos['profile'].update.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_update_profile_same_description_skips_embedding(profile_service, mock_repos):
+    mock_profile = MagicMock(
+        id=1,
+        user_id=1,
+        description="Люблю тренироваться каждый день",
+        is_active=True
+    )
+    mock_repos['profile'].get_by_user_id = AsyncMock(return_value=mock_profile)
+    mock_repos['profile'].update = AsyncMock(return_value=mock_profile)
+    
+    with patch('src.services.profile.cache') as mock_cache, \
+         patch('src.services.profile.embedding_service') as mock_embedding:
+        mock_cache.invalidate_profile = AsyncMock()
+        mock_embedding.generate_embedding = AsyncMock(return_value=[0.1] * 384)
+        
+        update_data = ProfileUpdate(description="Люблю тренироваться каждый день")
+        
+        await profile_service.update_profile(user_id=1, profile_data=update_data)
+        
+        mock_embedding.generate_embedding.assert_not_called()
+        assert 'embedding' not in mock_repos['profile'].update.call_args.kwargs
+
+
 @pytest.mark.asyncio
 async def test_update_profile_not_found(profile_service, mock_repos):
     mock_repos['profile'].get_by_user_id = AsyncMock(return_value=None)
@@ -141,8 +175,7 @@ async def test_update_profile_not_found(profile_service, mock_repos):
 @pytest.mark.asyncio
 async def test_get_next_profile_from_cache(profile_service, mock_repos):
     with patch('src.services.profile.cache') as mock_cache:
-        mock_cache.pop_from_queue = AsyncMock(return_value=42)
-        mock_cache.get_cached_profile = AsyncMock(return_value={
+        mock_cache.pop_next_profile = AsyncMock(return_value=(42, {
             'id': 42,
             'user_id': 2,
             'name': 'Cached User',
@@ -153,20 +186,21 @@ async def test_get_next_profile_from_cache(profile_service, mock_repos):
             'is_active': True,
             'created_at': '2024-01-01',
             'updated_at': '2024-01-01'
-        })
+        }))
         mock_cache.add_seen_user_id = AsyncMock()
         
         result = await profile_service.get_next_profile(user_id=1)
         
         assert result['name'] == 'Cached User'
-        mock_cache.add_seen_user_id.assert_called_once_with(1, 2)
+        mock_cache.pop_next_profile.assert_called_once_with(1)
+        mock_cache.add_seen_user_id.assert_not_called()
+        mock_repos['profile'].get.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_get_next_profile_from_db_when_cache_miss(profile_service, mock_repos):
     with patch('src.services.profile.cache') as mock_cache:
-        mock_cache.pop_from_queue = AsyncMock(return_value=42)
-        mock_cache.get_cached_profile = AsyncMock(return_value=None)
+        mock_cache.pop_next_profile = AsyncMock(return_value=(42, None))
         
         mock_profile = MagicMock(
             spec=['id', 'user_id', 'name', 'description', 'gender', 'age', 'media', 'is_active', 'created_at', 'updated_at'],
@@ -195,18 +229,13 @@ async def test_get_next_profile_from_db_when_cache_miss(profile_service, mock_re
 @pytest.mark.asyncio
 async def test_get_next_profile_fetches_similar_batch(profile_service, mock_repos):
     with patch('src.services.profile.cache') as mock_cache:
-        mock_cache.pop_from_queue = AsyncMock(return_value=None)
+        mock_cache.pop_next_profile = AsyncMock(return_value=(None, None))
         mock_cache.get_seen_user_ids = AsyncMock(return_value=[])
-        mock_cache.fill_queue = AsyncMock()
-        mock_cache.cache_profile = AsyncMock()
+        mock_cache.get_swipe_stats = AsyncMock(return_value={'rate': 0.0, 'swipes': 0, 'refills': 0})
+        mock_cache.record_refill = AsyncMock(return_value={'rate': 0.0, 'swipes': 1, 'refills': 1})
+        mock_cache.refill_queue = AsyncMock()
         
-        mock_current = MagicMock(
-            spec=['id', 'user_id', 'embedding'],
-            id=1,
-            user_id=1,
-            embedding=[0.1] * 384
-        )
-        mock_repos['profile'].get_by_user_id = AsyncMock(return_value=mock_current)
+        mock_repos['profile'].get_embedding_by_user_id = AsyncMock(return_value=[0.1] * 384)
         
         mock_similar = MagicMock(
             spec=['id', 'user_id', 'name', 'description', 'gender', 'age', 'media', 'is_active', 'created_at', 'updated_at'],
@@ -222,31 +251,25 @@ async def test_get_next_profile_fetches_similar_batch(profile_service, mock_repo
         )
         mock_similar.name = 'Similar User'
 
-        mock_repos['profile'].get_similar_profiles = AsyncMock(return_value=[mock_similar])
+        mock_repos['profile'].get_candidates = AsyncMock(return_value=[mock_similar])
         
         result = await profile_service.get_next_profile(user_id=1)
         
         assert result.name == 'Similar User'
-        mock_cache.fill_queue.assert_called_once()
+        mock_repos['profile'].get_by_user_id.assert_not_called()
+        mock_cache.refill_queue.assert_called_once_with(1, [], shown={'id': 42, 'user_id': 2})
 
 
 @pytest.mark.asyncio
-async def test_get_next_profile_fallback_to_random(profile_service, mock_repos):
+async def test_get_next_profile_explores_without_embedding(profile_service, mock_repos):
     with patch('src.services.profile.cache') as mock_cache:
-        mock_cache.pop_from_queue = AsyncMock(return_value=None)
+        mock_cache.pop_next_profile = AsyncMock(return_value=(None, None))
         mock_cache.get_seen_user_ids = AsyncMock(return_value=[])
-        mock_cache.fill_queue = AsyncMock()
-        mock_cache.cache_profile = AsyncMock()
+        mock_cache.get_swipe_stats = AsyncMock(return_value={'rate': 0.0, 'swipes': 0, 'refills': 0})
+        mock_cache.record_refill = AsyncMock(return_value={'rate': 0.0, 'swipes': 1, 'refills': 1})
+        mock_cache.refill_queue = AsyncMock()
         
-        mock_current = MagicMock(
-            spec=['id', 'user_id', 'embedding'],
-            id=1,
-            user_id=1,
-            embedding=None
-        )
-        mock_repos['profile'].get_by_user_id = AsyncMock(return_value=mock_current)
-        
-        mock_repos['profile'].get_similar_profiles = AsyncMock(return_value=[])
+        mock_repos['profile'].get_embedding_by_user_id = AsyncMock(return_value=None)
         
         mock_random = MagicMock(
             spec=['id', 'user_id', 'name', 'description', 'gender', 'age', 'media', 'is_active', 'created_at', 'updated_at'],
@@ -262,25 +285,27 @@ async def test_get_next_profile_fallback_to_random(profile_service, mock_repos):
         )
         mock_random.name = 'Random User'
 
-        mock_repos['profile'].get_random_profiles = AsyncMock(return_value=[mock_random])
+        mock_repos['profile'].get_candidates = AsyncMock(return_value=[mock_random])
         
         result = await profile_service.get_next_profile(user_id=1)
         
         assert result.name == 'Random User'
-        mock_repos['profile'].get_random_profiles.assert_called_once()
+        mock_repos['profile'].get_candidates.assert_called_once()
+        assert mock_repos['profile'].get_candidates.call_args.kwargs['user_embedding'] is None
+        mock_cache.refill_queue.assert_called_once_with(1, [], shown={'id': 99, 'user_id': 3})
 
 
 @pytest.mark.asyncio
 async def test_get_next_profile_no_more_profiles(profile_service, mock_repos):
     with patch('src.services.profile.cache') as mock_cache:
-        mock_cache.pop_from_queue = AsyncMock(return_value=None)
+        mock_cache.pop_next_profile = AsyncMock(return_value=(None, None))
         mock_cache.get_seen_user_ids = AsyncMock(return_value=[])
+        mock_cache.get_swipe_stats = AsyncMock(return_value={'rate': 0.0, 'swipes': 0, 'refills': 0})
+        mock_cache.record_refill = AsyncMock(return_value={'rate': 0.0, 'swipes': 1, 'refills': 1})
         
-        mock_current = MagicMock(id=1, user_id=1, embedding=None)
-        mock_repos['profile'].get_by_user_id = AsyncMock(return_value=mock_current)
+        mock_repos['profile'].get_embedding_by_user_id = AsyncMock(return_value=None)
         
-        mock_repos['profile'].get_similar_profiles = AsyncMock(return_value=[])
-        mock_repos['profile'].get_random_profiles = AsyncMock(return_value=[])
+        mock_repos['profile'].get_candidates = AsyncMock(return_value=[])
         
         with pytest.raises(NoMoreProfilesException):
             await profile_service.get_next_profile(user_id=1)
@@ -310,3 +335,113 @@ async def test_profile_to_dict(profile_service):
     assert result['gender'] == "female"
     assert result['media'] == [{"type": "photo", "file_id": "abc123"}]
     assert result['is_active'] == True
+
+
+@pytest.mark.asyncio
+async def test_top_up_queue_excludes_queued_profiles(profile_service, mock_repos):
+    with patch('src.services.profile.cache') as mock_cache:
+        mock_cache.get_queue = AsyncMock(return_value=[7, 8])
+        mock_cache.get_seen_user_ids = AsyncMock(return_value=[3])
+        mock_cache.append_queue = AsyncMock()
+        mock_cache.record_refill = AsyncMock(return_value={'rate': 0.0, 'swipes': 1, 'refills': 1})
+        
+        mock_repos['profile'].get_embedding_by_user_id = AsyncMock(return_value=[0.1] * 384)
+        mock_similar = MagicMock(
+            spec=['id', 'user_id', 'name', 'description', 'gender', 'age', 'media', 'is_active', 'created_at', 'updated_at'],
+            id=42,
+            user_id=2,
+            description='Desc',
+            gender=GenderEnum.female,
+            age=23,
+            media=[],
+            is_active=True,
+            created_at='2024-01-01',
+            updated_at='2024-01-02'
+        )
+        mock_similar.name = 'Similar User'
+        mock_repos['profile'].get_candidates = AsyncMock(return_value=[mock_similar])
+        
+        added = await profile_service.top_up_queue(user_id=1, target_size=20)
+        
+        assert added == 1
+        mock_cache.record_refill.assert_called_once_with(1)
+        mock_repos['profile'].get_candidates.assert_called_once_with(
+            user_embedding=[0.1] * 384,
+            seen_user_ids=[3],
+            limit=18,
+            user_id=1,
+            exclude_profile_ids=[7, 8],
+            exploration_ratio=0.2
+        )
+        appended = mock_cache.append_queue.call_args.args[1]
+        assert [p['id'] for p in appended] == [42]
+
+
+@pytest.mark.asyncio
+async def test_top_up_queue_skips_full_queue(profile_service, mock_repos):
+    with patch('src.services.profile.cache') as mock_cache:
+        mock_cache.get_queue = AsyncMock(return_value=[1, 2, 3])
+        mock_cache.append_queue = AsyncMock()
+        
+        added = await profile_service.top_up_queue(user_id=1, target_size=3)
+        
+        assert added == 0
+        mock_repos['profile'].get_embedding_by_user_id.assert_not_called()
+        mock_cache.append_queue.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_top_up_queue_waits_for_a_full_batch(profile_service, mock_repos):
+    with patch('src.services.profile.cache') as mock_cache:
+        mock_cache.get_queue = AsyncMock(return_value=list(range(settings.FEED_LOW_WATERMARK)))
+        mock_cache.append_queue = AsyncMock()
+        
+        added = await profile_service.top_up_queue(
+            user_id=1,
+            target_size=settings.FEED_LOW_WATERMARK + settings.FEED_MIN_TOP_UP - 1
+        )
+        
+        assert added == 0
+        mock_repos['profile'].get_candidates.assert_not_called()
+        mock_cache.append_queue.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_slow_swiper_top_up_covers_a_full_batch(profile_service, mock_repos):
+    with patch('src.services.profile.cache') as mock_cache:
+        mock_cache.get_swipe_stats = AsyncMock(return_value={'rate': 0.0, 'swipes': 10, 'refills': 1})
+        mock_cache.get_queue = AsyncMock(return_value=list(range(settings.FEED_LOW_WATERMARK - 1)))
+        mock_cache.get_seen_user_ids = AsyncMock(return_value=[])
+        mock_cache.record_refill = AsyncMock(return_value={'rate': 0.0, 'swipes': 10, 'refills': 2})
+        mock_cache.append_queue = AsyncMock()
+        mock_repos['profile'].get_embedding_by_user_id = AsyncMock(return_value=None)
+        mock_repos['profile'].get_candidates = AsyncMock(return_value=[])
+        
+        await profile_service.top_up_queue(user_id=1)
+        
+        limit = mock_repos['profile'].get_candidates.call_args.kwargs['limit']
+        assert limit > settings.FEED_MIN_TOP_UP
+
+
+@pytest.mark.asyncio
+async def test_get_next_profile_prefetch_grows_with_swipe_rate(profile_service, mock_repos):
+    with patch('src.services.profile.cache') as mock_cache:
+        mock_cache.pop_next_profile = AsyncMock(return_value=(None, None))
+        mock_cache.get_seen_user_ids = AsyncMock(return_value=[])
+        mock_cache.get_swipe_stats = AsyncMock(return_value={'rate': 0.5, 'swipes': 100, 'refills': 4})
+        mock_cache.record_refill = AsyncMock(return_value={'rate': 0.5, 'swipes': 100, 'refills': 5})
+        mock_cache.refill_queue = AsyncMock()
+        
+        mock_repos['profile'].get_embedding_by_user_id = AsyncMock(return_value=None)
+        with pytest.raises(NoMoreProfilesException):
+            await profile_service.get_next_profile(user_id=1)
+        
+        assert mock_repos['profile'].get_candidates.call_args.kwargs['limit'] == 31
+        mock_cache.record_refill.assert_called_once_with(1)
+
+
+def test_prefetch_size_is_bounded(profile_service):
+    assert profile_service._prefetch_size({'rate': 0.0}) == 15
+    assert profile_service._prefetch_size({'rate': 0.2}) == 15
+    assert profile_service._prefetch_size({'rate': 0.3}) == 18
+    assert profile_service._prefetch_size({'rate': 10.0}) == 50
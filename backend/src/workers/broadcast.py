@@ -0,0 +1,167 @@
+import asyncio
+import signal
+from datetime import timedelta
+from src.core.config import settings
+from src.core.logger import get_worker_logger, init_logging, stop_logging
+from src.db.session import async_session_maker
+from src.models.broadcast import BroadcastJob, BroadcastStatusEnum
+from src.repositories.broadcast import BroadcastJobRepository
+from src.services.admin import AdminService
+from src.services.telegram import telegram_service
+
+logger = get_worker_logger()
+
+
+async def claim_job() -> BroadcastJob | None:
+    async with async_session_maker() as session:
+        job = await BroadcastJobRepository(session).claim_next(
+            stale_after=timedelta(seconds=settings.BROADCAST_STALE_AFTER_SECONDS)
+        )
+        await session.commit()
+        return job
+
+
+async def heartbeat(job_id: int):
+    while True:
+        await asyncio.sleep(settings.BROADCAST_HEARTBEAT_SECONDS)
+        try:
+            async with async_session_maker() as session:
+                await BroadcastJobRepository(session).touch(job_id)
+                await session.commit()
+        except Exception as e:
+            logger.warning(
+                "Broadcast heartbeat failed",
+                extra={
+                    "operation": "heartbeat",
+                    "job_id": job_id,
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                }
+            )
+
+
+async def release_job(job_id: int, error: Exception | None = None):
+    async with async_session_maker() as session:
+        repo = BroadcastJobRepository(session)
+        job = await repo.get(job_id)
+        if job is None:
+            return
+
+        status = BroadcastStatusEnum.pending
+        retry_after = None
+        if error is not None:
+            job.attempts += 1
+            if job.attempts >= settings.BROADCAST_MAX_ATTEMPTS:
+                status = BroadcastStatusEnum.failed
+            retry_after = timedelta(seconds=min(
+                settings.BROADCAST_RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1),
+                settings.BROADCAST_RETRY_BACKOFF_MAX_SECONDS
+            ))
+
+        await repo.finish(
+            job,
+            status,
+            error=f"{type(error).__name__}: {error}" if error else None,
+            retry_after=retry_after
+        )
+        await session.commit()
+
+        logger.warning(
+            "Broadcast job released",
+            extra={
+                "operation": "release_job",
+                "job_id": job_id,
+                "status": status.value,
+                "attempts": job.attempts,
+                "retry_after_seconds": retry_after.total_seconds() if retry_after else None,
+                "last_user_id": job.last_user_id
+            }
+        )
+
+
+async def process_job(job: BroadcastJob):
+    beat = asyncio.create_task(heartbeat(job.id))
+
+    try:
+        async with async_session_maker() as session:
+            job = await BroadcastJobRepository(session).get(job.id)
+            await AdminService(session).run_broadcast_job(job, on_checkpoint=session.commit)
+    except asyncio.CancelledError:
+        await asyncio.shield(release_job(job.id))
+        raise
+    except Exception as e:
+        try:
+            await release_job(job.id, e)
+        except Exception as release_error:
+            logger.error(
+                "Failed to release broadcast job",
+                extra={
+                    "operation": "process_job",
+                    "job_id": job.id,
+                    "error_type": type(release_error).__name__,
+                    "error": str(release_error)
+                },
+                exc_info=True
+            )
+    finally:
+        beat.cancel()
+
+
+async def run_worker(stop: asyncio.Event):
+    logger.info("Broadcast worker started", extra={"operation": "run_worker"})
+
+    while not stop.is_set():
+        try:
+            job = await claim_job()
+        except Exception as e:
+            logger.error(
+                "Failed to poll broadcast jobs",
+                extra={
+                    "operation": "run_worker",
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            job = None
+
+        if job is None:
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=settings.BROADCAST_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            continue
+
+        task = asyncio.create_task(process_job(job))
+        stopping = asyncio.create_task(stop.wait())
+        await asyncio.wait({task, stopping}, return_when=asyncio.FIRST_COMPLETED)
+        stopping.cancel()
+
+        if not task.done():
+            logger.info(
+                "Stopping mid-broadcast, job will resume from its last checkpoint",
+                extra={"operation": "run_worker", "job_id": job.id}
+            )
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    logger.info("Broadcast worker stopped", extra={"operation": "run_worker"})
+
+
+async def main():
+    init_logging()
+    stop = asyncio.Event()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        await run_worker(stop)
+    finally:
+        await telegram_service.close()
+        stop_logging()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
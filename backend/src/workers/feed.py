@@ -0,0 +1,174 @@
+import asyncio
+import os
+import signal
+import socket
+import time
+from typing import List, Tuple
+from src.core.config import settings
+from src.core.logger import get_worker_logger, init_logging, stop_logging
+from src.db.session import async_session_maker
+from src.services.cache import cache
+from src.services.profile import ProfileService
+
+logger = get_worker_logger()
+
+CONSUMER_NAME = f"{socket.gethostname()}-{os.getpid()}"
+
+
+def prioritize(events: List[Tuple[str, dict]]) -> List[int]:
+    latest = {}
+    for event_id, fields in events:
+        if not fields or 'user_id' not in fields:
+            continue
+        latest[int(fields['user_id'])] = (
+            int(fields.get('remaining', 0)),
+            -int(event_id.split('-')[0])
+        )
+
+    return sorted(latest, key=latest.get)
+
+
+async def top_up(user_id: int) -> int:
+    async with async_session_maker() as session:
+        return await ProfileService(session).top_up_queue(user_id)
+
+
+async def top_up_many(user_ids: List[int], semaphore: asyncio.Semaphore) -> int:
+    async def one(user_id: int) -> int:
+        async with semaphore:
+            try:
+                return await top_up(user_id)
+            except Exception as e:
+                logger.warning(
+                    "Feed top-up failed",
+                    extra={
+                        "operation": "top_up_many",
+                        "user_id": user_id,
+                        "error_type": type(e).__name__,
+                        "error": str(e)
+                    }
+                )
+                return 0
+
+    return sum(await asyncio.gather(*(one(user_id) for user_id in user_ids)))
+
+
+async def consume_events(stop: asyncio.Event, semaphore: asyncio.Semaphore):
+    group = settings.FEED_CONSUMER_GROUP
+    await cache.ensure_group(cache.SWIPE_EVENTS_KEY, group)
+    pending = True
+
+    while not stop.is_set():
+        try:
+            events = await cache.read_group(
+                cache.SWIPE_EVENTS_KEY,
+                group,
+                CONSUMER_NAME,
+                count=settings.FEED_READ_COUNT,
+                block_ms=settings.FEED_BLOCK_MS,
+                pending=pending
+            )
+
+            if not events:
+                pending = False
+                continue
+
+            user_ids = prioritize(events)
+            added = await top_up_many(user_ids, semaphore)
+            await cache.ack(cache.SWIPE_EVENTS_KEY, group, [event_id for event_id, _ in events])
+
+            logger.debug(
+                "Processed swipe events",
+                extra={
+                    "operation": "consume_events",
+                    "events": len(events),
+                    "users": len(user_ids),
+                    "profiles_added": added
+                }
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to process swipe events",
+                extra={
+                    "operation": "consume_events",
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            await asyncio.sleep(1)
+
+
+async def sweep_active_users(stop: asyncio.Event, semaphore: asyncio.Semaphore):
+    while not stop.is_set():
+        try:
+            user_ids = await cache.get_recently_active_user_ids(
+                since=time.time() - settings.FEED_ACTIVE_WINDOW_SECONDS,
+                limit=settings.FEED_SWEEP_LIMIT
+            )
+            lengths = await cache.get_queue_lengths(user_ids)
+            due = [
+                user_id for user_id, length in zip(user_ids, lengths)
+                if length < settings.FEED_LOW_WATERMARK
+            ]
+
+            if due:
+                added = await top_up_many(due, semaphore)
+                logger.info(
+                    "Topped up feeds of recently active users",
+                    extra={
+                        "operation": "sweep_active_users",
+                        "active_users": len(user_ids),
+                        "due_users": len(due),
+                        "profiles_added": added
+                    }
+                )
+        except Exception as e:
+            logger.error(
+                "Failed to sweep active users",
+                extra={
+                    "operation": "sweep_active_users",
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=settings.FEED_SWEEP_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run_worker(stop: asyncio.Event):
+    logger.info(
+        "Feed builder started",
+        extra={"operation": "run_worker", "consumer": CONSUMER_NAME}
+    )
+
+    semaphore = asyncio.Semaphore(settings.FEED_CONCURRENCY)
+    await asyncio.gather(
+        consume_events(stop, semaphore),
+        sweep_active_users(stop, semaphore)
+    )
+
+    logger.info("Feed builder stopped", extra={"operation": "run_worker"})
+
+
+async def main():
+    init_logging()
+    stop = asyncio.Event()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        await run_worker(stop)
+    finally:
+        await cache.close()
+        stop_logging()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,238 @@
+import asyncio
+import signal
+from datetime import timedelta
+from typing import Dict, List
+from src.core.config import settings
+from src.core.logger import get_worker_logger, init_logging, stop_logging
+from src.db.session import async_session_maker
+from src.models.outbox import OutboxEvent, OutboxKindEnum
+from src.repositories.outbox import OutboxRepository
+from src.services.broadcast import TokenBucket
+from src.services.cache import cache
+from src.services.notification import NotificationService
+from src.services.telegram import DeliveryResult, telegram_service
+
+logger = get_worker_logger()
+
+NON_RETRYABLE_ERRORS = (AttributeError, KeyError, TypeError, ValueError)
+
+
+async def claim_batch() -> List[OutboxEvent]:
+    async with async_session_maker() as session:
+        events = await OutboxRepository(session).claim_batch(
+            settings.OUTBOX_BATCH_SIZE,
+            lease=timedelta(seconds=settings.OUTBOX_LEASE_SECONDS)
+        )
+        await session.commit()
+        return events
+
+
+async def apply_seen(events: List[OutboxEvent]) -> Dict[int, DeliveryResult]:
+    if not events:
+        return {}
+
+    try:
+        await cache.add_seen_pairs([
+            (int(event.payload["user_id"]), int(event.payload["seen_user_id"]))
+            for event in events
+        ])
+        result = DeliveryResult(ok=True)
+    except Exception as e:
+        result = DeliveryResult(ok=False, error=str(e), transient=True)
+
+    return {event.id: result for event in events}
+
+
+async def coalesce_likes(events: List[OutboxEvent]) -> Dict[int, DeliveryResult]:
+    send_now = await asyncio.gather(*(
+        cache.coalesce_like(int(event.payload["user_id"]), event.id) for event in events
+    ))
+    return {
+        event.id: DeliveryResult(ok=True)
+        for event, send in zip(events, send_now) if not send
+    }
+
+
+async def schedule_like_digests() -> int:
+    digests = await cache.claim_due_like_digests(
+        settings.NOTIFICATION_DIGEST_BATCH_SIZE,
+        lease=settings.OUTBOX_LEASE_SECONDS
+    )
+    if not digests:
+        return 0
+
+    async with async_session_maker() as session:
+        repo = OutboxRepository(session)
+        for user_id, count in digests:
+            repo.add(OutboxKindEnum.like_digest, user_id=user_id, count=count)
+        await session.commit()
+
+    await cache.ack_like_digests(digests)
+
+    logger.debug(
+        "Like digests scheduled",
+        extra={
+            "operation": "schedule_like_digests",
+            "count": len(digests),
+            "likes": sum(count for _, count in digests)
+        }
+    )
+    return len(digests)
+
+
+async def send_notifications(events: List[OutboxEvent], bucket: TokenBucket) -> Dict[int, DeliveryResult]:
+    if not events:
+        return {}
+
+    semaphore = asyncio.Semaphore(settings.NOTIFICATION_CONCURRENCY)
+
+    async with async_session_maker() as session:
+        service = NotificationService(session)
+        await service.preload(events)
+
+        async def send(event: OutboxEvent):
+            async with semaphore:
+                await bucket.acquire()
+                try:
+                    result = await service.deliver(event.kind, event.payload)
+                except Exception as e:
+                    logger.error(
+                        "Notification delivery raised",
+                        extra={
+                            "operation": "send_notifications",
+                            "event_id": event.id,
+                            "kind": event.kind,
+                            "error_type": type(e).__name__,
+                            "error": str(e)
+                        },
+                        exc_info=True
+                    )
+                    result = DeliveryResult(
+                        ok=False,
+                        error=str(e),
+                        transient=not isinstance(e, NON_RETRYABLE_ERRORS)
+                    )
+
+                if result.retry_after is not None:
+                    bucket.drain(result.retry_after)
+                return event.id, result
+
+        return dict(await asyncio.gather(*(send(event) for event in events)))
+
+
+async def settle(events: List[OutboxEvent], results: Dict[int, DeliveryResult]):
+    done, retried, dropped = [], 0, 0
+
+    async with async_session_maker() as session:
+        repo = OutboxRepository(session)
+
+        for event in events:
+            result = results[event.id]
+            if result.ok:
+                done.append(event.id)
+                continue
+
+            if result.retryable and event.attempts < settings.OUTBOX_MAX_ATTEMPTS:
+                delay = result.retry_after if result.retry_after is not None else min(2 ** event.attempts, 60)
+                await repo.reschedule(event.id, delay, error=result.error)
+                retried += 1
+                continue
+
+            logger.error(
+                "Outbox event dropped",
+                extra={
+                    "operation": "settle",
+                    "event_id": event.id,
+                    "kind": event.kind,
+                    "attempts": event.attempts,
+                    "status_code": result.status_code,
+                    "blocked": result.blocked,
+                    "error": result.error
+                }
+            )
+            done.append(event.id)
+            dropped += 1
+
+        await repo.complete(done)
+        await session.commit()
+
+    logger.debug(
+        "Outbox batch settled",
+        extra={
+            "operation": "settle",
+            "count": len(events),
+            "completed": len(done) - dropped,
+            "retried": retried,
+            "dropped": dropped
+        }
+    )
+
+
+async def dispatch_batch(bucket: TokenBucket) -> int:
+    events = await claim_batch()
+    if not events:
+        return 0
+
+    seen = [event for event in events if event.kind == OutboxKindEnum.seen.value]
+    results = await apply_seen(seen)
+
+    results.update(await coalesce_likes(
+        [event for event in events if event.kind == OutboxKindEnum.like.value]
+    ))
+    notifications = [
+        event for event in events
+        if event.kind != OutboxKindEnum.seen.value and event.id not in results
+    ]
+    results.update(await send_notifications(notifications, bucket))
+
+    await settle(events, results)
+    return len(events)
+
+
+async def run_worker(stop: asyncio.Event):
+    bucket = TokenBucket(settings.NOTIFICATION_RATE_PER_SECOND)
+    logger.info("Outbox dispatcher started", extra={"operation": "run_worker"})
+
+    while not stop.is_set():
+        try:
+            await schedule_like_digests()
+            dispatched = await dispatch_batch(bucket)
+        except Exception as e:
+            logger.error(
+                "Failed to dispatch outbox batch",
+                extra={
+                    "operation": "run_worker",
+                    "error_type": type(e).__name__,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            dispatched = 0
+
+        if dispatched < settings.OUTBOX_BATCH_SIZE:
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=settings.OUTBOX_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+    logger.info("Outbox dispatcher stopped", extra={"operation": "run_worker"})
+
+
+async def main():
+    init_logging()
+    stop = asyncio.Event()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        await run_worker(stop)
+    finally:
+        await telegram_service.close()
+        await cache.close()
+        stop_logging()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())